@@ -0,0 +1,376 @@
+# Bancs d'essai
+"""Mesures de performances des traitements de fqapy.
+Usage : python3 -m fqapy.banc_essai
+"""
+
+import array
+import itertools
+import operator
+import os
+import pickle
+import tempfile
+import timeit
+import tracemalloc
+
+from . import calendar
+from . import calendrier
+from . import fqa
+from . import outils
+
+
+def _mesure(instruction, nombre=1, repetition=3):
+    # Meilleure durée (en secondes) d'une exécution de l'instruction.
+    return min(timeit.repeat(instruction, number=nombre, repeat=repetition)) / nombre
+
+
+def banc_fqa_lot(taille=1000000):
+    """Fqa.evaluer_lot et Fqa.divfqa_lot comparées aux appels répétés de Fqa.__call__ et Fqa.divfqa."""
+    f_ = fqa.Fqa(1461, 4, 6884472)
+    xs = array.array('l', range(-taille // 2, taille - taille // 2))
+    ns = f_.evaluer_lot(xs)
+    t_appel = _mesure(lambda: [f_(x) for x in xs])
+    t_lot = _mesure(lambda: f_.evaluer_lot(xs))
+    print("Fqa.__call__ x {} : {:.3f} s, Fqa.evaluer_lot ({}) : {:.3f} s, gain x{:.1f}".format(
+        taille, t_appel, "NumPy" if outils.numpy is not None else "array", t_lot, t_appel / t_lot))
+    t_appel = _mesure(lambda: [f_.divfqa(n) for n in ns])
+    t_lot = _mesure(lambda: f_.divfqa_lot(ns))
+    print("Fqa.divfqa x {} : {:.3f} s, Fqa.divfqa_lot : {:.3f} s, gain x{:.1f}".format(
+        taille, t_appel, t_lot, t_appel / t_lot))
+
+
+def banc_fqa_parcourir(taille=1000000):
+    """Fqa.parcourir et Fqa.tabuler comparées aux appels répétés de Fqa.__call__ sur un intervalle."""
+    f_ = fqa.Fqa(146097, 4, 6884480)
+    x0, x1 = -taille // 2, taille - taille // 2 - 1
+    t_appel = _mesure(lambda: [(x, f_(x)) for x in range(x0, x1 + 1)], repetition=1)
+    t_parcours = _mesure(lambda: list(f_.parcourir(x0, x1)), repetition=1)
+    t_table = _mesure(lambda: f_.tabuler(x0, x1), repetition=1)
+    print("Fqa.__call__ x {} : {:.3f} s, Fqa.parcourir : {:.3f} s (x{:.1f}), "
+          "Fqa.tabuler : {:.3f} s (x{:.1f})".format(taille, t_appel, t_parcours, t_appel / t_parcours, t_table, t_appel / t_table))
+
+
+def banc_base_lot(taille=1000000):
+    """Base.inv_lot et Base.evaluer_lot comparées aux appels répétés de Base.inv et Base.__call__."""
+    base = calendrier.CALENDRIER_GRE
+    ns = array.array('l', range(2451545 - taille // 2, 2451545 + taille - taille // 2))
+    colonnes = base.inv_lot(ns)
+    t_appel = _mesure(lambda: [base.inv(n) for n in ns], repetition=1)
+    t_lot = _mesure(lambda: base.inv_lot(ns), repetition=1)
+    print("Base.inv x {} : {:.3f} s, Base.inv_lot ({}) : {:.3f} s, gain x{:.1f}".format(
+        taille, t_appel, "NumPy" if outils.numpy is not None else "array", t_lot, t_appel / t_lot))
+    lignes = [list(v) for v in zip(*colonnes)]
+    t_appel = _mesure(lambda: [base(v) for v in lignes], repetition=1)
+    t_lot = _mesure(lambda: base.evaluer_lot(colonnes), repetition=1)
+    print("Base.__call__ x {} : {:.3f} s, Base.evaluer_lot : {:.3f} s, gain x{:.1f}".format(
+        taille, t_appel, t_lot, t_appel / t_lot))
+
+
+def banc_calendrier_lot(taille=1000000):
+    """Calendrier.date_lot et Calendrier.date_vers_jj_lot comparées aux appels répétés de date et date_vers_jj."""
+    cal = calendrier.CALENDRIER_GRE
+    ns = array.array('l', range(2451545 - taille // 2, 2451545 + taille - taille // 2))
+    t_appel = _mesure(lambda: [cal.date(calendrier.JourJulien(n)) for n in ns], repetition=1)
+    t_lot = _mesure(lambda: cal.date_lot(ns), repetition=1)
+    print("Calendrier.date x {} : {:.3f} s, Calendrier.date_lot ({}) : {:.3f} s, gain x{:.1f}".format(
+        taille, t_appel, "NumPy" if outils.numpy is not None else "array", t_lot, t_appel / t_lot))
+    u_, v_, w_, t_ = cal.date_lot(ns)
+    dates = [calendrier.Date(cal, u, v, w) for u, v, w in zip(u_, v_, w_)]
+    t_appel = _mesure(lambda: [d() for d in dates], repetition=1)
+    t_lot = _mesure(lambda: cal.date_vers_jj_lot(u_, v_, w_, t_), repetition=1)
+    print("Calendrier.date_vers_jj x {} : {:.3f} s, Calendrier.date_vers_jj_lot : {:.3f} s, gain x{:.1f}".format(
+        taille, t_appel, t_lot, t_appel / t_lot))
+
+
+def banc_convertir(nombre=100000):
+    """calendrier.convertir et convertir_lot comparées au passage par Date et Jour julien (julien vers grégorien)."""
+    jul, gre = calendrier.CALENDRIER_JUL, calendrier.CALENDRIER_GRE
+    u_, v_, w_ = jul.date_lot(array.array('l', range(2451545, 2451545 + nombre)))[:3]
+    dates = list(zip(u_, v_, w_))
+    t_date = _mesure(lambda: [gre.date(jul.date_vers_jj(calendrier.Date(jul, u, v, w))) for u, v, w in dates])
+    t_conv = _mesure(lambda: [calendrier.convertir(jul, gre, u, v, w) for u, v, w in dates])
+    t_lot = _mesure(lambda: calendrier.convertir_lot(jul, gre, u_, v_, w_))
+    print("Date x {} : {:.3f} s, convertir : {:.3f} s (x{:.1f}), convertir_lot ({}) : {:.3f} s (x{:.1f})".format(
+        nombre, t_date, t_conv, t_date / t_conv, "NumPy" if outils.numpy is not None else "array", t_lot,
+        t_date / t_lot))
+
+
+def banc_instant(nombre=100000):
+    """Instant (entiers) comparé au Jour julien (fraction flottante) : additions et comparaisons."""
+    jj_, i_ = calendrier.JourJulien(2451545, 0.25), calendrier.Instant(2451545, calendrier.NS_JOUR // 4)
+    pas_jj, pas_i = 1.25, calendrier.nanosecondes(1.25)
+    t_jj = _mesure(lambda: [jj_ + pas_jj == jj_ for _ in range(nombre)])
+    t_i = _mesure(lambda: [calendrier.Instant(i_.n, i_.ns + pas_i) == i_ for _ in range(nombre)])
+    print("JourJulien + et == x {} : {:.3f} s, Instant : {:.3f} s, gain x{:.1f}".format(
+        nombre, t_jj, t_i, t_jj / t_i))
+
+
+def banc_cycle(nombre=100000):
+    """Lecture des tables des cycles (Calendrier.date_cycle, calendar.tabulated_*_from_fixed) comparée aux calculs."""
+    jours = [calendrier.JourJulien(n) for n in range(2451545, 2451545 + nombre)]
+    for cal in (calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_JUL):
+        t_table = _mesure(lambda: cal.date_cycle(jours[0]), repetition=1)
+        t_fqa = _mesure(lambda: [cal.date(jj_) for jj_ in jours])
+        t_cycle = _mesure(lambda: [cal.date_cycle(jj_) for jj_ in jours])
+        print("{} : construction {:.3f} s, {} octets ; date x {} : {:.3f} s, date_cycle : {:.3f} s, gain x{:.1f}".format(
+            cal, t_table, cal._table_cycle().octets(), nombre, t_fqa, t_cycle, t_fqa / t_cycle))
+    fixes = range(730000, 730000 + nombre)
+    for nom, calcul, table in (("gregorian", calendar.gregorian_from_fixed, calendar.tabulated_gregorian_from_fixed),
+                               ("julian", calendar.julian_from_fixed, calendar.tabulated_julian_from_fixed)):
+        table(fixes[0])
+        t_calcul = _mesure(lambda: [calcul(d) for d in fixes])
+        t_table = _mesure(lambda: [table(d) for d in fixes])
+        print("{}_from_fixed x {} : {:.3f} s, tabulated_{}_from_fixed : {:.3f} s, gain x{:.1f}".format(
+            nom, nombre, t_calcul, nom, t_table, t_calcul / t_table))
+
+
+def banc_direct(nombre=100000):
+    """calendar.direct_*_from_fixed (une seule passe) comparées à gregorian_from_fixed, julian_from_fixed
+    et iso_from_fixed."""
+    fixes = range(730000, 730000 + nombre)
+    for nom in ("gregorian", "julian", "iso"):
+        calcul, direct = getattr(calendar, nom + "_from_fixed"), getattr(calendar, "direct_" + nom + "_from_fixed")
+        t_calcul = _mesure(lambda: [calcul(d) for d in fixes])
+        t_direct = _mesure(lambda: [direct(d) for d in fixes])
+        print("{}_from_fixed x {} : {:.3f} s, direct_{}_from_fixed : {:.3f} s, gain x{:.1f}".format(
+            nom, nombre, t_calcul, nom, t_direct, t_calcul / t_direct))
+
+
+def banc_calendar_lot(taille=1000000):
+    """Fonctions *_lot de calendar comparées aux appels répétés des fonctions ligne par ligne."""
+    dates = array.array('l', range(730000, 730000 + taille))
+    for nom in ("gregorian", "iso", "ethiopic"):
+        depuis, depuis_lot = getattr(calendar, nom + "_from_fixed"), getattr(calendar, nom + "_from_fixed_lot")
+        t_appel = _mesure(lambda: [depuis(d) for d in dates], repetition=1)
+        t_lot = _mesure(lambda: depuis_lot(dates), repetition=1)
+        print("{}_from_fixed x {} : {:.3f} s, {}_from_fixed_lot ({}) : {:.3f} s, gain x{:.1f}".format(
+            nom, taille, t_appel, nom, "NumPy" if outils.numpy is not None else "array", t_lot, t_appel / t_lot))
+
+
+def banc_holidays(premiere=1600, derniere=2600, nombre=100000):
+    """calendar.Holidays comparé aux appels des fonctions de calendar pour chaque jour."""
+    noms = calendar.HOLIDAY_NAMES
+    t_appel = _mesure(lambda: [getattr(calendar, nom)(y) for y in range(premiere, derniere + 1) for nom in noms],
+                      repetition=1)
+    t_lot = _mesure(lambda: calendar.Holidays(premiere, derniere), repetition=1)
+    print("Fêtes des années {} à {} : fonctions {:.3f} s, Holidays ({}) : {:.3f} s, gain x{:.1f}".format(
+        premiere, derniere, t_appel, "NumPy" if outils.numpy is not None else "array", t_lot, t_appel / t_lot))
+    h = calendar.Holidays(premiere, derniere)
+    jours = range(2451545, 2451545 + nombre)
+    t_appel = _mesure(lambda: [d for d in jours[:nombre // 100]
+                               if d in {int(getattr(calendar, nom)(calendar.gregorian_year_from_fixed(d)))
+                                        for nom in noms[:8]}], repetition=1) * 100
+    t_index = _mesure(lambda: [h.is_holiday(d) for d in jours], repetition=1)
+    print("Jour férié ? x {} : fonctions {:.3f} s (estimé), Holidays.is_holiday {:.3f} s, gain x{:.1f}".format(
+        nombre, t_appel, t_index, t_appel / t_index))
+
+
+def banc_index(annees=20000, nombre=100000):
+    """Index des jours projeté en mémoire (IndexJours) comparé aux calculs du calendrier grégorien."""
+    gre = calendrier.CALENDRIER_GRE
+    debut, fin = calendrier.Date(gre, 2000 - annees, 1, 1)().n, calendrier.Date(gre, 2001 + annees, 1, 1)().n
+    descripteur, fichier = tempfile.mkstemp()
+    os.close(descripteur)
+    try:
+        t_ecriture = _mesure(lambda: calendrier.ecrire_index(fichier, debut, fin), repetition=1)
+        jours = [calendrier.JourJulien(n) for n in range(debut, fin, (fin - debut) // nombre)]
+        with calendrier.IndexJours(fichier) as index:
+            t_date = _mesure(lambda: [gre.date(jj_) for jj_ in jours])
+            t_index = _mesure(lambda: [index.date(gre, jj_) for jj_ in jours])
+            t_enr = _mesure(lambda: [index.enregistrement(jj_.n) for jj_ in jours])
+        print("Index de {} jours : {} octets écrits en {:.3f} s ; date x {} : {:.3f} s, IndexJours.date : {:.3f} s, "
+              "IndexJours.enregistrement : {:.3f} s".format(fin - debut, os.path.getsize(fichier), t_ecriture,
+                                                             len(jours), t_date, t_index, t_enr))
+    finally:
+        os.remove(fichier)
+
+
+def banc_base_compiler(nombre=100000):
+    """Fonctions engendrées par Base.compiler comparées à Base.__call__ et Base.inv pour chaque calendrier."""
+    for base in [calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_JUL, calendrier.CALENDRIER_ISL]:
+        directe, inverse = base.compiler()
+        v_ = base.inv(2451545)
+        t_inv = _mesure(lambda: base.inv(2451545), nombre)
+        t_inverse = _mesure(lambda: inverse(2451545), nombre)
+        t_appel = _mesure(lambda: base(v_), nombre)
+        t_directe = _mesure(lambda: directe(*v_), nombre)
+        print("{} : Base.inv {:.2f} µs, inverse {:.2f} µs (x{:.1f}), Base.__call__ {:.2f} µs, "
+              "directe {:.2f} µs (x{:.1f})".format(base, 1e6 * t_inv, 1e6 * t_inverse, t_inv / t_inverse,
+                                                   1e6 * t_appel, 1e6 * t_directe, t_appel / t_directe))
+
+
+def banc_base_tables(nombre=100000):
+    """Base.__call__ et Base.inv avec et sans tables (voir Base.tabuler), taille des tables de chaque calendrier."""
+    for simple in [calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_JUL, calendrier.CALENDRIER_ISL]:
+        base = fqa.Base(list(simple))
+        base.tabuler()
+        v_ = base.inv(2451545)
+        t_inv = _mesure(lambda: simple.inv(2451545), nombre)
+        t_table = _mesure(lambda: base.inv(2451545), nombre)
+        t_appel = _mesure(lambda: simple(v_), nombre)
+        t_directe = _mesure(lambda: base(v_), nombre)
+        print("{} : tables {} octets, Base.inv {:.2f} µs -> {:.2f} µs (x{:.1f}), "
+              "Base.__call__ {:.2f} µs -> {:.2f} µs (x{:.1f})".format(
+                simple, base.empreinte_tables(), 1e6 * t_inv, 1e6 * t_table, t_inv / t_table,
+                1e6 * t_appel, 1e6 * t_directe, t_appel / t_directe))
+
+
+def banc_representation(nombre=100000):
+    """Representation += 1 (propagation des retenues) comparée à l'aller-retour par Base.__call__ et Base.inv,
+    pour une base dont les étages ne sont pas emboîtés (calendrier grégorien) puis pour une base emboîtée.
+    """
+    for nom, base, n_ in [("GRE", fqa.Base(list(calendrier.CALENDRIER_GRE)), 2451545),
+                          ("TEMPS", fqa.Base(list(fqa.BASE_TEMPS)), 2451545 * 86400)]:
+
+        def retenues():
+            r_ = fqa.Representation(base, base.inv(n_))
+            for _ in range(nombre):
+                r_ += 1
+
+        def aller_retour():
+            r_ = fqa.Representation(base, base.inv(n_))
+            for _ in range(nombre):
+                r_.liste_entiers = array.array('l', base.inv(r_() + 1))
+
+        t_retenues = _mesure(retenues, repetition=1)
+        t_aller_retour = _mesure(aller_retour, repetition=1)
+        print("Representation {} aller-retour x {} : {:.3f} s, += 1 : {:.3f} s, gain x{:.1f}".format(
+            nom, nombre, t_aller_retour, t_retenues, t_aller_retour / t_retenues))
+
+
+def banc_representation_array(nombre=100000):
+    """Mémoire occupée par représentation : liste de Representation et RepresentationArray."""
+    base = calendrier.CALENDRIER_GRE
+    ns = array.array('l', range(2451545, 2451545 + nombre))
+    colonnes = base.inv_lot(ns)
+    lignes = [list(v) for v in zip(*colonnes)]
+    for nom, fabrique in [("Representation", lambda: [fqa.Representation(base, v) for v in lignes]),
+                          ("RepresentationArray", lambda: fqa.RepresentationArray(base, colonnes))]:
+        tracemalloc.start()
+        avant, _ = tracemalloc.get_traced_memory()
+        t_ = fabrique()
+        apres, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("{} : {:.1f} octets par représentation".format(nom, (apres - avant) / nombre))
+        del t_
+
+
+def banc_serialiser(nombre=100000):
+    """fqa.serialiser et fqa.deserialiser comparées à repr et eval (formes quasi affines) et à pickle."""
+    tf = [fqa.Fqa(i, 4 + i % 7, -i) for i in range(nombre)]
+    texte = repr(tf)
+    octets = fqa.serialiser(tf)
+    t_eval = _mesure(lambda: eval(texte, {"Fqa": fqa.Fqa}), repetition=1)
+    t_pickle = _mesure(lambda: pickle.loads(pickle.dumps(tf)), repetition=1)
+    t_binaire = _mesure(lambda: fqa.deserialiser(fqa.serialiser(tf)), repetition=1)
+    print("{} Fqa : eval(repr) {:.3f} s ({} octets), pickle {:.3f} s ({} octets), "
+          "serialiser {:.3f} s ({} octets)".format(nombre, t_eval, len(texte), t_pickle, len(pickle.dumps(tf)),
+                                                   t_binaire, len(octets)))
+    base = calendrier.CALENDRIER_GRE
+    t_base = _mesure(lambda: fqa.deserialiser(fqa.serialiser(base, nommee=False)), 1000)
+    t_nom = _mesure(lambda: pickle.loads(pickle.dumps(base)), 1000)
+    print("CALENDRIER_GRE : serialiser et deserialiser {:.1f} µs, pickle (par son nom) {:.1f} µs ({} octets)".format(
+        1e6 * t_base, 1e6 * t_nom, len(pickle.dumps(base))))
+
+
+def _codes(f_, taille):
+    # Tableau des codes f(x+1) - f(x) pour 0 <= x < taille.
+    y_ = f_.tabuler(0, taille)
+    return array.array('l', map(operator.sub, y_[1:], y_))
+
+
+def banc_reconnaissance(tailles=(100000, 1000000, 10000000)):
+    """Débit de fqa.reconnaissance sur de longues suites de codes."""
+    for taille in tailles:
+        for f_ in [fqa.Fqa(1461, 4, 0), fqa.Fqa(10631, 30, 26), fqa.Fqa(2 ** 20 + 7, 2 ** 19 + 1, 5)]:
+            c_ = _codes(f_, taille)
+            t_ = _mesure(lambda: fqa.reconnaissance(c_), repetition=1)
+            print("reconnaissance {} x {} codes : {:.3f} s, {:.2f} millions de codes par seconde".format(
+                f_, taille, t_, taille / t_ / 1e6))
+
+
+def banc_reconnaissance_plages(taille=10000000):
+    """fqa.reconnaissance sur des codes codés par plages comparée à la reconnaissance des codes développés."""
+    for f_ in [fqa.Fqa(1461, 4, 0), fqa.Fqa(100001, 100000, 7)]:
+        c_ = _codes(f_, taille)
+        p_ = [(v, len(list(g))) for v, g in itertools.groupby(c_)]
+        t_codes = _mesure(lambda: fqa.reconnaissance(c_), repetition=1)
+        t_plages = _mesure(lambda: fqa.reconnaissance(p_, plages=True), repetition=1)
+        print("reconnaissance {} x {} codes : {:.3f} s, {} plages : {:.3f} s, gain x{:.1f}".format(
+            f_, taille, t_codes, len(p_), t_plages, t_codes / t_plages))
+
+
+def banc_codes_lot(nombre=200000, workers=None):
+    """fqa.codes_lot réparti entre plusieurs processus comparé aux appels répétés de fqa.codes."""
+    f_ = fqa.Fqa(10631, 30, 26)
+    c_ = _codes(f_, 64)
+    sequences = [c_[i % 32:i % 32 + 24] for i in range(nombre)]
+    workers = workers or os.cpu_count() or 1
+    t_codes = _mesure(lambda: [fqa.codes(s_) for s_ in sequences], repetition=1)
+    t_lot = _mesure(lambda: fqa.codes_lot(sequences, workers=workers), repetition=1)
+    print("fqa.codes x {} : {:.3f} s, fqa.codes_lot ({} processus) : {:.3f} s, gain x{:.1f}".format(
+        nombre, t_codes, workers, t_lot, t_codes / t_lot))
+
+
+def banc_reconnaissance_incrementale(taille=2000):
+    """ReconnaissanceIncrementale comparée aux appels répétés de fqa.codes sur une liste croissante."""
+    c_ = _codes(fqa.Fqa(10631, 30, 26), taille)
+    t_codes = _mesure(lambda: [fqa.codes(c_[:i + 1]) for i in range(taille)], repetition=1)
+
+    def incrementale():
+        r_ = fqa.ReconnaissanceIncrementale()
+        return [r_.fqa() for c in c_ if r_.ajouter(c)]
+
+    t_inc = _mesure(incrementale, repetition=1)
+    print("fqa.codes x {} préfixes : {:.3f} s, ReconnaissanceIncrementale : {:.3f} s, gain x{:.1f}".format(
+        taille, t_codes, t_inc, t_codes / t_inc))
+
+
+def _octets_par_instance(fabrique, nombre):
+    # Mémoire allouée (en octets) par instance créée par fabrique(i).
+    tracemalloc.start()
+    avant, _ = tracemalloc.get_traced_memory()
+    t_ = [fabrique(i) for i in range(nombre)]
+    apres, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # la liste elle-même n'est pas comptée
+    return (apres - avant - 8 * len(t_)) / nombre
+
+
+def banc_memoire(nombre=100000):
+    """Mémoire occupée par instance des types valeurs de fqa, calendrier et calendar."""
+    tt = [
+        ("Fqa", lambda i: fqa.Fqa(i, 4, 7)),
+        ("Date", lambda i: calendrier.Date(calendrier.CALENDRIER_GRE, i, 3, 1.5)),
+        ("JourJulien", lambda i: calendrier.JourJulien(i, 0.5)),
+        ("GDate", lambda i: calendar.GDate(3, 1.5, i)),
+        ("JDate", lambda i: calendar.JDate(3, 1.5, i)),
+        ("ISODate", lambda i: calendar.ISODate(3, 1.5, i)),
+        ("CDate", lambda i: calendar.CDate(3, 1.5, i)),
+        ("EDate", lambda i: calendar.EDate(3, 1.5, i)),
+    ]
+    for nom, fabrique in tt:
+        print("{} : {:.0f} octets par instance".format(nom, _octets_par_instance(fabrique, nombre)))
+
+
+if "__main__" == __name__:
+    banc_fqa_lot()
+    banc_fqa_parcourir()
+    banc_base_lot()
+    banc_calendrier_lot()
+    banc_convertir()
+    banc_instant()
+    banc_cycle()
+    banc_direct()
+    banc_calendar_lot()
+    banc_holidays()
+    banc_index()
+    banc_base_compiler()
+    banc_base_tables()
+    banc_representation()
+    banc_representation_array()
+    banc_serialiser()
+    banc_memoire()
+    banc_reconnaissance()
+    banc_reconnaissance_plages()
+    banc_reconnaissance_incrementale()
+    banc_codes_lot()
@@ -1,4 +1,9 @@
 # Calendar
+import array
+import bisect
+import collections
+import itertools
+
 from . import outils
 
 """
@@ -170,13 +175,17 @@ _LAST = -1
 
 # GREGORIAN CALENDAR
 
-class GDate:
+class GDate(outils.Immuable):
     """Référence [2] pp. 33-41"""
 
+    __slots__ = ("month", "day", "year", "time")
+
     def __init__(self, month, day, year, time=0.0):
-        self.month = int(month)
-        self.day, self.time = outils.ent(float(day + time))
-        self.year = int(year)
+        day, time = outils.ent(float(day + time))
+        object.__setattr__(self, "month", int(month))
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "year", int(year))
+        object.__setattr__(self, "time", time)
 
     def __eq__(self, other):
         if not isinstance(other, GDate):
@@ -185,6 +194,9 @@ class GDate:
             return (self.month == other.month and self.day == other.day and self.year == other.year
                     and self.time == other.time)
 
+    def __hash__(self):
+        return hash((self.month, self.day, self.year, self.time))
+
     def __repr__(self):
         return "GDate({}, {}, {}, {})".format(self.month, self.day, self.year, self.time)
 
@@ -198,9 +210,11 @@ def gregorian_leap_year(g_year):
     Sortie : True si l'année g_year est bissextile
              False sinon.
     Référence : [2] (2.16) p.36.
+    REMARQUE : Les années séculaires non multiples de 400 (1700, 1800, 1900, 2100, ...) ne sont pas bissextiles.
+               Les versions précédentes les comptaient à tort comme bissextiles, ce qui décalait d'un jour
+               fixed_from_gregorian et gregorian_from_fixed à partir du 1er mars de ces années.
     """
-    gym4 = g_year % 4
-    return gym4 == 0 and not gym4 in [100, 200, 300]
+    return g_year % 4 == 0 and g_year % 400 not in [100, 200, 300]
 
 
 def _gregorian_day_adjust(g_year, month):
@@ -254,6 +268,52 @@ def gregorian_from_fixed(date):
     return GDate(month, day, year, time)
 
 
+def _gregorian_triple(date):
+    # Année, mois et jour grégoriens du jour entier date.
+    g_date = gregorian_from_fixed(date)
+    return g_date.year, g_date.month, g_date.day
+
+
+# Le calendrier grégorien se répète tous les 400 ans (146097 jours) : voir outils.TableCycle.
+_GREGORIAN_CYCLE = outils.TableCycle(146097, 400, _GREGORIAN_EPOCH, _gregorian_triple)
+
+
+def tabulated_gregorian_from_fixed(date):
+    """Calcule le mois, le jour et l'année grégorienne du jour julien date par lecture d'une table du cycle
+    de 400 ans (construite au premier appel).
+    Entrée : Un jour julien (nombre flottant).
+    Sortie : La même GDate que gregorian_from_fixed(date).
+    """
+    date, time = outils.ent(date)
+    year, month, day = _GREGORIAN_CYCLE(date)
+    return GDate(month, day, year, time)
+
+
+def _direct_gregorian(date):
+    # Année, mois et jour grégoriens du jour entier date en une seule passe : les années sont comptées
+    # à partir du 1er mars (le jour bissextile est alors le dernier de l'année) dans le cycle de 400 ans,
+    # le mois et le jour se déduisent du rang du jour dans l'année (mois de 153 jours par 5 mois, voir [3]).
+    n400, d = divmod(date - _GREGORIAN_EPOCH + 306, 146097)
+    y = (d - d // 1460 + d // 36524 - d // 146096) // 365
+    d -= 365 * y + y // 4 - y // 100
+    m = (5 * d + 2) // 153
+    day = d - (153 * m + 2) // 5 + 1
+    if m < 10:
+        return 400 * n400 + y, m + 3, day
+    return 400 * n400 + y + 1, m - 9, day
+
+
+def direct_gregorian_from_fixed(date):
+    """Calcule le mois, le jour et l'année grégorienne du jour julien date en une seule passe,
+    sans date intermédiaire.
+    Entrée : Un jour julien (nombre flottant).
+    Sortie : La même GDate que gregorian_from_fixed(date).
+    """
+    date, time = outils.ent(date)
+    year, month, day = _direct_gregorian(date)
+    return GDate(month, day, year, time)
+
+
 def gregorian_date_difference(g_date_1, g_date_2):
     """Calcule le nombre des jours entre les dates g_date_2 et g_date_1.
     Entrée : Une première date grégorienne g_date_1.
@@ -299,8 +359,12 @@ def nth_kday(n, k, g_date):
     Sortie : Le jour julien recherché.
     Référence : [2] (2.24) p.40.
     """
-    return (7 * n + kday_before(fixed_from_gregorian(g_date), k) if n > 0 else 
-            7 * n + kday_after(fixed_from_gregorian(g_date), k))
+    return _noyau_nth_kday(n, k, fixed_from_gregorian(g_date))
+
+
+def _noyau_nth_kday(n, k, date):
+    # nth_kday à partir du jour julien date (entier ou tableau NumPy d'entiers), n et k étant des entiers.
+    return 7 * n + kday_before(date, k) if n > 0 else 7 * n + kday_after(date, k)
 
 
 def labor_day(g_year):
@@ -382,16 +446,20 @@ def assumption(g_year):
 
 # ISO CALENDAR
 
-class ISODate:
+class ISODate(outils.Immuable):
     """Référence [2] pp. 43-44"""
 
+    __slots__ = ("week", "day", "year", "time")
+
     def __init__(self, week, day, year, time=0.0):
         """
         Référence : [2] p. 33.
         """
-        self.week = int(week)
-        self.day, self.time = outils.ent(float(day + time))
-        self.year = int(year)
+        day, time = outils.ent(float(day + time))
+        object.__setattr__(self, "week", int(week))
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "year", int(year))
+        object.__setattr__(self, "time", time)
 
     def __eq__(self, other):
         if not isinstance(other, ISODate):
@@ -400,6 +468,9 @@ class ISODate:
             return (self.week == other.week and self.day == other.day and self.year == other.year
                     and self.time == other.time)
 
+    def __hash__(self):
+        return hash((self.week, self.day, self.year, self.time))
+
     def __repr__(self):
         return "ISODate({}, {}, {}, {})".format(self.week, self.day, self.year, self.time)
 
@@ -432,6 +503,21 @@ def iso_from_fixed(date):
     return ISODate(week, day, year, time)
 
 
+def direct_iso_from_fixed(date):
+    """Calcule la date ISO du jour julien date en une seule passe, sans date intermédiaire :
+    l'année ISO est l'année grégorienne du jeudi de la semaine.
+    Entrée : Un jour julien date.
+    Sortie : La même date ISO que iso_from_fixed(date).
+    """
+    date, time = outils.ent(date)
+    day = date % 7 + 1
+    thursday = date - day + 4
+    year = _direct_gregorian(thursday)[0]
+    y = year - 1
+    week = (thursday - (_GREGORIAN_EPOCH + 365 * y + y // 4 - y // 100 + y // 400)) // 7 + 1
+    return ISODate(week, day, year, time)
+
+
 # JULIAN CALENDAR
 # Référence [2] pp. 47-55.
 #
@@ -443,13 +529,17 @@ _JULIAN_EPOCH = 1721424
 
 
 #
-class JDate:
+class JDate(outils.Immuable):
     """Référence [2] pp. 47-55."""
 
+    __slots__ = ("month", "day", "year", "time")
+
     def __init__(self, month, day, year, time=0.0):
-        self.month = int(month)
-        self.day, self.time = outils.ent(float(day + time))
-        self.year = int(year)
+        day, time = outils.ent(float(day + time))
+        object.__setattr__(self, "month", int(month))
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "year", int(year))
+        object.__setattr__(self, "time", time)
 
     def __eq__(self, other):
         if not isinstance(other, JDate):
@@ -458,6 +548,9 @@ class JDate:
             return (self.month == other.month and self.day == other.day and self.year == other.year
                     and self.time == other.time)
 
+    def __hash__(self):
+        return hash((self.month, self.day, self.year, self.time))
+
     def __repr__(self):
         return "JDate({}, {}, {}, {})".format(self.month, self.day, self.year, self.time)
 
@@ -515,6 +608,47 @@ def julian_from_fixed(date):
     return JDate(month, day, year, time)
 
 
+def _julian_triple(date):
+    # Année (sans année 0 : l'année 0 est l'année -1), mois et jour juliens du jour entier date.
+    j_date = julian_from_fixed(date)
+    return j_date.year + (1 if j_date.year < 0 else 0), j_date.month, j_date.day
+
+
+# Le calendrier julien se répète tous les 4 ans (1461 jours) : voir outils.TableCycle.
+_JULIAN_CYCLE = outils.TableCycle(1461, 4, _JULIAN_EPOCH, _julian_triple)
+
+
+def tabulated_julian_from_fixed(date):
+    """Calcule le mois, le jour et l'année Julienne du jour julien date par lecture d'une table du cycle
+    de 4 ans (construite au premier appel).
+    Entrée : Un jour julien (nombre flottant).
+    Sortie : La même JDate que julian_from_fixed(date).
+    """
+    date, time = outils.ent(date)
+    year, month, day = _JULIAN_CYCLE(date)
+    return JDate(month, day, year - (1 if year <= 0 else 0), time)
+
+
+def direct_julian_from_fixed(date):
+    """Calcule le mois, le jour et l'année Julienne du jour julien date en une seule passe,
+    sans date intermédiaire (voir _direct_gregorian).
+    Entrée : Un jour julien (nombre flottant).
+    Sortie : La même JDate que julian_from_fixed(date).
+    """
+    date, time = outils.ent(date)
+    n4, d = divmod(date - _JULIAN_EPOCH + 306, 1461)
+    y = (d - d // 1460) // 365
+    d -= 365 * y
+    m = (5 * d + 2) // 153
+    day = d - (153 * m + 2) // 5 + 1
+    if m < 10:
+        year, month = 4 * n4 + y, m + 3
+    else:
+        year, month = 4 * n4 + y + 1, m - 9
+    # pas d'année 0 : l'année 0 du calcul est l'année -1
+    return JDate(month, day, year - (1 if year <= 0 else 0), time)
+
+
 def julian_in_gregorian(j_month, j_day, g_year):
     """
     Entrée : Un mois julien.
@@ -523,15 +657,21 @@ def julian_in_gregorian(j_month, j_day, g_year):
     Sortie:  La liste des jour juliens correspondants.
              Cette liste peut contenir 0, 1 ou 2 dates.
     Référence : [2] (4.5) p. 50.
+    REMARQUE : L'année julienne qui suit -1 est 1 (il n'y a pas d'année julienne 0) : l'année grégorienne 0
+               n'a plus qu'un "eastern orthodox christmas" (l'année julienne 0 en donnait un second, hors de l'année).
     """
-    jan1 = fixed_from_gregorian(GDate(_JANUARY, 1, g_year))
-    dec31 = fixed_from_gregorian(GDate(_DECEMBER, 31, g_year))
-    y = julian_from_fixed(jan1).year
-    date1 = fixed_from_julian(JDate(j_month, j_day, y))
-    date2 = fixed_from_julian(JDate(j_month, j_day, y + 1))
-    lst = [date1] if jan1 <= date1 <= dec31 else []
-    lst += [date2] if jan1 <= date2 <= dec31 else []
-    return lst
+    return [float(date) for date, valid in _noyau_julian_in_gregorian(j_month, j_day, g_year) if valid]
+
+
+def _noyau_julian_in_gregorian(j_month, j_day, g_year):
+    # Les deux dates candidates de julian_in_gregorian et leurs validités (dans l'année grégorienne ou non),
+    # pour un entier ou un tableau NumPy d'entiers g_year.
+    jan1 = _noyau_fixed_from_gregorian(_JANUARY, 1, g_year)
+    dec31 = _noyau_fixed_from_gregorian(_DECEMBER, 31, g_year)
+    y = _noyau_julian_from_fixed(jan1)[2]
+    # pas d'année julienne 0 : l'année qui suit -1 est 1
+    dates = (_noyau_fixed_from_julian(j_month, j_day, y), _noyau_fixed_from_julian(j_month, j_day, y + 1 + (y == -1)))
+    return [(date, (jan1 <= date) & (date <= dec31)) for date in dates]
 
 
 def eastern_orthodox_christmas(g_year):
@@ -562,10 +702,15 @@ def easter(g_year):
     Sortie : Le jour julien  correspondant à la date de Pâques dans le calendrier grégorien.
     Référence [2] (4.8) pp. 53-54.
     """
+    return float(_noyau_easter(g_year))
+
+
+def _noyau_easter(g_year):
+    # easter sans condition, pour un entier ou un tableau NumPy d'entiers g_year.
     century = g_year // 100 + 1
     shifted_epact = (14 + 11 * (g_year % 19) - (3 * century) // 4 + (5 + 8 * century) // 25) % 30
-    adjusted_epact = shifted_epact + (1 if (shifted_epact == 0 or (shifted_epact == 1 and 10 < (g_year % 19))) else 0)
-    paschal_moon = fixed_from_gregorian(GDate(_APRIL, 19, g_year)) - adjusted_epact
+    adjusted_epact = shifted_epact + ((shifted_epact == 0) | ((shifted_epact == 1) & (10 < g_year % 19)))
+    paschal_moon = _noyau_fixed_from_gregorian(_APRIL, 19, g_year) - adjusted_epact
     return kday_after(paschal_moon, _SUNDAY)
 
 
@@ -601,21 +746,28 @@ _MISRA = 12
 _AL_NASI = 13
 
 
-class CDate:
+class CDate(outils.Immuable):
     """Référence [2] pp. 37-55."""
 
+    __slots__ = ("month", "day", "year", "time")
+
     def __init__(self, month, day, year, time=0.0):
-        self.month = int(month)
-        self.day, self.time = outils.ent(float(day + time))
-        self.year = int(year)
+        day, time = outils.ent(float(day + time))
+        object.__setattr__(self, "month", int(month))
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "year", int(year))
+        object.__setattr__(self, "time", time)
 
     def __eq__(self, other):
-        if not isinstance(other, JDate):
+        if not isinstance(other, CDate):
             return False
         else:
             return (self.month == other.month and self.day == other.day and self.year == other.year
                     and self.time == other.time)
 
+    def __hash__(self):
+        return hash((self.month, self.day, self.year, self.time))
+
     def __repr__(self):
         return "CDate({}, {}, {}, {})".format(self.month, self.day, self.year, self.time)
 
@@ -661,21 +813,28 @@ _ETHIOPIC_EPOCH = 1723855
 
 
 #
-class EDate:
+class EDate(outils.Immuable):
     """Référence [2] pp. 59-60."""
 
+    __slots__ = ("month", "day", "year", "time")
+
     def __init__(self, month, day, year, time=0.0):
-        self.month = int(month)
-        self.day, self.time = outils.ent(float(day + time))
-        self.year = int(year)
+        day, time = outils.ent(float(day + time))
+        object.__setattr__(self, "month", int(month))
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "year", int(year))
+        object.__setattr__(self, "time", time)
 
     def __eq__(self, other):
-        if not isinstance(other, JDate):
+        if not isinstance(other, EDate):
             return False
         else:
             return (self.month == other.month and self.day == other.day and self.year == other.year
                     and self.time == other.time)
 
+    def __hash__(self):
+        return hash((self.month, self.day, self.year, self.time))
+
     def __repr__(self):
         return "EDate({}, {}, {}, {})".format(self.month, self.day, self.year, self.time)
 
@@ -727,14 +886,16 @@ def coptic_in_gregorian(c_month, c_day, g_year):
              Cette liste peut contenir 0, 1 ou 2 dates.
     Référence [2] (5.8) p. 60.
     """
-    jan1 = fixed_from_gregorian(GDate(_JANUARY, 1, g_year))
-    dec31 = fixed_from_gregorian(GDate(_DECEMBER, 31, g_year))
-    y = coptic_from_fixed(jan1).year
-    date1 = fixed_from_coptic(CDate(c_month, c_day, y))
-    date2 = fixed_from_coptic(CDate(c_month, c_day, y + 1))
-    lst = [date1] if jan1 <= date1 <= dec31 else []
-    lst += [date2] if jan1 <= date2 <= dec31 else []
-    return lst
+    return [float(date) for date, valid in _noyau_coptic_in_gregorian(c_month, c_day, g_year) if valid]
+
+
+def _noyau_coptic_in_gregorian(c_month, c_day, g_year):
+    # Les deux dates candidates de coptic_in_gregorian et leurs validités, comme pour _noyau_julian_in_gregorian.
+    jan1 = _noyau_fixed_from_gregorian(_JANUARY, 1, g_year)
+    dec31 = _noyau_fixed_from_gregorian(_DECEMBER, 31, g_year)
+    y = _noyau_coptic_from_fixed(jan1)[2]
+    dates = (_noyau_fixed_from_coptic(c_month, c_day, y), _noyau_fixed_from_coptic(c_month, c_day, y + 1))
+    return [(date, (jan1 <= date) & (date <= dec31)) for date in dates]
 
 
 def coptic_christmas(g_year):
@@ -766,6 +927,341 @@ def ethiopic_in_gregorian(e_month, e_day, g_year):
     return lst
 
 
+# TRAITEMENTS PAR LOT
+#
+# Les fonctions *_lot appliquent les calculs à des colonnes (array.array, memoryview, tableaux NumPy ou séquences)
+# et rendent des colonnes de même nature et de même forme que la première colonne fournie, sans créer d'objet
+# par ligne. Les noyaux _noyau_* n'utilisent que des opérations entières sans condition : ils s'appliquent aussi bien
+# à des entiers (ligne par ligne sans NumPy) qu'à des tableaux NumPy d'entiers (colonne par colonne).
+# Les années et mois sont comptés à partir du 1er mars (le jour bissextile est alors le dernier de l'année),
+# voir direct_gregorian_from_fixed.
+
+
+def _noyau_fixed_from_gregorian(month, day, year):
+    k = (month - 3) // 12
+    y, m = year + k, month - 3 - 12 * k
+    return _GREGORIAN_EPOCH - 307 + 365 * y + y // 4 - y // 100 + y // 400 + (153 * m + 2) // 5 + day
+
+
+def _noyau_gregorian_from_fixed(date):
+    n400, d = divmod(date - _GREGORIAN_EPOCH + 306, 146097)
+    y = (d - d // 1460 + d // 36524 - d // 146096) // 365
+    d = d - (365 * y + y // 4 - y // 100)
+    m = (5 * d + 2) // 153
+    k = m // 10
+    return m + 3 - 12 * k, d - (153 * m + 2) // 5 + 1, 400 * n400 + y + k
+
+
+def _noyau_fixed_from_julian(month, day, year):
+    # pas d'année 0 : l'année -1 est l'année 0 du calcul
+    year = year + (year < 0)
+    k = (month - 3) // 12
+    y, m = year + k, month - 3 - 12 * k
+    return _JULIAN_EPOCH - 307 + 365 * y + y // 4 + (153 * m + 2) // 5 + day
+
+
+def _noyau_julian_from_fixed(date):
+    n4, d = divmod(date - _JULIAN_EPOCH + 306, 1461)
+    y = (d - d // 1460) // 365
+    d = d - 365 * y
+    m = (5 * d + 2) // 153
+    k = m // 10
+    year = 4 * n4 + y + k
+    return m + 3 - 12 * k, d - (153 * m + 2) // 5 + 1, year - (year <= 0)
+
+
+def _noyau_fixed_from_iso(week, day, year):
+    # La semaine 1 est celle du 4 janvier, les semaines commencent le lundi (date % 7 == 0).
+    jan4 = _noyau_fixed_from_gregorian(_JANUARY, 4, year)
+    return jan4 - jan4 % 7 + 7 * (week - 1) + day - 1
+
+
+def _noyau_iso_from_fixed(date):
+    # L'année ISO est l'année grégorienne du jeudi de la semaine.
+    day = date % 7 + 1
+    thursday = date - day + 4
+    year = _noyau_gregorian_from_fixed(thursday)[2]
+    return (thursday - _noyau_fixed_from_gregorian(_JANUARY, 1, year)) // 7 + 1, day, year
+
+
+def _noyau_fixed_from_coptic(month, day, year, epoch=_COPTIC_EPOCH):
+    return epoch - 1 + 365 * (year - 1) + year // 4 + 30 * (month - 1) + day
+
+
+def _noyau_coptic_from_fixed(date, epoch=_COPTIC_EPOCH):
+    year = (4 * (date - epoch) + 1463) // 1461
+    month = (date - _noyau_fixed_from_coptic(1, 1, year, epoch)) // 30 + 1
+    return month, date + 1 - _noyau_fixed_from_coptic(month, 1, year, epoch), year
+
+
+def _noyau_fixed_from_ethiopic(month, day, year):
+    return _noyau_fixed_from_coptic(month, day, year, _ETHIOPIC_EPOCH)
+
+
+def _noyau_ethiopic_from_fixed(date):
+    return _noyau_coptic_from_fixed(date, _ETHIOPIC_EPOCH)
+
+
+def _vers_fixes(noyau, u, v, w, time):
+    # Application de noyau aux colonnes u, v, w puis ajout de la colonne facultative time.
+    np_ = outils.numpy
+    if np_ is not None:
+        n = noyau(outils.entiers(u), outils.entiers(v), outils.entiers(w))
+        if time is None:
+            f = np_.zeros(n.shape)
+        else:
+            t = np_.asarray(time, dtype=np_.float64)
+            k = np_.floor(t)
+            n, f = n + k.astype(np_.int64), t - k
+        return outils.colonne(u, n), outils.colonne(u, f, 'd')
+    tn, tf = [], []
+    tt = itertools.repeat(0.0) if time is None else outils.plat(time)
+    for a, b, c, t in zip(outils.entiers(u), outils.entiers(v), outils.entiers(w), tt):
+        k, f = outils.ent(float(t))
+        tn.append(noyau(int(a), int(b), int(c)) + k)
+        tf.append(f)
+    return outils.colonne(u, tn), outils.colonne(u, tf, 'd')
+
+
+def _depuis_fixes(noyau, date):
+    # Application de noyau à la partie entière des jours juliens de la colonne date.
+    np_ = outils.numpy
+    if np_ is not None:
+        d = np_.asarray(date)
+        if np_.issubdtype(d.dtype, np_.integer):
+            n, f = d.astype(np_.int64), np_.zeros(d.shape)
+        else:
+            n = np_.floor(d.astype(np_.float64))
+            n, f = n.astype(np_.int64), d - n
+        return tuple(outils.colonne(date, c) for c in noyau(n)) + (outils.colonne(date, f, 'd'),)
+    tu, tv, tw, tf = [], [], [], []
+    for x in outils.plat(date):
+        n, f = (x, 0.0) if isinstance(x, int) else outils.ent(float(x))
+        u, v, w = noyau(n)
+        tu.append(u)
+        tv.append(v)
+        tw.append(w)
+        tf.append(f)
+    return outils.colonne(date, tu), outils.colonne(date, tv), outils.colonne(date, tw), outils.colonne(date, tf, 'd')
+
+
+def fixed_from_gregorian_lot(month, day, year, time=None):
+    """fixed_from_gregorian appliquée à des colonnes.
+    Entrée : Les colonnes d'entiers month, day, year et la colonne facultative time des fractions de jour.
+    Sortie : La colonne des jours juliens (entiers) et la colonne des fractions de jour (0 <= f < 1).
+    """
+    return _vers_fixes(_noyau_fixed_from_gregorian, month, day, year, time)
+
+
+def gregorian_from_fixed_lot(date):
+    """gregorian_from_fixed appliquée à une colonne.
+    Entrée : La colonne date des jours juliens (entiers ou flottants).
+    Sortie : Les colonnes month, day, year (entiers) et time (fractions de jour).
+    """
+    return _depuis_fixes(_noyau_gregorian_from_fixed, date)
+
+
+def fixed_from_julian_lot(month, day, year, time=None):
+    """fixed_from_julian appliquée à des colonnes (voir fixed_from_gregorian_lot)."""
+    return _vers_fixes(_noyau_fixed_from_julian, month, day, year, time)
+
+
+def julian_from_fixed_lot(date):
+    """julian_from_fixed appliquée à une colonne (voir gregorian_from_fixed_lot)."""
+    return _depuis_fixes(_noyau_julian_from_fixed, date)
+
+
+def fixed_from_iso_lot(week, day, year, time=None):
+    """fixed_from_iso appliquée à des colonnes (voir fixed_from_gregorian_lot).
+    REMARQUE : Les semaines doivent être comprises entre 1 et 53.
+    """
+    return _vers_fixes(_noyau_fixed_from_iso, week, day, year, time)
+
+
+def iso_from_fixed_lot(date):
+    """iso_from_fixed appliquée à une colonne.
+    Entrée : La colonne date des jours juliens (entiers ou flottants).
+    Sortie : Les colonnes week, day, year (entiers) et time (fractions de jour).
+    """
+    return _depuis_fixes(_noyau_iso_from_fixed, date)
+
+
+def fixed_from_coptic_lot(month, day, year, time=None):
+    """fixed_from_coptic appliquée à des colonnes (voir fixed_from_gregorian_lot)."""
+    return _vers_fixes(_noyau_fixed_from_coptic, month, day, year, time)
+
+
+def coptic_from_fixed_lot(date):
+    """coptic_from_fixed appliquée à une colonne (voir gregorian_from_fixed_lot)."""
+    return _depuis_fixes(_noyau_coptic_from_fixed, date)
+
+
+def fixed_from_ethiopic_lot(month, day, year, time=None):
+    """fixed_from_ethiopic appliquée à des colonnes (voir fixed_from_gregorian_lot)."""
+    return _vers_fixes(_noyau_fixed_from_ethiopic, month, day, year, time)
+
+
+def ethiopic_from_fixed_lot(date):
+    """ethiopic_from_fixed appliquée à une colonne (voir gregorian_from_fixed_lot)."""
+    return _depuis_fixes(_noyau_ethiopic_from_fixed, date)
+
+
+# JOURS FÉRIÉS
+#
+# Les fêtes d'une année grégorienne sont toutes dans l'année : les fêtes d'une plage d'années sont calculées
+# d'un seul coup (colonne par colonne avec NumPy) avec les noyaux des traitements par lot, puis rangées par jour
+# pour les recherches par dichotomie (voir Holidays).
+
+HOLIDAY_NAMES = ("epiphany", "easter", "memorial_day", "pentecost", "labor_day", "election_day", "advent",
+                 "christmas", "eastern_orthodox_christmas", "coptic_christmas")
+
+
+def _noyau_holidays(g_year):
+    # Liste des (numéro de fête dans HOLIDAY_NAMES, jour, validité) : les fêtes des calendriers julien et copte
+    # ont deux candidates par année grégorienne, valides si elles sont dans l'année (voir julian_in_gregorian).
+    # Les formules sont celles des fonctions de chaque fête (noyaux communs _noyau_easter, _noyau_nth_kday, ...).
+    fixed = _noyau_fixed_from_gregorian
+    easter_ = _noyau_easter(g_year)
+    holidays = [
+        (0, fixed(_DECEMBER, 25, g_year - 1) + 12, True),
+        (1, easter_, True),
+        (2, _noyau_nth_kday(_LAST, _MONDAY, fixed(_MAY, 31, g_year)), True),
+        (3, easter_ + 49, True),
+        (4, _noyau_nth_kday(_FIRST, _MONDAY, fixed(_SEPTEMBER, 1, g_year)), True),
+        (5, _noyau_nth_kday(_FIRST, _TUESDAY, fixed(_NOVEMBER, 2, g_year)), True),
+        (6, kday_nearest(fixed(_NOVEMBER, 30, g_year), _SUNDAY), True),
+        (7, fixed(_DECEMBER, 25, g_year), True),
+    ]
+    holidays += [(8, date, valid) for date, valid in _noyau_julian_in_gregorian(_DECEMBER, 25, g_year)]
+    holidays += [(9, date, valid) for date, valid in _noyau_coptic_in_gregorian(4, 29, g_year)]
+    return holidays
+
+
+def _holidays_block(first, last):
+    # Jours (array('q')) et numéros (array('B')) des fêtes des années first à last, rangés par jour.
+    np_ = outils.numpy
+    days, codes = array.array('q'), array.array('B')
+    if np_ is not None:
+        years = np_.arange(first, last + 1, dtype=np_.int64)
+        t_days, t_codes = [], []
+        for code, date, valid in _noyau_holidays(years):
+            date = date[np_.broadcast_to(valid, date.shape)]
+            t_days.append(date)
+            t_codes.append(np_.full(date.shape, code, dtype=np_.uint8))
+        t_days, t_codes = np_.concatenate(t_days), np_.concatenate(t_codes)
+        ordre = np_.lexsort((t_codes, t_days))
+        days.frombytes(t_days[ordre].astype(np_.dtype('q'), copy=False).tobytes())
+        codes.frombytes(t_codes[ordre].tobytes())
+        return days, codes
+    for g_year in range(first, last + 1):
+        for date, code in sorted((date, code) for code, date, valid in _noyau_holidays(g_year) if valid):
+            days.append(date)
+            codes.append(code)
+    return days, codes
+
+
+class Holidays:
+    """Jours fériés (voir HOLIDAY_NAMES) calculés par plages d'années et conservés, rangés par jour,
+    pour répondre par dichotomie aux questions "le jour d est-il férié et pour quelle fête ?"
+    et "quelles sont les fêtes entre d0 et d1 ?".
+    Les fêtes d'une plage continue d'années (voir compute) sont dans un même index, celles des années isolées
+    demandées en dehors de cette plage (voir holidays_on) sont conservées année par année, seules les cache_size
+    dernières utilisées l'étant (LRU).
+    """
+
+    def __init__(self, first=None, last=None, cache_size=8):
+        """Entrée : Facultativement la première et la dernière année grégorienne à calculer (voir compute)
+                 et le nombre maximal d'années isolées conservées.
+        """
+        self.cache_size = int(cache_size)
+        assert 0 < self.cache_size
+        self._first, self._last = None, None
+        self._days, self._codes = array.array('q'), array.array('B')
+        self._years = collections.OrderedDict()
+        if first is not None:
+            self.compute(first, first if last is None else last)
+
+    def __len__(self):
+        """Nombre de fêtes de la plage d'années calculée."""
+        return len(self._days)
+
+    def compute(self, first, last):
+        """Calcul des fêtes des années grégoriennes first à last (seules les années manquantes sont calculées).
+        REMARQUE : La plage d'années calculée reste continue : elle est étendue jusqu'à first et last.
+        """
+        if last < first:
+            return
+        if self._first is None:
+            self._days, self._codes = _holidays_block(first, last)
+            self._first, self._last = first, last
+        else:
+            if first < self._first:
+                days, codes = _holidays_block(first, self._first - 1)
+                self._days, self._codes = days + self._days, codes + self._codes
+                self._first = first
+            if self._last < last:
+                days, codes = _holidays_block(self._last + 1, last)
+                self._days.extend(days)
+                self._codes.extend(codes)
+                self._last = last
+        for g_year in [y for y in self._years if self._first <= y <= self._last]:
+            del self._years[g_year]
+
+    def _year(self, g_year):
+        # Jours et numéros des fêtes de l'année : index de la plage calculée ou année isolée.
+        if self._first is not None and self._first <= g_year <= self._last:
+            return self._days, self._codes
+        block = self._years.get(g_year)
+        if block is not None:
+            self._years.move_to_end(g_year)
+        else:
+            block = self._years[g_year] = _holidays_block(g_year, g_year)
+            if self.cache_size < len(self._years):
+                self._years.popitem(last=False)
+        return block
+
+    def year(self, g_year):
+        """Entrée : Une année grégorienne.
+        Sortie : La liste des (jour julien, nom de la fête) de l'année, rangée par jour.
+        """
+        return self.between(_noyau_fixed_from_gregorian(_JANUARY, 1, g_year),
+                            _noyau_fixed_from_gregorian(_DECEMBER, 31, g_year))
+
+    def holidays_on(self, date):
+        """Entrée : Un jour julien date.
+        Sortie : La liste des noms des fêtes du jour (vide si le jour n'est pas férié).
+        """
+        date = outils.ent(date)[0]
+        days, codes = self._year(_noyau_gregorian_from_fixed(date)[2])
+        i = bisect.bisect_left(days, date)
+        names = []
+        while i < len(days) and days[i] == date:
+            names.append(HOLIDAY_NAMES[codes[i]])
+            i += 1
+        return names
+
+    def is_holiday(self, date):
+        """Entrée : Un jour julien date.
+        Sortie : True si le jour est férié, False sinon.
+        """
+        date = outils.ent(date)[0]
+        days = self._year(_noyau_gregorian_from_fixed(date)[2])[0]
+        i = bisect.bisect_left(days, date)
+        return i < len(days) and days[i] == date
+
+    def between(self, date0, date1):
+        """Entrée : Deux jours juliens date0 et date1.
+        Sortie : La liste des (jour julien, nom de la fête) des fêtes de date0 à date1 inclus, rangée par jour.
+        REMARQUE : La plage d'années calculée est étendue si nécessaire (voir compute).
+        """
+        date0, date1 = outils.ent(date0)[0], outils.ent(date1)[0]
+        if date1 < date0:
+            return []
+        self.compute(_noyau_gregorian_from_fixed(date0)[2], _noyau_gregorian_from_fixed(date1)[2])
+        i, j = bisect.bisect_left(self._days, date0), bisect.bisect_right(self._days, date1)
+        return [(self._days[k], HOLIDAY_NAMES[self._codes[k]]) for k in range(i, j)]
+
+
 if "__main__" == __name__:
     print("calendar")
     d0 = fixed_from_gregorian(GDate(7, 14.25, 1789))
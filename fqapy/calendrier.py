@@ -13,7 +13,13 @@ Bibliographie.
 Jours de la semaine commençant par 0 pour le lundi
 ATTENTION : différent de [2] p. 17 où le dimanche débute le semaine."""
 
+import array
+import collections
+import itertools
+import mmap
+import struct
 from enum import IntEnum
+from fractions import Fraction
 
 from . import fqa
 from . import outils
@@ -182,9 +188,10 @@ class Months(IntEnum):
         return _MONTHS[self.value - 1]
 
 
-class Date:
+class Date(outils.Immuable):
     """Date de trois nombres (deux premiers entiers et troisième flottant).
        Aucun traitement ni contrôle de cohérence n'est fait.
+       Une Date est immuable.
        ATTENTION : Une Date doit nécessairement être associée à un calendrier 
        afin de donner un sens aux trois nombres qui la représentent.
     """
@@ -198,6 +205,8 @@ class Date:
     #             v un numéro de semaine dans l'année et w un numéro de jour dans
     #             la semaine.
     #             L'attribut t contient le temps (l'heure) extrait de w.
+    __slots__ = ("calendrier", "u", "v", "w", "t")
+
     def __init__(self, calendrier, u_, v_, w_, t_=0.0):
         """Entrée : les trois paramètres u, v, w et le calendrier.
         Sortie : Le Date.
@@ -208,9 +217,12 @@ class Date:
         # assert isinstance(v_, int)
         # assert (isinstance(w_, float) or isinstance(w_, int))
         assert isinstance(calendrier, Calendrier)
-        self.calendrier = calendrier
-        self.u, self.v = int(u_), int(v_)
-        self.w, self.t = outils.ent(float(w_ + t_))
+        w_, t_ = outils.ent(float(w_ + t_))
+        object.__setattr__(self, "calendrier", calendrier)
+        object.__setattr__(self, "u", int(u_))
+        object.__setattr__(self, "v", int(v_))
+        object.__setattr__(self, "w", w_)
+        object.__setattr__(self, "t", t_)
 
     def __eq__(self, autre):
         if not isinstance(autre, Date):
@@ -219,6 +231,10 @@ class Date:
                 and outils.egalf(self.t, autre.t)
                 and self.calendrier == autre.calendrier)
 
+    def __hash__(self):
+        # REMARQUE : t est comparé à la précision près, il n'intervient donc pas dans le hachage.
+        return hash((self.u, self.v, self.w))
+
     def __call__(self):
         """Date() retourne le Jour julien."""
         return self.calendrier.date_vers_jj(self)
@@ -231,11 +247,14 @@ class Date:
         return "[{}, {}, {}, {}, {}]".format(self.calendrier, self.u, str(self.v), self.w, self.t)
 
 
-class _Quantite:
+class _Quantite(outils.Immuable):
     """Une Quantite représente un "nombre" constitué d'une partie entière n et d'un faction f.
     La fraction f vérifie 0.0 <= f < 1.0
+    Une Quantite est immuable : les opérateurs += et -= produisent une nouvelle Quantite.
     """
 
+    __slots__ = ("n", "f")
+
     def __init__(self, n_=0, f_=0.0):
         """Entrée : Un nombre entier n et un nombre flottant f.
         Sortie : Une Quantite.
@@ -246,8 +265,9 @@ class _Quantite:
             f_ = 0.0
         f_ = float(f_)
         # au final f doit vérifier 0.0 <= f < 1.0.
-        j_, self.f = outils.ent(f_)
-        self.n = n_ + j_
+        j_, f_ = outils.ent(f_)
+        object.__setattr__(self, "n", n_ + j_)
+        object.__setattr__(self, "f", f_)
 
     def __add__(self, autre):
         """Entrée : un nombre entier ou flottant à ajouter.
@@ -259,17 +279,6 @@ class _Quantite:
         j_, f_ = outils.ent(f_)
         return _Quantite(n_ + j_, f_)
 
-    def __iadd__(self, autre):
-        """Entrée : Un nombre entier ou flottant à ajouter.
-        Sortie : La même Quantite translaté de autre.
-        """
-        n_, f_ = outils.ent(float(autre))
-        n_ += self.n
-        f_ += self.f
-        j_, f_ = outils.ent(f_)
-        self.n, self.f = n_ + j_, f_
-        return self
-
     def __sub__(self, autre):
         """Soustraire un nombre ou une Quantite.
         Entrée : Un nombre entier ou flottant ou une Quantite à soustraire.
@@ -295,21 +304,15 @@ class _Quantite:
         j_, f_ = outils.ent(f_)
         return _Quantite(n_ + j_, f_)
 
-    def __isub__(self, autre):
-        """Entrée : Un nombre entier ou flottant à soustraire.
-        Sortie : La même Quantite "augmentée" de autre.
-        """
-        n_, f_ = outils.ent(float(autre))
-        n_, f_ = self.n - n_, self.f - f_
-        j_, f_ = outils.ent(f_)
-        self.n, self.f = n_ + j_, f_
-        return self
-
     def __eq__(self, autre):
         if not isinstance(autre, _Quantite):
             return False
         return self.n == autre.n and outils.egalf(self.f, autre.f)
 
+    def __hash__(self):
+        # REMARQUE : f est comparé à la précision près, il n'intervient donc pas dans le hachage.
+        return hash(self.n)
+
     def __call__(self):
         return self.n + self.f
 
@@ -322,16 +325,13 @@ class _Quantite:
 
 class JourJulien(_Quantite):
 
+    __slots__ = ()
+
     def __add__(self, autre):
         """Force le typage à JourJulien."""
         q = super().__add__(autre)
         return JourJulien(q.n, q.f)
 
-    def __iadd__(self, autre):
-        """Force le typage à JourJulien."""
-        q = super().__iadd__(autre)
-        return JourJulien(q.n, q.f)
-
     def __sub__(self, autre):
         """Force le typage à JourJulien si nécessaire."""
         q = super().__sub__(autre)
@@ -340,11 +340,6 @@ class JourJulien(_Quantite):
         else:
             return q
 
-    def __isub__(self, autre):
-        """Force le typage à JourJulien."""
-        q = super().__isub__(autre)
-        return JourJulien(q.n, q.f)
-
     def jour_semaine(self):
         return Jours(self.n % 7)
 
@@ -364,6 +359,131 @@ class JourJulien(_Quantite):
         return self - (1 + (self.n - 1 - k) % 7)
 
 
+# Nombre de nanosecondes dans un jour
+NS_JOUR = 86400 * 10 ** 9
+
+
+def nanosecondes(f_):
+    """Entrée : Une fraction de jour f (flottant, entier ou Fraction).
+    Sortie : Le nombre entier de nanosecondes le plus proche de f jours.
+    """
+    if isinstance(f_, int):
+        return f_ * NS_JOUR
+    return round(Fraction(f_) * NS_JOUR)
+
+
+class Instant(outils.Immuable):
+    """Un Instant représente un jour n et un nombre entier ns de nanosecondes écoulées depuis le début du jour.
+    Le nombre de nanosecondes ns vérifie 0 <= ns < NS_JOUR.
+    Contrairement au Jour julien, dont la fraction de jour est un flottant, les calculs et les comparaisons
+    sont exacts (entiers) : aucune perte de précision selon l'ordre des opérations.
+    Un Instant est immuable.
+    """
+
+    __slots__ = ("n", "ns")
+
+    def __init__(self, n_=0, ns_=0):
+        """Entrée : Un nombre entier de jours n et un nombre entier de nanosecondes ns.
+        Sortie : Un Instant.
+        REMARQUE : Les nanosecondes au-delà d'un jour (ou négatives) sont reportées sur le jour.
+        """
+        j_, ns_ = divmod(int(ns_), NS_JOUR)
+        object.__setattr__(self, "n", int(n_) + j_)
+        object.__setattr__(self, "ns", ns_)
+
+    @classmethod
+    def depuis_jj(cls, jj_):
+        """Entrée : Un Jour julien.
+        Sortie : L'Instant le plus proche (à la nanoseconde près).
+        """
+        return cls(jj_.n, nanosecondes(jj_.f))
+
+    @classmethod
+    def depuis_date(cls, date):
+        """Entrée : Une Date.
+        Sortie : L'Instant le plus proche (à la nanoseconde près) de son Jour julien.
+        """
+        return cls.depuis_jj(date())
+
+    def jj(self):
+        """Sortie : Le Jour julien correspondant (la fraction de jour est arrondie au flottant le plus proche)."""
+        return JourJulien(self.n, self.ns / NS_JOUR)
+
+    def date(self, calendrier):
+        """Entrée : Un calendrier.
+        Sortie : La Date représentant l'Instant dans le calendrier (Date.t est la fraction de jour ns / NS_JOUR).
+        """
+        return calendrier.date(self.jj())
+
+    def __add__(self, autre):
+        """Entrée : Un nombre de jours (entier, Fraction ou flottant) à ajouter.
+        Sortie : Un nouvel Instant translaté de autre.
+        REMARQUE : Un flottant est arrondi à la nanoseconde près.
+        """
+        if isinstance(autre, int):
+            return Instant(self.n + autre, self.ns)
+        if isinstance(autre, Instant):
+            return NotImplemented
+        return Instant(self.n, self.ns + nanosecondes(autre))
+
+    __radd__ = __add__
+
+    def __sub__(self, autre):
+        """Soustraire un nombre de jours ou un Instant.
+        Entrée : Un nombre de jours (entier, Fraction ou flottant) ou un Instant à soustraire.
+        Sortie : L'écart exact en jours (Fraction) si autre est un Instant.
+                 Un Instant si autre est un nombre.
+        """
+        if isinstance(autre, Instant):
+            return Fraction((self.n - autre.n) * NS_JOUR + self.ns - autre.ns, NS_JOUR)
+        if isinstance(autre, int):
+            return Instant(self.n - autre, self.ns)
+        return Instant(self.n, self.ns - nanosecondes(autre))
+
+    def ecart(self, autre):
+        """Entrée : Un Instant.
+        Sortie : Le nombre entier de nanosecondes de autre à self.
+        """
+        return (self.n - autre.n) * NS_JOUR + self.ns - autre.ns
+
+    def __eq__(self, autre):
+        if not isinstance(autre, Instant):
+            return False
+        return self.n == autre.n and self.ns == autre.ns
+
+    def __lt__(self, autre):
+        if not isinstance(autre, Instant):
+            return NotImplemented
+        return (self.n, self.ns) < (autre.n, autre.ns)
+
+    def __le__(self, autre):
+        if not isinstance(autre, Instant):
+            return NotImplemented
+        return (self.n, self.ns) <= (autre.n, autre.ns)
+
+    def __gt__(self, autre):
+        if not isinstance(autre, Instant):
+            return NotImplemented
+        return (self.n, self.ns) > (autre.n, autre.ns)
+
+    def __ge__(self, autre):
+        if not isinstance(autre, Instant):
+            return NotImplemented
+        return (self.n, self.ns) >= (autre.n, autre.ns)
+
+    def __hash__(self):
+        return hash((self.n, self.ns))
+
+    def __call__(self):
+        return self.n + self.ns / NS_JOUR
+
+    def __repr__(self):
+        return "Instant({}, {})".format(self.n, self.ns)
+
+    def __str__(self):
+        return "(n={}, ns={})".format(self.n, self.ns)
+
+
 # REMARQUE : Le début du jour est à minuit comme dans [2] et non pas à midi
 #           comme pour le jour julien (Julian Day) en astronomie (jd = jj - 0.5).
 #           De ce point de vue cela se rapproche de la notion de 
@@ -389,10 +509,60 @@ EPOQUE_ISL = EPOQUE_RD + 227015
 EPOQUE_RFR = EPOQUE_RD + 654415
 EPOQUE_BAH = EPOQUE_RD + 673222
 
+_INTERNES = {(q.n, q.f): q for q in (EPOQUE_JJ, EPOQUE_JD, EPOQUE_RD, EPOQUE_HEB, EPOQUE_MAY, EPOQUE_HIN, EPOQUE_CHI,
+                                     EPOQUE_JUL, EPOQUE_GRE, EPOQUE_ISO, EPOQUE_ETH, EPOQUE_COP, EPOQUE_PER, EPOQUE_ISL,
+                                     EPOQUE_RFR, EPOQUE_BAH)}
+
+
+def interner(jj_):
+    """Entrée : Un Jour julien.
+    Sortie : L'instance partagée (EPOQUE_RD, EPOQUE_GRE, ...) égale au Jour julien si elle existe,
+             le Jour julien lui-même sinon.
+    REMARQUE : Les Jours julien étant immuables, conserver les instances partagées plutôt que des
+               copies évite de multiplier les objets identiques.
+    """
+    return _INTERNES.get((jj_.n, jj_.f), jj_)
+
 
 class Calendrier(fqa.Base):
     """Calendrier défini comme dans [1]."""
 
+    # Période du calendrier (nombre de jours, nombre d'années) si ses dates se répètent (voir date_cycle).
+    _CYCLE = None
+    # Table du cycle, construite à la première utilisation (voir _table_cycle).
+    _cycle = None
+
+    def _invalider(self):
+        super()._invalider()
+        self._cycle = None
+
+    def _table_cycle(self):
+        # Table du cycle du calendrier commençant le premier jour de l'année 0 (voir outils.TableCycle).
+        if self._cycle is None:
+            inverse, depuis = self.compiler()[1], self._depuis_chiffres
+            origine = self.date_vers_jj(Date(self, 0, 1, 1)).n
+            if depuis(inverse(origine)) is None:
+                def date(n_):
+                    d_ = self.date(JourJulien(n_))
+                    return d_.u, d_.v, d_.w
+            else:
+                def date(n_):
+                    return depuis(inverse(n_))
+            self._cycle = outils.TableCycle(self._CYCLE[0], self._CYCLE[1], origine, date)
+        return self._cycle
+
+    def date_cycle(self, jj_):
+        """date lue dans la table du cycle du calendrier (construite au premier appel).
+        Entrée : Un Jour julien.
+        Sortie : La même Date que date(jj).
+        Erreur : Si le calendrier n'a pas de cycle (_CYCLE).
+        REMARQUE : Le numéro de jour est ramené dans le cycle par une seule division, au lieu de la suite
+                   des divisions des formes quasi affines de la base.
+        """
+        assert self._CYCLE is not None
+        u_, v_, w_ = (self._cycle or self._table_cycle())(jj_.n)
+        return Date(self, u_, v_, w_, jj_.f)
+
     def date_vers_jj(self, date: Date) -> JourJulien:
         """Entrée : Une Date(calendrier, u, v, w, t) représentant la date dans le calendrier.
         Sortie : le Jour julien correspondant.
@@ -407,6 +577,91 @@ class Calendrier(fqa.Base):
         """
         raise NotImplementedError("Méthode non implémentée.")
 
+    def _vers_chiffres(self, u_, v_, w_):
+        # Chiffres dans la base du calendrier de la date u, v, w (entiers ou tableaux NumPy d'entiers),
+        # None si le calendrier ne les définit pas : les traitements par lot passent alors par date_vers_jj.
+        return None
+
+    def _depuis_chiffres(self, chiffres):
+        # Date u, v, w correspondant aux chiffres dans la base du calendrier (entiers ou tableaux NumPy d'entiers),
+        # None si le calendrier ne la définit pas : les traitements par lot passent alors par date.
+        return None
+
+    def date_vers_jj_lot(self, u_, v_, w_, t_=None):
+        """date_vers_jj appliquée à des colonnes, sans créer de Date ni de Jour julien.
+        Entrée : Les colonnes u, v, w (par exemple années, mois et jours) et la colonne facultative t des fractions
+                 de jour (array.array, memoryview, tableaux NumPy ou séquences). w peut être une colonne de flottants.
+        Sortie : La colonne des numéros de jour (entiers) et la colonne des fractions de jour (flottants, 0 <= f < 1)
+                 des Jours julien, de même nature et de même forme que la colonne u.
+        REMARQUE : Sans NumPy, les calculs sont faits ligne par ligne par les fonctions engendrées par compiler.
+                   Les calendriers qui ne définissent pas leurs chiffres passent par date_vers_jj.
+        """
+        np_ = outils.numpy
+        if np_ is not None:
+            w_ = np_.asarray(w_)
+            if t_ is None and np_.issubdtype(w_.dtype, np_.integer):
+                n_, f_ = w_.astype(np_.int64), np_.zeros(w_.shape)
+            else:
+                x_ = w_.astype(np_.float64) + (0.0 if t_ is None else np_.asarray(t_, dtype=np_.float64))
+                n_ = np_.floor(x_)
+                n_, f_ = n_.astype(np_.int64), x_ - n_
+            chiffres = self._vers_chiffres(outils.entiers(u_), outils.entiers(v_), n_)
+            if chiffres is not None:
+                return outils.colonne(u_, self.evaluer_lot(chiffres)), outils.colonne(u_, f_, 'd')
+        tn, tf = [], []
+        directe = self.compiler()[0]
+        tt = itertools.repeat(0.0) if t_ is None else outils.plat(t_)
+        for u, v, w, t in zip(outils.entiers(u_), outils.entiers(v_), outils.plat(w_), tt):
+            if isinstance(w, int) and 0 == t:
+                f = 0.0
+            else:
+                w, f = outils.ent(float(w + t))
+            chiffres = self._vers_chiffres(int(u), int(v), w)
+            if chiffres is None:
+                jj_ = self.date_vers_jj(Date(self, u, v, w, f))
+                tn.append(jj_.n)
+                tf.append(jj_.f)
+            else:
+                tn.append(directe(*chiffres))
+                tf.append(f)
+        return outils.colonne(u_, tn), outils.colonne(u_, tf, 'd')
+
+    def date_lot(self, n_, f_=None):
+        """date appliquée à des colonnes, sans créer de Jour julien ni de Date.
+        Entrée : La colonne des numéros de jour n et la colonne facultative f des fractions de jour.
+        Sortie : Les colonnes u, v, w (entiers, par exemple années, mois et jours) et t (fractions de jour, flottants)
+                 des dates, de même nature et de même forme que la colonne n.
+        REMARQUE : Comme pour un Jour julien, la partie entière des fractions est reportée sur les numéros de jour.
+                   Les calendriers qui ne définissent pas leurs chiffres passent par date, sans calcul par lot.
+        """
+        np_ = outils.numpy
+        inverse = self.compiler()[1]
+        chiffres_ = self._depuis_chiffres(inverse(0)) is not None
+        if np_ is not None and chiffres_:
+            jours = outils.entiers(n_)
+            if f_ is None:
+                t_ = np_.zeros(jours.shape)
+            else:
+                t_ = np_.asarray(f_, dtype=np_.float64)
+                k_ = np_.floor(t_)
+                jours, t_ = jours + k_.astype(np_.int64), t_ - k_
+            date = self._depuis_chiffres(self.inv_lot(jours))
+            return tuple(outils.colonne(n_, c_) for c_ in date) + (outils.colonne(n_, t_, 'd'),)
+        tu, tv, tw, tt = [], [], [], []
+        tf = itertools.repeat(0.0) if f_ is None else outils.plat(f_)
+        for n, f in zip(outils.entiers(n_), tf):
+            k, f = outils.ent(float(f))
+            if chiffres_:
+                date = self._depuis_chiffres(inverse(n + k))
+            else:
+                date = self.date(JourJulien(n + k, f))
+                date = date.u, int(date.v), date.w
+            tu.append(date[0])
+            tv.append(date[1])
+            tw.append(date[2])
+            tt.append(f)
+        return outils.colonne(n_, tu), outils.colonne(n_, tv), outils.colonne(n_, tw), outils.colonne(n_, tt, 'd')
+
     # TODO: formatage d'une date selon le calendrier
     # def format(self, jj):
     #    raise NotImplementedError("Méthode non implémentée.")
@@ -418,6 +673,9 @@ class Calendrier(fqa.Base):
 class _CalendrierGre(Calendrier):
     """Calendrier grégorien [année, mois, jour]."""
 
+    # Cycle de 400 ans
+    _CYCLE = (146097, 400)
+
     def __init__(self):
         super().__init__([
             fqa.Fqa(146097, 4, 6884480),
@@ -435,7 +693,7 @@ class _CalendrierGre(Calendrier):
         a_, m_ = _norm_am(date.u, date.v)
         d_, t = date.w, date.t
         c_, b_ = outils.divent(a_, 100)
-        n_ = super().__call__([c_, b_, m_, d_])
+        n_ = self.compiler()[0](c_, b_, m_, d_)
         jj_ = JourJulien(n_, t)
         return jj_
 
@@ -445,21 +703,38 @@ class _CalendrierGre(Calendrier):
         Erreur : Si le paramètre n'est pas un Jour julien.
         """
         assert isinstance(jj_, JourJulien)
-        dt_ = super().inv(jj_.n)
+        dt_ = self.compiler()[1](jj_.n)
         a_, m_ = _dnorm_am(100 * dt_[0] + dt_[1], dt_[2])
         j_ = dt_[3]
         return Date(self, a_, Mois(m_), j_, jj_.f)
 
+    def _vers_chiffres(self, u_, v_, w_):
+        # Siècle, année dans le siècle, mois (de 3 à 14) et jour : normalisation de _norm_am.
+        k_ = (v_ - 3) // 12
+        a_ = u_ + k_
+        c_ = a_ // 100
+        return [c_, a_ - 100 * c_, v_ - 12 * k_, w_]
+
+    def _depuis_chiffres(self, chiffres):
+        # Normalisation de _dnorm_am.
+        c_, b_, m_, j_ = chiffres
+        k_ = (m_ - 1) // 12
+        return 100 * c_ + b_ + k_, m_ - 12 * k_, j_
+
     def __str__(self):
         return "CALENDRIER_GRE"
 
 
 CALENDRIER_GRE = _CalendrierGre()
+fqa.enregistrer_base("CALENDRIER_GRE", CALENDRIER_GRE, __name__)
 
 
 class _CalendrierJul(Calendrier):
     """Calendrier julien [année, mois, jour]."""
 
+    # Cycle de 4 ans
+    _CYCLE = (1461, 4)
+
     def __init__(self):
         super().__init__([
             fqa.Fqa(1461, 4, 6884472),
@@ -475,7 +750,7 @@ class _CalendrierJul(Calendrier):
         assert isinstance(date, Date)
         a_, m_ = _norm_am(date.u, date.v)
         d_, t_ = date.w, date.t
-        n_ = super().__call__([a_, m_, d_])
+        n_ = self.compiler()[0](a_, m_, d_)
         jj_ = JourJulien(n_, t_)
         return jj_
 
@@ -485,16 +760,28 @@ class _CalendrierJul(Calendrier):
         Erreur : Si le paramètre n'est pas un Jour julien.
         """
         assert isinstance(jj_, JourJulien)
-        dt_ = super().inv(jj_.n)
+        dt_ = self.compiler()[1](jj_.n)
         a_, m_ = _dnorm_am(dt_[0], dt_[1])
         j_ = dt_[2]
         return Date(self, a_, Mois(m_), j_, jj_.f)
 
+    def _vers_chiffres(self, u_, v_, w_):
+        # Année, mois (de 3 à 14) et jour : normalisation de _norm_am.
+        k_ = (v_ - 3) // 12
+        return [u_ + k_, v_ - 12 * k_, w_]
+
+    def _depuis_chiffres(self, chiffres):
+        # Normalisation de _dnorm_am.
+        a_, m_, j_ = chiffres
+        k_ = (m_ - 1) // 12
+        return a_ + k_, m_ - 12 * k_, j_
+
     def __str__(self):
         return "CALENDRIER_JUL"
 
 
 CALENDRIER_JUL = _CalendrierJul()
+fqa.enregistrer_base("CALENDRIER_JUL", CALENDRIER_JUL, __name__)
 
 
 class _CalendrierIsl(Calendrier):
@@ -515,7 +802,7 @@ class _CalendrierIsl(Calendrier):
         assert isinstance(date, Date)
         a_, m_ = _corr_am(date.u, date.v)
         d_, t_ = date.w, date.t
-        n_ = super().__call__([a_, m_, d_])
+        n_ = self.compiler()[0](a_, m_, d_)
         jj_ = JourJulien(n_, t_)
         return jj_
 
@@ -525,15 +812,205 @@ class _CalendrierIsl(Calendrier):
         Erreur : Si le paramètre n'est pas un Jour julien.
         """
         assert isinstance(jj_, JourJulien)
-        dt_ = super().inv(jj_.n)
+        dt_ = self.compiler()[1](jj_.n)
         a_, m_, j_ = dt_[0], dt_[1], dt_[2]
         return Date(self, a_, m_, j_, jj_.f)
 
+    def _vers_chiffres(self, u_, v_, w_):
+        # Année, mois (de 1 à 12) et jour : normalisation de _corr_am.
+        k_ = (v_ - 1) // 12
+        return [u_ + k_, v_ - 12 * k_, w_]
+
+    def _depuis_chiffres(self, chiffres):
+        return tuple(chiffres)
+
     def __str__(self):
         return "CALENDRIER_ISL"
 
 
 CALENDRIER_ISL = _CalendrierIsl()
+fqa.enregistrer_base("CALENDRIER_ISL", CALENDRIER_ISL, __name__)
+
+
+# Fonctions de conversion déjà construites (voir _conversion) : (id(source), id(cible)) -> (fonction directe
+# de source, fonction inverse de cible, fonction de conversion).
+# Fonctions de conversion des couples de calendriers les plus récemment utilisés (voir _conversion).
+_CONVERSIONS = collections.OrderedDict()
+_TAILLE_CONVERSIONS = 64
+
+
+def _conversion(source, cible):
+    # Fonction de conversion (u, v, w) -> (u, v, w) du calendrier source vers le calendrier cible, construite une fois
+    # par couple de calendriers. Elle est reconstruite si l'un des calendriers a été modifié depuis (voir
+    # fqa.Base.compiler) : les fonctions compilées conservées dans _CONVERSIONS servent de témoin.
+    # REMARQUE : Les calendriers ne sont pas hachables (voir fqa.Base.__eq__) : la clef est le couple de leurs id,
+    #            et chaque entrée conserve les calendriers eux-mêmes pour qu'un id ne puisse être réutilisé tant
+    #            qu'elle existe. Seules les _TAILLE_CONVERSIONS entrées les plus récemment utilisées sont conservées.
+    directe, inverse = source.compiler()[0], cible.compiler()[1]
+    clef = id(source), id(cible)
+    entree = _CONVERSIONS.get(clef)
+    if entree is not None and entree[2] is directe and entree[3] is inverse:
+        _CONVERSIONS.move_to_end(clef)
+        return entree[4]
+    vers, depuis = source._vers_chiffres, cible._depuis_chiffres
+    if vers(0, 1, 1) is None or depuis(inverse(0)) is None:
+        def conversion(u_, v_, w_):
+            date = cible.date(source.date_vers_jj(Date(source, u_, v_, w_)))
+            return date.u, int(date.v), date.w
+    else:
+        def conversion(u_, v_, w_):
+            return depuis(inverse(directe(*vers(u_, v_, w_))))
+    _CONVERSIONS[clef] = source, cible, directe, inverse, conversion
+    _CONVERSIONS.move_to_end(clef)
+    if _TAILLE_CONVERSIONS < len(_CONVERSIONS):
+        _CONVERSIONS.popitem(last=False)
+    return conversion
+
+
+def convertir(source, cible, u_, v_, w_):
+    """Conversion d'une date d'un calendrier dans un autre sans créer de Date ni de Jour julien.
+    Entrée : Les calendriers source et cible, la date entière u, v, w (par exemple année, mois, jour) dans source.
+    Sortie : Le triplet d'entiers (u, v, w) de la même date dans cible.
+    REMARQUE : Le calcul ne porte que sur les chiffres entiers des bases des calendriers (voir
+               Calendrier._vers_chiffres) ; la fonction de chaque couple de calendriers est construite une seule fois.
+    """
+    return _conversion(source, cible)(u_, v_, w_)
+
+
+def convertir_lot(source, cible, u_, v_, w_):
+    """convertir appliquée à des colonnes.
+    Entrée : Les calendriers source et cible, les colonnes d'entiers u, v, w (array.array, memoryview, tableaux NumPy
+             ou séquences) des dates dans source.
+    Sortie : Les colonnes u, v, w des mêmes dates dans cible, de même nature et de même forme que la colonne u.
+    """
+    np_ = outils.numpy
+    if np_ is not None:
+        chiffres = source._vers_chiffres(outils.entiers(u_), outils.entiers(v_), outils.entiers(w_))
+        if chiffres is not None:
+            date = cible._depuis_chiffres(cible.inv_lot(source.evaluer_lot(chiffres)))
+            if date is not None:
+                return tuple(outils.colonne(u_, c_) for c_ in date)
+    conversion = _conversion(source, cible)
+    tu, tv, tw = [], [], []
+    for u, v, w in zip(outils.entiers(u_), outils.entiers(v_), outils.entiers(w_)):
+        u, v, w = conversion(int(u), int(v), int(w))
+        tu.append(u)
+        tv.append(v)
+        tw.append(w)
+    return outils.colonne(u_, tu), outils.colonne(u_, tv), outils.colonne(u_, tw)
+
+
+# Index des jours (voir ecrire_index et IndexJours) : en-tête b"FQJ", version, premier jour, nombre de jours,
+# puis un enregistrement de taille fixe par jour : année (entier 32 bits signé), mois et jour (octets) des calendriers
+# grégorien, julien et musulman puis le jour de la semaine (0 pour le lundi), le tout petit-boutiste.
+_INDEX_ENTETE = struct.Struct("<3sBqq")
+_INDEX_VERSION = 1
+_INDEX_ENREGISTREMENT = struct.Struct("<iBBiBBiBBB")
+_INDEX_CALENDRIERS = (CALENDRIER_GRE, CALENDRIER_JUL, CALENDRIER_ISL)
+
+
+def ecrire_index(fichier, debut, fin, taille_morceau=65536):
+    """Écriture du fichier d'index des jours lu par IndexJours.
+    Entrée : Le chemin du fichier, les numéros du premier jour debut et du jour fin (exclu) de l'index,
+             et le nombre de jours calculés à la fois (voir Calendrier.date_lot).
+    Sortie : La taille du fichier en octets.
+    Erreur : ValueError si fin n'est pas strictement supérieur à debut.
+    """
+    if not fin > debut:
+        raise ValueError("fin n'est pas strictement supérieur à debut")
+    np_ = outils.numpy
+    if np_ is not None:
+        champs = [(nom + c_, code) for c_ in "gji" for nom, code in (("a", "<i4"), ("m", "u1"), ("j", "u1"))]
+        type_np = np_.dtype(champs + [("s", "u1")])
+        assert type_np.itemsize == _INDEX_ENREGISTREMENT.size
+    with open(fichier, "wb") as sortie:
+        sortie.write(_INDEX_ENTETE.pack(b"FQJ", _INDEX_VERSION, debut, fin - debut))
+        for d_ in range(debut, fin, taille_morceau):
+            ns = array.array('q', range(d_, min(d_ + taille_morceau, fin)))
+            colonnes = [c_ for cal in _INDEX_CALENDRIERS for c_ in cal.date_lot(ns)[:3]]
+            if np_ is not None:
+                enregistrements = np_.empty(len(ns), dtype=type_np)
+                for nom, c_ in zip(type_np.names, colonnes):
+                    enregistrements[nom] = c_
+                enregistrements["s"] = np_.asarray(ns) % 7
+                sortie.write(enregistrements.tobytes())
+            else:
+                colonnes.append([n % 7 for n in ns])
+                sortie.write(b"".join(_INDEX_ENREGISTREMENT.pack(*e_) for e_ in zip(*colonnes)))
+        return sortie.tell()
+
+
+class IndexJours:
+    """Lecture du fichier d'index des jours écrit par ecrire_index.
+    Le fichier est projeté en mémoire (mmap) : tous les processus qui l'ouvrent partagent les mêmes pages
+    et la lecture d'un jour est la lecture d'un enregistrement à une position calculée.
+    """
+
+    def __init__(self, fichier):
+        """Entrée : Le chemin du fichier d'index.
+        Sortie : L'index, à fermer après usage (fermer ou with).
+        Erreur : ValueError si le fichier n'est pas un index dans un format reconnu.
+        """
+        self._mmap = None
+        with open(fichier, "rb") as entree:
+            entree.seek(0, 2)
+            if entree.tell() < _INDEX_ENTETE.size:
+                raise ValueError("Format inconnu")
+            self._mmap = mmap.mmap(entree.fileno(), 0, access=mmap.ACCESS_READ)
+        entete, version, self.debut, nombre = _INDEX_ENTETE.unpack_from(self._mmap)
+        if b"FQJ" != entete or _INDEX_VERSION != version:
+            self.fermer()
+            raise ValueError("Format ou version de format inconnu")
+        if len(self._mmap) != _INDEX_ENTETE.size + nombre * _INDEX_ENREGISTREMENT.size:
+            self.fermer()
+            raise ValueError("Données tronquées")
+        self.fin = self.debut + nombre
+
+    def __len__(self):
+        return self.fin - self.debut
+
+    def __contains__(self, n_):
+        return self.debut <= n_ < self.fin
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fermer()
+
+    def fermer(self):
+        """Fermeture de la projection du fichier."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def enregistrement(self, n_):
+        """Entrée : Un numéro de jour entier n.
+        Sortie : Le tuple (année, mois, jour grégoriens, année, mois, jour juliens, année, mois, jour musulmans,
+                 jour de la semaine) du jour n.
+        Erreur : IndexError si le jour n'est pas dans l'index.
+        """
+        if not self.debut <= n_ < self.fin:
+            raise IndexError("Jour hors de l'index : {}".format(n_))
+        return _INDEX_ENREGISTREMENT.unpack_from(
+            self._mmap, _INDEX_ENTETE.size + (n_ - self.debut) * _INDEX_ENREGISTREMENT.size)
+
+    def date(self, calendrier, jj_):
+        """Entrée : Le calendrier (CALENDRIER_GRE, CALENDRIER_JUL ou CALENDRIER_ISL) et un Jour julien.
+        Sortie : La même Date que calendrier.date(jj).
+        Erreur : ValueError si le calendrier n'est pas dans l'index, IndexError si le jour n'y est pas.
+        """
+        for i_, cal in enumerate(_INDEX_CALENDRIERS):
+            if cal is calendrier:
+                e_ = self.enregistrement(jj_.n)
+                return Date(calendrier, e_[3 * i_], e_[3 * i_ + 1], e_[3 * i_ + 2], jj_.f)
+        raise ValueError("Calendrier absent de l'index : {}".format(calendrier))
+
+    def jour_semaine(self, n_):
+        """Entrée : Un numéro de jour entier n.
+        Sortie : Le jour de la semaine (Jours) du jour n.
+        """
+        return Jours(self.enregistrement(n_)[9])
 
 
 if "__main__" == __name__:
@@ -627,4 +1104,3 @@ if "__main__" == __name__:
     print()
     print(Jours.LUNDI, repr(Jours.LUNDI))
     print(Days.MONDAY, repr(Days.MONDAY))
-
@@ -12,117 +12,338 @@ Bibliographie.
     [5] "Interprétation géométrique de l'algorithme d'Euclide et reconnaissance de segments"
     (Albert TROESCH, Theoretical Computer Science 115 (1993) 291-319)
         disponible sur https://www.sciencedirect.com/science/article/pii/0304397593901219
+    [6] 'A linear algorithm for segmentation of digital curves'
+    (Isabelle DEBLED-RENNESSON et Jean-Pierre REVEILLÈS, International Journal of Pattern Recognition
+    and Artificial Intelligence, vol. 9 n° 4, 1995, p. 635-662)
 """
 
 # ATTENTION : La conversion systématique (et normalement silencieuse) des paramètres des fonctions
 #             au types attendus est faite par parti-pris.
 
 import array
+import collections
+import concurrent.futures
+import functools
+import importlib
+import itertools
+import operator
+import sqlite3
+import struct
+import sys
+
 from . import outils
 
 
-def reconnaissance(liste_codes):
+def _divent_lot(n_, d_):
+    # Quotient de outils.divent(n, d) pour un entier ou un tableau NumPy n et un entier d non nul.
+    # ATTENTION : Les tableaux NumPy sont en entiers 64 bits, sans contrôle de dépassement (voir _borne_lot).
+    return n_ // d_ if 0 < d_ else -(n_ // -d_)
+
+
+# Plus grande valeur absolue des calculs par lot faits par NumPy (entiers 64 bits signés).
+_BORNE_LOT = 2 ** 63 - 1
+
+
+def _borne_lot(x_, a_, c_, d_=1):
+    # Majorant (entier Python exact) de |a * x + c| pour tout x du tableau NumPy x_ d'entiers 64 bits,
+    # ainsi que des coefficients a, c et du diviseur d qui doivent eux aussi être des entiers 64 bits.
+    # Les calculs par lot ne sont faits par NumPy que si les majorants de leurs résultats intermédiaires
+    # ne dépassent pas _BORNE_LOT, sinon ils sont faits en entiers Python.
+    m_ = max(abs(int(x_.min())), abs(int(x_.max()))) if x_.size else 0
+    return max(abs(a_) * m_ + abs(c_), abs(a_), abs(d_))
+
+
+def _reduction(tl, valeurs):
+    # Algorithme décrit dans [3] et [5] : reconnaissance.
+    # Entrée : un tableau tl de codes non tous égaux et l'ensemble de ses valeurs.
+    # Sortie : le tableau des longueurs des paliers et les paramètres p, g, complement de la réduction.
+    p_ = min(valeurs)
+    # transvection : les codes diminués de p doivent valoir 0 ou 1
+    # En cas d'erreur, le dernier code peut être ignoré si c'est le plus petit
+    # REMARQUE : len(tl) >= 2 obligatoirement car les codes ne sont pas tous égaux.
+    #            On peut donc retirer sans risque un élément si nécessaire.
+    if (2 < len(valeurs) or 1 < max(valeurs) - p_) and tl[-1] == p_:
+        tl = tl[:-1]
+        valeurs = set(tl)
+        p_ = min(valeurs)
+    if 2 < len(valeurs) or 1 < max(valeurs) - p_:
+        raise ValueError("Liste de codes invalide")
+    # Les codes valant p ou p + 1, leurs octets de poids faible suffisent à les distinguer.
+    octets = tl.tobytes()
+    if "little" == sys.byteorder:
+        octets = octets[::tl.itemsize]
+    else:
+        octets = octets[tl.itemsize - 1::tl.itemsize]
+    table = bytearray(256)
+    table[(p_ + 1) & 0xFF] = 1
+    sc = octets.translate(table)
+    # complémentation (si 1 n'est pas le caractère isolé)
+    complement_ = b"\x01\x01" in sc
+    # caractère isolé
+    ci = 0 if complement_ else 1
+    # le palier terminal est complet (dp=0) s'il s'achève par le caractère isolé
+    dp = 0 if sc[-1] == ci else 1
+    # symétrie (longueurs des paliers caractère isolé inclus)
+    tl_ = array.array('l', map((1).__add__, map(len, sc[:len(sc) - 1 + dp].split(bytes((ci,))))))
+    # plus petit palier
+    # REMARQUE : si le dernier palier est complet (dp=0) il faut le prendre en considération
+    if 1 + dp < len(tl_):
+        # plus petit palier interne incluant éventuellement le dernier s'il est complet (dp=0)
+        mini = min(tl_[1:len(tl_) - dp])
+    else:
+        # sinon le plus petit palier externe
+        mini = min(tl_)
+    # translation
+    g_ = 0
+    # suppression du premier palier s'il est plus petit ou égal au mini
+    if 1 < len(tl_) and tl_[0] <= mini:
+        g_ = tl_[0]
+        del tl_[0]
+    # suppression du dernier palier s'il est plus petit ou égal au mini et s'il n'est pas complet (dp=1)
+    if 1 < len(tl_) and tl_[-1] <= mini and 1 == dp:
+        del tl_[-1]
+    return tl_, p_, g_, complement_
+
+
+def _ajout_plage(vs_, ns_):
+    # Codage par plages : fonction d'ajout de n_ éléments de valeur v_ à la fin des plages (vs_, ns_).
+    def ajouter(v_, n_):
+        if 0 < n_:
+            if vs_ and vs_[-1] == v_:
+                ns_[-1] += n_
+            else:
+                vs_.append(v_)
+                ns_.append(n_)
+    return ajouter
+
+
+def _plages(paires):
+    # Codage par plages normalisé : deux listes (valeurs, nombres), sans plage vide ni plages consécutives égales.
+    vs_, ns_ = [], []
+    ajouter = _ajout_plage(vs_, ns_)
+    for v_, n_ in paires:
+        n_ = int(n_)
+        if 0 > n_:
+            raise ValueError("Nombre de répétitions négatif")
+        ajouter(int(v_), n_)
+    return vs_, ns_
+
+
+def _reduction_plages(vs, ns, valeurs):
+    # Algorithme décrit dans [3] et [5] : reconnaissance sur des codes codés par plages.
+    # Entrée : les valeurs vs et les nombres ns des plages de codes non tous égaux et l'ensemble des valeurs.
+    # Sortie : les plages des longueurs des paliers et les paramètres p, g, complement de la réduction.
+    # REMARQUE : Traduction de _reduction dont les résultats sont identiques à ceux obtenus sur les codes développés.
+    p_ = min(valeurs)
+    # En cas d'erreur, le dernier code peut être ignoré si c'est le plus petit
+    if (2 < len(valeurs) or 1 < max(valeurs) - p_) and vs[-1] == p_:
+        vs, ns = vs[:], ns[:]
+        ns[-1] -= 1
+        if 0 == ns[-1]:
+            del vs[-1], ns[-1]
+        valeurs = set(vs)
+        p_ = min(valeurs)
+    if 2 < len(valeurs) or 1 < max(valeurs) - p_:
+        raise ValueError("Liste de codes invalide")
+    # complémentation (si p + 1 n'est pas le code isolé) : les plages consécutives étant distinctes,
+    # il suffit qu'une plage de p + 1 contienne au moins deux codes.
+    complement_ = any(v_ != p_ and 1 < n_ for v_, n_ in zip(vs, ns))
+    # code isolé
+    ci = p_ if complement_ else p_ + 1
+    # le palier terminal est complet (dp=0) s'il s'achève par le code isolé
+    dp = 0 if vs[-1] == ci else 1
+    # longueurs des paliers (caractère isolé inclus) : chaque code isolé clôt un palier,
+    # une plage de n codes isolés clôt donc un palier puis n - 1 paliers de longueur 1.
+    tv, tn = [], []
+    ajouter = _ajout_plage(tv, tn)
+    longueur = 0
+    dernier = len(vs) - 1
+    for i, (v_, n_) in enumerate(zip(vs, ns)):
+        if i == dernier:
+            n_ -= 1 - dp
+        if v_ != ci:
+            longueur += n_
+        elif 0 < n_:
+            ajouter(longueur + 1, 1)
+            ajouter(1, n_ - 1)
+            longueur = 0
+    ajouter(longueur + 1, 1)
+    total = sum(tn)
+    # plus petit palier (voir _reduction)
+    if 1 + dp < total:
+        nombres = tn[:]
+        nombres[0] -= 1
+        nombres[-1] -= dp
+        mini = min(v_ for v_, n_ in zip(tv, nombres) if 0 < n_)
+    else:
+        mini = min(tv)
+    # translation
+    g_ = 0
+    # suppression du premier palier s'il est plus petit ou égal au mini
+    if 1 < total and tv[0] <= mini:
+        g_ = tv[0]
+        tn[0] -= 1
+        if 0 == tn[0]:
+            del tv[0], tn[0]
+        total -= 1
+    # suppression du dernier palier s'il est plus petit ou égal au mini et s'il n'est pas complet (dp=1)
+    if 1 < total and tv[-1] <= mini and 1 == dp:
+        tn[-1] -= 1
+        if 0 == tn[-1]:
+            del tv[-1], tn[-1]
+    return tv, tn, p_, g_, complement_
+
+
+def _restitution(a_, b_, r_, p_, g_, complement_):
+    # Algorithme décrit dans [3] et [5] : restitution à rebours des paramètres a, b et r.
+    ap, bp, rp = b_, a_, b_ - r_ - 1
+    # translation
+    if 0 < g_:
+        rp -= ap * g_ - bp
+    # complémentation : x' = x ; y' = x - y
+    if complement_:
+        ap, bp, rp = bp - ap, bp, bp - rp - 1
+    # transvection : x' = x ; y' = y - px
+    ap, bp, rp = ap + p_ * bp, bp, rp
+    return ap, bp, rp
+
+
+def reconnaissance(liste_codes, plages=False):
     """Reconnaissance des codes.
     Entrée : Une liste d'entiers (codes).
+           : plages, si vrai, les codes sont codés par plages : liste_codes est une suite de couples
+             (code, nombre de répétitions), par exemple [(365, 3), (366, 1)] pour [365, 365, 365, 366].
     Sortie : Les caractéristiques a, b, r de la forme quasi affine.
-    Erreur : ValueError si les codes ne sont pas ceux d'un segment de droite discrète.
+    Erreur : ValueError si les codes ne sont pas ceux d'un segment de droite discrète
+             ou s'il n'y a aucun code (plages toutes vides comprises).
     Références [3] et [5].
+    REMARQUE : Les réductions successives sont faites itérativement sur des tableaux d'entiers
+               (longueurs des paliers) et des octets (codes transvectés), leurs paramètres sont
+               empilés puis dépilés pour la restitution de a, b et r.
+               Le coût de la reconnaissance de codes codés par plages est proportionnel au nombre de plages
+               et non au nombre de codes : il n'est intéressant que si les plages sont longues.
     """
-    def reduction(lc):
-        # Algorithme décrit dans [3] et [5] : reconnaissance.
-        p_ = min(lc)
-        # transvection
-        sc = "".join(
-            map(lambda c_: {True: str, False: lambda c__: "*"}[c_ in [0, 1]](c_), list(map(lambda c__: c__ - p_, lc))))
-        # En cas d'erreur, le dernier code peut être ignoré si c'est le plus petit
-        # REMARQUE : len(lc) >= 2 obligatoirement car il y a au minimum un "0" et une "*".
-        #            On peut donc retirer sans risque un élément si nécessaire.
-        if "*" in sc and lc[-1] == p_:
-            p_ = min(lc[:-1])
-            sc = "".join(map(lambda c_: {True: str, False: lambda c__: "*"}[c_ in [0, 1]](c_),
-                             list(map(lambda c_: c_ - p_, lc[:-1]))))
-        if "*" in sc:
-            raise ValueError("Liste de codes invalide")
-        # complémentation (si "1" n'est pas le caractère isolé)
-        complement_ = "11" in sc
-        # caractère isolé
-        ci = {True: "0", False: "1"}[complement_]
-        # le palier terminal est complet (dp=0) s'il s'achève par le caractère isolé (sc[-1] == ci)
-        dp = 0 if sc[-1] == ci else 1
-        # symétrie (longueurs des paliers caractère isolé inclus)
-        tl_ = [len(c_) + 1 for c_ in sc[:len(sc) - 1 + dp].split(ci)]
-        # plus petit palier
-        # REMARQUE : si le dernier palier est complet (dp=0) il faut le prendre en considération
-        if 1 + dp < len(tl_):
-            # plus petit palier interne incluant éventuellement le dernier s'il est complet (dp=0)
-            mini = min(tl_[1:len(tl_) - dp])
-        else:
-            # sinon le plus petit palier externe
-            mini = min(tl_)
-        # translation
-        g_ = 0
-        # suppression du premier palier s'il est plus petit ou égal au mini
-        if 1 < len(tl_) and tl_[0] <= mini:
-            g_ = tl_[0]
-            del tl_[0]
-        # suppression du dernier palier s'il est plus petit ou égal au mini et s'il n'est pas complet (dp=1)
-        if 1 < len(tl_) and tl_[-1] <= mini and 1 == dp:
-            del tl_[-1]
-        return tl_, p_, g_, complement_
-
-    def restitution(a_, b_, r_, p_, g_, complement_):
-        # Algorithme décrit dans [3] et [5] : restitution à rebours des paramètres a, b et r.
-        ap, bp, rp = b_, a_, b_ - r_ - 1
-        # translation
-        if 0 < g_:
-            rp -= ap * g_ - bp
-            # rp = (rp - ap * g_) % bp
-        # complémentation : x' = x ; y' = x - y
-        if complement_:
-            ap, bp, rp = bp - ap, bp, bp - rp - 1
-        # transvection : x' = x ; y' = y - px
-        ap, bp, rp = ap + p_ * bp, bp, rp
-        return ap, bp, rp
-
+    if plages:
+        vs_, ns_ = _plages(liste_codes)
+        if 0 == len(vs_):
+            raise ValueError("Liste de codes vide")
+        return _reconnaissance_plages(vs_, ns_)
     assert 0 < len(liste_codes)
     tl = array.array('l', liste_codes)
+    valeurs = set(tl)
+    pile = []
     # REMARQUE : le critère d'arrêt peut être différent, par exemple 'if 1 == len(tl):', mais ne donne pas toujours les
     # mêmes résultats bien que ceux obtenus restent conforment dans la mesure où ils représentent toujours le même
     # segment de droite discrète.
     # critère d'arrêt
-    if min(tl) == max(tl):
-        a, b, r = tl[0], 1, 0
-    else:
-        tl, p, g, complement = reduction(tl)
-        # appels récursifs qui se terminent ci-dessus (critère d'arrêt).
-        a, b, r = reconnaissance(tl)
-        # les appels récursifs sont dépilés ici.
-        a, b, r = restitution(a, b, r, p, g, complement)
+    while 1 < len(valeurs):
+        tl, p, g, complement = _reduction(tl, valeurs)
+        pile.append((p, g, complement))
+        valeurs = set(tl)
+    a, b, r = tl[0], 1, 0
+    # les réductions sont dépilées ici.
+    while pile:
+        a, b, r = _restitution(a, b, r, *pile.pop())
     return a, b, r
 
 
-def codes(liste_codes, x0_=0, y0_=0):
+def _reconnaissance_plages(vs, ns):
+    # Reconnaissance des codes codés par plages (voir reconnaissance).
+    assert 0 < len(vs)
+    valeurs = set(vs)
+    pile = []
+    while 1 < len(valeurs):
+        vs, ns, p, g, complement = _reduction_plages(vs, ns, valeurs)
+        pile.append((p, g, complement))
+        valeurs = set(vs)
+    a, b, r = vs[0], 1, 0
+    while pile:
+        a, b, r = _restitution(a, b, r, *pile.pop())
+    return a, b, r
+
+
+def codes(liste_codes, x0_=0, y0_=0, plages=False):
     """Reconnaissance des codes.
     Entrée : Une liste d'entiers (codes).
            : Les valeurs initiales x0_ et y0_ nulles par défaut.
+           : plages, si vrai, les codes sont codés par plages (voir reconnaissance).
     Sortie : La forme quasi affine correspondant aux codes et aux valeurs initiales fournies.
-    Erreur : ValueError si les codes ne sont pas ceux d'un segment de droite discrète.
+    Erreur : ValueError si les codes ne sont pas ceux d'un segment de droite discrète
+             (voir prefixe_valide pour localiser le premier code incompatible).
     Références : [3] et [5] pour les détails.
     """
-    a, b, r = reconnaissance(liste_codes)
+    a, b, r = reconnaissance(liste_codes, plages)
     r += b * int(y0_) - a * int(x0_)
     return Fqa(a=a, b=b, r=r)
 
 
-class Fqa:
-    """Forme quasi affine."""
+def _codes_morceau(morceau, plages=False):
+    # Reconnaissance d'un morceau de codes_lot : liste de triplets (codes, x0, y0).
+    # Sortie : la liste des caractéristiques (a, b, r) ou de l'exception levée pour chaque suite de codes.
+    # REMARQUE : Des triplets d'entiers plutôt que des Fqa sont renvoyés par les processus pour alléger les échanges.
+    resultats = []
+    for liste_codes, x0_, y0_ in morceau:
+        try:
+            if 0 == len(liste_codes):
+                raise ValueError("Liste de codes vide")
+            a, b, r = reconnaissance(liste_codes, plages)
+            resultats.append((a, b, r + b * int(y0_) - a * int(x0_)))
+        except (ValueError, TypeError, OverflowError) as erreur:
+            resultats.append(erreur)
+    return resultats
+
+
+def codes_lot(sequences, x0s=None, y0s=None, workers=1, taille_morceau=None, plages=False):
+    """Reconnaissance d'un lot de suites de codes indépendantes.
+    Entrée : Une suite de listes d'entiers (codes).
+           : Les suites x0s et y0s des valeurs initiales de chaque liste (nulles par défaut).
+           : workers le nombre de processus (les reconnaissances sont faites dans le processus courant si workers <= 1).
+           : taille_morceau le nombre de listes traitées par tâche (par défaut, environ quatre tâches par processus).
+           : plages, si vrai, les codes sont codés par plages (voir reconnaissance).
+    Sortie : La liste, dans l'ordre des suites de codes, des formes quasi affines correspondantes.
+             Une suite de codes invalide est signalée par l'exception (ValueError, TypeError ou OverflowError)
+             qui aurait été levée, à sa place dans la liste, sans interrompre le traitement du lot.
+    REMARQUE : Les suites de codes sont regroupées en morceaux afin de limiter le coût de chaque tâche
+               (sérialisation et échanges entre processus).
+    """
+    sequences = list(sequences)
+    x0s = itertools.repeat(0) if x0s is None else x0s
+    y0s = itertools.repeat(0) if y0s is None else y0s
+    triplets = list(zip(sequences, x0s, y0s))
+    if len(triplets) != len(sequences):
+        raise ValueError("Valeurs initiales manquantes")
+    workers = int(workers)
+    if taille_morceau is None:
+        taille_morceau = max(1, -(-len(triplets) // (4 * max(1, workers))))
+    taille_morceau = int(taille_morceau)
+    assert 0 < taille_morceau
+    morceaux = [triplets[i:i + taille_morceau] for i in range(0, len(triplets), taille_morceau)]
+    if 1 >= workers or 1 >= len(morceaux):
+        lots = map(_codes_morceau, morceaux, itertools.repeat(plages))
+        return [_fqa_resultat(x) for lot in lots for x in lot]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(morceaux))) as executeur:
+        lots = executeur.map(_codes_morceau, morceaux, itertools.repeat(plages))
+        return [_fqa_resultat(x) for lot in lots for x in lot]
+
+
+def _fqa_resultat(x_):
+    # Forme quasi affine de caractéristiques x_ ou exception x_ (voir codes_lot).
+    return x_ if isinstance(x_, Exception) else Fqa(*x_)
+
+
+class Fqa(outils.Immuable):
+    """Forme quasi affine (immuable)."""
+
+    __slots__ = ("a", "b", "r")
 
     def __init__(self, a=0, b=1, r=0):
         """Forme quasi affine : y = Fqa(a,b,r)(x) = [(a * x + r) / b]
         Entrée : les caractéristiques a, b, r de la forme quasi affine.
         Sortie : La forme quasi affine Fqa.
         """
-        self.a, self.b, self.r = int(a), int(b), int(r)
+        object.__setattr__(self, "a", int(a))
+        object.__setattr__(self, "b", int(b))
+        object.__setattr__(self, "r", int(r))
 
     def __call__(self, n_):
         """Entrée : un entier n.
@@ -137,6 +358,9 @@ class Fqa:
             return False
         return self.a == autre.a and self.b == autre.b and self.r == autre.r
 
+    def __hash__(self):
+        return hash((self.a, self.b, self.r))
+
     def __repr__(self):
         return "Fqa(a={}, b={}, r={})".format(self.a, self.b, self.r)
 
@@ -155,6 +379,120 @@ class Fqa:
         r_ = n_ - self(q_)
         return q_, r_
 
+    def evaluer_lot(self, xs):
+        """Évaluation de la forme quasi affine sur toute une colonne d'entiers.
+        Entrée : Une colonne xs (array.array, memoryview ou tableau NumPy).
+        Sortie : La colonne des Fqa(a,b,r)(x) pour x dans xs, de même nature et de même forme que xs.
+        Erreur : OverflowError si une valeur de xs, ou un résultat pour une colonne array.array ou memoryview,
+                 dépasse les entiers 64 bits.
+        REMARQUE : NumPy est utilisé s'il est installé (calculs sur des entiers 64 bits) lorsque |a * x + r| ne peut
+                   pas dépasser 2**63 - 1, sinon le calcul est fait en un seul passage en entiers Python
+                   (sur un array.array('l') sans NumPy). Avec NumPy, un résultat hors des entiers 64 bits
+                   donne un tableau d'objets (entiers Python).
+        """
+        a_, b_, r_ = self.a, self.b, self.r
+        x_ = outils.entiers(xs)
+        if outils.numpy is not None:
+            if _borne_lot(x_, a_, r_, b_) <= _BORNE_LOT:
+                return outils.colonne(xs, _divent_lot(a_ * x_ + r_, b_))
+            x_ = x_.ravel().tolist()
+        if 0 < b_:
+            q_ = ((a_ * x + r_) // b_ for x in x_)
+        else:
+            b_ = -b_
+            q_ = (-((a_ * x + r_) // b_) for x in x_)
+        return outils.colonne(xs, q_)
+
+    def divfqa_lot(self, ns):
+        """divfqa appliquée à toute une colonne d'entiers.
+        Entrée : Une colonne ns (array.array, memoryview ou tableau NumPy).
+        Sortie : La colonne des "quotients" et la colonne des "restes" (voir divfqa),
+                 de même nature et de même forme que ns.
+        Erreur : Comme pour evaluer_lot.
+        REMARQUE : Comme pour evaluer_lot, NumPy n'est utilisé que si les résultats intermédiaires
+                   (majorés par (|b| + 1) * |n| + |b - r - 1| + |a| + |r|) ne peuvent pas dépasser 2**63 - 1.
+        """
+        a_, b_, r_ = self.a, self.b, self.r
+        n_ = outils.entiers(ns)
+        if outils.numpy is not None:
+            if _borne_lot(n_, abs(b_) + 1, abs(b_ - r_ - 1) + abs(a_) + abs(r_), a_) <= _BORNE_LOT:
+                q_ = _divent_lot(b_ * n_ + (b_ - r_ - 1), a_)
+                return outils.colonne(ns, q_), outils.colonne(ns, n_ - _divent_lot(a_ * q_ + r_, b_))
+            n_ = n_.ravel().tolist()
+        tq, tr = [], []
+        for n in n_:
+            q = _divent_lot(b_ * n + b_ - r_ - 1, a_)
+            tq.append(q)
+            tr.append(n - _divent_lot(a_ * q + r_, b_))
+        return outils.colonne(ns, tq), outils.colonne(ns, tr)
+
+    def parcourir(self, x0_, x1_):
+        """Parcours incrémental de la forme quasi affine (sans division).
+        Entrée : Les bornes x0 et x1 (incluses) de l'intervalle parcouru.
+        Sortie : Un générateur des couples (x, Fqa(a,b,r)(x)) pour x0 <= x <= x1.
+        REMARQUE : Seul le premier point nécessite une division, les suivants sont obtenus
+                   en faisant avancer le reste courant par additions et comparaisons.
+        """
+        x0_, x1_ = int(x0_), int(x1_)
+        b_ = self.b
+        signe = 0 < b_
+        if not signe:
+            b_ = -b_
+        # Fqa(a,b,r)(x) = q (ou -q si b < 0) avec a * x + r = q * |b| + reste et 0 <= reste < |b|
+        q_, reste = divmod(self.a * x0_ + self.r, b_)
+        dq, dr = divmod(self.a, b_)
+        for x_ in range(x0_, x1_ + 1):
+            yield x_, q_ if signe else -q_
+            q_ += dq
+            reste += dr
+            if reste >= b_:
+                reste -= b_
+                q_ += 1
+
+    def tabuler(self, x0_, x1_):
+        """Valeurs de la forme quasi affine calculées incrémentalement (voir parcourir).
+        Entrée : Les bornes x0 et x1 (incluses) de l'intervalle.
+        Sortie : Un array.array('l') contenant Fqa(a,b,r)(x) pour x0 <= x <= x1.
+        """
+        return array.array('l', (y_ for _, y_ in self.parcourir(x0_, x1_)))
+
+    def somme(self, x0_, x1_):
+        """Somme des valeurs de la forme quasi affine sur un intervalle.
+        Entrée : Les bornes x0 et x1 (incluses) de l'intervalle.
+        Sortie : La somme des Fqa(a,b,r)(x) pour x0 <= x <= x1 (0 si l'intervalle est vide).
+        REMARQUE : Le calcul est exact et se fait en O(log max(|a|, |b|)) quelle que soit
+                   la taille de l'intervalle (voir outils.somme_plancher).
+        """
+        x0_, x1_ = int(x0_), int(x1_)
+        if x0_ > x1_:
+            return 0
+        if 0 < self.b:
+            return outils.somme_plancher(x1_ - x0_ + 1, self.b, self.a, self.a * x0_ + self.r)
+        return -outils.somme_plancher(x1_ - x0_ + 1, -self.b, self.a, self.a * x0_ + self.r)
+
+    def points(self, x0_, x1_, y0_=0):
+        """Nombre de points entiers situés sous le segment de droite discrète.
+        Entrée : Les bornes x0 et x1 (incluses) de l'intervalle et l'ordonnée minimale y0 (nulle par défaut).
+        Sortie : Le nombre de points entiers (x, y) tels que x0 <= x <= x1 et y0 <= y <= Fqa(a,b,r)(x).
+        REMARQUE : La forme quasi affine étant monotone, les x tels que Fqa(a,b,r)(x) >= y0 forment
+                   une demi-droite obtenue directement, le calcul se ramène donc à somme.
+        """
+        x0_, x1_, y0_ = int(x0_), int(x1_), int(y0_)
+        # Fqa(a,b,r)(x) >= y0 équivaut à a_ * x >= k_
+        if 0 < self.b:
+            a_, k_ = self.a, y0_ * self.b - self.r
+        else:
+            a_, k_ = -self.a, self.r + 1 + (1 - y0_) * self.b
+        if 0 < a_:
+            x0_ = max(x0_, -(-k_ // a_))
+        elif 0 > a_:
+            x1_ = min(x1_, k_ // a_)
+        elif 0 < k_:
+            return 0
+        if x0_ > x1_:
+            return 0
+        return self.somme(x0_, x1_) - (y0_ - 1) * (x1_ - x0_ + 1)
+
     def inv(self):
         """Forme quasi affine inverse : x = Fqa(a,b,r).inv()(y) = [(b * y + b - r - 1) / a].
         Entrée : Aucun paramètre.
@@ -163,6 +501,339 @@ class Fqa:
         return Fqa(self.b, self.a, self.b - self.r - 1)
 
 
+class ReconnaissanceIncrementale:
+    """Reconnaissance incrémentale (en ligne) d'un segment de droite discrète.
+    Les codes sont ajoutés un à un à la fin et retirés un à un au début, chaque opération met à jour
+    les caractéristiques en O(1).
+    Référence : [6] (algorithme arithmétique de reconnaissance des segments naïfs).
+    REMARQUE : Après transvection par le plus petit code p, les points (x, y) du segment vérifient
+               mu <= a * x - b * y < mu + b.
+               Les points d'appui supérieurs (a * x - b * y = mu) et inférieurs (a * x - b * y = mu + b - 1)
+               extrêmes suffisent à faire évoluer a, b et mu lorsqu'un point est faiblement extérieur.
+               Les caractéristiques sont minimales tant qu'il y a au moins deux points d'appui supérieurs
+               ou deux points d'appui inférieurs.
+    ATTENTION : Contrairement à reconnaissance, un dernier code plus petit que les autres n'est pas toléré.
+    """
+
+    def __init__(self):
+        """Sortie : Une reconnaissance sans aucun code."""
+        self.rupture = None
+        self._n = 0
+        self._codes = collections.deque()
+        self._vider(0, 0)
+
+    def _vider(self, x_, y_):
+        # Segment réduit au point (x_, y_) (ordonnée non transvectée), la transvection sera fixée par le prochain code.
+        self._p = None
+        self._x0, self._y0 = x_, y_
+        self._y = y_
+        self._a, self._b, self._mu = 0, 1, -y_
+        # points d'appui supérieurs (premier et dernier) et inférieurs (premier et dernier)
+        self._u = self._ud = self._l = self._ld = (x_, y_)
+
+    def _transvecter(self, k_):
+        # Transvection supplémentaire y' = y - k_ * x de tous les points conservés, mu est inchangé.
+        self._p += k_
+        self._a -= k_ * self._b
+        self._y0 -= k_ * self._x0
+        self._y -= k_ * self._n
+        self._u, self._ud, self._l, self._ld = [(x_, y_ - k_ * x_) for x_, y_ in (self._u, self._ud, self._l, self._ld)]
+
+    def __len__(self):
+        """Nombre de codes constituant le segment reconnu."""
+        return self._n - self._x0
+
+    def ajouter(self, code):
+        """Ajout d'un code à la fin du segment.
+        Entrée : Un code entier.
+        Sortie : True si les codes ajoutés jusqu'ici forment toujours un segment de droite discrète.
+                 False sinon, l'indice du premier code incompatible (compté depuis le premier code ajouté)
+                 est alors conservé dans l'attribut rupture et les codes suivants sont ignorés.
+        """
+        if self.rupture is not None:
+            return False
+        code = int(code)
+        if self._p is None:
+            self._p = 0
+            self._transvecter(code)
+            self._a, self._mu = 0, -self._y0
+        d_ = code - self._p
+        if -1 == d_ and 0 == self._a:
+            # tous les codes précédents sont égaux : la transvection est diminuée de 1 (y' = y + x)
+            self._transvecter(-1)
+            d_ = 0
+        if d_ not in (0, 1):
+            self.rupture = self._n
+            return False
+        a_, b_, mu_ = self._a, self._b, self._mu
+        m_ = (self._n + 1, self._y + d_)
+        r_ = a_ * m_[0] - b_ * m_[1]
+        if mu_ <= r_ < mu_ + b_:
+            if r_ == mu_:
+                self._ud = m_
+            if r_ == mu_ + b_ - 1:
+                self._ld = m_
+        elif r_ == mu_ - 1:
+            # point faiblement extérieur au-dessus : la pente augmente
+            self._ud, self._l = m_, self._ld
+            a_, b_ = m_[1] - self._u[1], m_[0] - self._u[0]
+            self._a, self._b, self._mu = a_, b_, a_ * m_[0] - b_ * m_[1]
+        elif r_ == mu_ + b_:
+            # point faiblement extérieur au-dessous : la pente diminue
+            self._ld, self._u = m_, self._ud
+            a_, b_ = m_[1] - self._l[1], m_[0] - self._l[0]
+            self._a, self._b, self._mu = a_, b_, a_ * self._u[0] - b_ * self._u[1]
+        else:
+            self.rupture = self._n
+            return False
+        self._n, self._y = m_
+        self._codes.append(code)
+        return True
+
+    def retirer(self):
+        """Retrait du premier code du segment.
+        Sortie : Le code retiré.
+        Erreur : IndexError si le segment ne contient aucun code.
+        REMARQUE : La rupture éventuelle est oubliée : le code incompatible peut être proposé de nouveau.
+        """
+        code = self._codes.popleft()
+        self.rupture = None
+        a_, b_ = self._a, self._b
+        f_ = (self._x0, self._y0)
+        self._x0, self._y0 = self._x0 + 1, self._y0 + code - self._p
+        if not self._codes:
+            self._vider(self._x0, self._y0 + self._p * self._x0)
+            return code
+        u_, ud_, l_, ld_ = self._u, self._ud, self._l, self._ld
+        if 1 < b_ and f_ == u_ and ud_[0] - u_[0] == b_ and l_ == ld_:
+            # seuls deux points d'appui supérieurs, dont le premier est retiré : la pente diminue
+            # (inverse de l'ajout au début d'un point faiblement extérieur au-dessus)
+            b_ = (l_[0] - ud_[0]) % b_
+            a_ = (1 + b_ * self._a) // self._b
+            self._a, self._b, self._mu = a_, b_, a_ * ud_[0] - b_ * ud_[1]
+        elif 1 < b_ and f_ == l_ and ld_[0] - l_[0] == b_ and u_ == ud_:
+            # seuls deux points d'appui inférieurs, dont le premier est retiré : la pente augmente
+            b_ = (u_[0] - ld_[0]) % b_
+            a_ = (b_ * self._a - 1) // self._b
+            self._a, self._b, self._mu = a_, b_, a_ * ld_[0] - b_ * ld_[1] - b_ + 1
+            ud_, l_ = u_, ld_
+        else:
+            if f_ == u_:
+                self._u = (u_[0] + b_, u_[1] + a_)
+            if f_ == l_:
+                self._l = (l_[0] + b_, l_[1] + a_)
+            return code
+        # points d'appui extrêmes de la nouvelle pente, à partir d'un point d'appui supérieur ud_
+        # et d'un point d'appui inférieur l_ qui le restent
+        x0_, n_ = self._x0, self._n
+        self._u = (ud_[0] - (ud_[0] - x0_) // b_ * b_, ud_[1] - (ud_[0] - x0_) // b_ * a_)
+        self._ud = (ud_[0] + (n_ - ud_[0]) // b_ * b_, ud_[1] + (n_ - ud_[0]) // b_ * a_)
+        self._l = (l_[0] - (l_[0] - x0_) // b_ * b_, l_[1] - (l_[0] - x0_) // b_ * a_)
+        self._ld = (l_[0] + (n_ - l_[0]) // b_ * b_, l_[1] + (n_ - l_[0]) // b_ * a_)
+        if a_ == b_:
+            # tous les codes restants sont égaux à p + 1 : la transvection est augmentée de 1
+            self._transvecter(1)
+        return code
+
+    def caracteristiques(self):
+        """Sortie : Les caractéristiques a, b, r de la forme quasi affine du segment reconnu
+                    (valeurs initiales nulles, comme pour reconnaissance).
+        """
+        p_ = 0 if self._p is None else self._p
+        return self._a + p_ * self._b, self._b, self._a * self._x0 - self._b * self._y0 - self._mu
+
+    def fqa(self, x0_=0, y0_=0):
+        """Entrée : Les valeurs initiales x0_ et y0_ nulles par défaut.
+        Sortie : La forme quasi affine correspondant aux codes ajoutés et aux valeurs initiales fournies.
+        """
+        a, b, r = self.caracteristiques()
+        r += b * int(y0_) - a * int(x0_)
+        return Fqa(a=a, b=b, r=r)
+
+
+def prefixe_valide(liste_codes, x0_=0, y0_=0):
+    """Diagnostic : plus long préfixe des codes formant un segment de droite discrète (en un seul parcours).
+    Entrée : Une liste d'entiers (codes).
+           : Les valeurs initiales x0_ et y0_ nulles par défaut.
+    Sortie : La longueur du plus long préfixe valide,
+             la forme quasi affine correspondant à ce préfixe et aux valeurs initiales fournies,
+             l'indice du premier code incompatible (None si tous les codes forment un segment).
+    REMARQUE : Le préfixe est reconnu par ReconnaissanceIncrementale qui ne tolère pas un dernier code plus petit :
+               un tel code est signalé ici alors que codes l'ignore.
+    """
+    r_ = ReconnaissanceIncrementale()
+    for code in liste_codes:
+        if not r_.ajouter(code):
+            break
+    return len(r_), r_.fqa(x0_, y0_), r_.rupture
+
+
+def decomposer(liste_codes, x0_=0, y0_=0, tangentielle=False):
+    """Décomposition des codes en segments de droite discrète maximaux.
+    Entrée : Une liste d'entiers (codes).
+           : Les valeurs initiales x0_ et y0_ nulles par défaut.
+           : tangentielle, si faux (par défaut), recouvrement glouton : chaque segment est prolongé le plus loin possible
+             puis le suivant commence au premier code incompatible (segments disjoints).
+             Si vrai, couverture tangentielle : tous les segments maximaux (non prolongeables ni au début ni à la fin),
+             éventuellement chevauchants.
+    Sortie : La liste des triplets (debut, fin, f) où les codes liste_codes[debut:fin] sont ceux de la forme quasi
+             affine f, pour les valeurs initiales fournies : f(x0_ + i) = y0_ + somme des codes liste_codes[:i]
+             pour debut <= i <= fin.
+    REMARQUE : Dans la couverture tangentielle, lorsqu'un code ne prolonge pas le segment courant, les premiers codes
+               de ce segment sont retirés un à un jusqu'à ce qu'il le prolonge (ReconnaissanceIncrementale.retirer) :
+               chaque code est ajouté et retiré au plus une fois, le temps est linéaire dans les deux cas.
+    """
+    liste_codes = array.array('l', liste_codes)
+    x0_, y0_ = int(x0_), int(y0_)
+    cumuls = list(itertools.accumulate(liste_codes, initial=y0_))
+    segments = []
+    if 0 == len(liste_codes):
+        return segments
+    r_ = ReconnaissanceIncrementale()
+    debut = 0
+    for fin, code in enumerate(liste_codes):
+        if r_.ajouter(code):
+            continue
+        segments.append((debut, fin, r_.fqa(x0_ + debut, cumuls[debut])))
+        if tangentielle:
+            while not r_.ajouter(code):
+                r_.retirer()
+                debut += 1
+        else:
+            r_ = ReconnaissanceIncrementale()
+            r_.ajouter(code)
+            debut = fin
+    segments.append((debut, len(liste_codes), r_.fqa(x0_ + debut, cumuls[debut])))
+    return segments
+
+
+class CacheReconnaissance:
+    """Cache borné (LRU) des résultats de reconnaissance, avec un niveau persistant facultatif (fichier sqlite).
+    Les échecs (ValueError) sont aussi conservés.
+    Les statistiques sont tenues dans les attributs succes (résultats trouvés en mémoire),
+    succes_disque (résultats trouvés dans le fichier) et calculs (reconnaissances effectuées).
+    """
+
+    def __init__(self, taille=1024, fichier=None):
+        """Entrée : taille le nombre maximal de résultats conservés en mémoire.
+               : fichier le chemin du fichier sqlite (None par défaut, aucun niveau persistant).
+        Sortie : Un cache vide (sauf contenu antérieur du fichier).
+        """
+        self.taille = int(taille)
+        assert 0 < self.taille
+        self._resultats = collections.OrderedDict()
+        self.succes, self.succes_disque, self.calculs = 0, 0, 0
+        self._base = None
+        if fichier is not None:
+            self._base = sqlite3.connect(fichier)
+            with self._base:
+                self._base.execute("CREATE TABLE IF NOT EXISTS reconnaissance "
+                                   "(codes TEXT PRIMARY KEY, a TEXT, b TEXT, r TEXT, erreur TEXT)")
+
+    def __len__(self):
+        """Nombre de résultats conservés en mémoire."""
+        return len(self._resultats)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fermer()
+
+    def fermer(self):
+        """Fermeture du fichier sqlite éventuel."""
+        if self._base is not None:
+            self._base.close()
+            self._base = None
+
+    def vider(self):
+        """Suppression des résultats conservés en mémoire et remise à zéro des statistiques."""
+        self._resultats.clear()
+        self.succes, self.succes_disque, self.calculs = 0, 0, 0
+
+    def _lire(self, cle):
+        # Résultat conservé dans le fichier sqlite ou None.
+        if self._base is None:
+            return None
+        ligne = self._base.execute("SELECT a, b, r, erreur FROM reconnaissance WHERE codes = ?", (cle,)).fetchone()
+        if ligne is None:
+            return None
+        return ValueError(ligne[3]) if ligne[3] is not None else tuple(map(int, ligne[:3]))
+
+    def _ecrire(self, cle, resultat):
+        # Conservation du résultat dans le fichier sqlite.
+        if self._base is None:
+            return
+        if isinstance(resultat, ValueError):
+            valeurs = (cle, None, None, None, str(resultat))
+        else:
+            valeurs = (cle,) + tuple(map(str, resultat)) + (None,)
+        with self._base:
+            self._base.execute("INSERT OR REPLACE INTO reconnaissance VALUES (?, ?, ?, ?, ?)", valeurs)
+
+    def reconnaissance(self, liste_codes):
+        """Reconnaissance des codes (voir fqa.reconnaissance).
+        Entrée : Une suite d'entiers (codes), éventuellement un itérateur.
+        Sortie : Les caractéristiques a, b, r de la forme quasi affine.
+        Erreur : ValueError si les codes ne sont pas ceux d'un segment de droite discrète.
+        """
+        codes_ = [int(c) for c in liste_codes]
+        cle = ",".join(map(str, codes_))
+        resultat = self._resultats.get(cle)
+        if resultat is not None:
+            self._resultats.move_to_end(cle)
+            self.succes += 1
+        else:
+            resultat = self._lire(cle)
+            if resultat is not None:
+                self.succes_disque += 1
+            else:
+                self.calculs += 1
+                try:
+                    resultat = reconnaissance(codes_)
+                except ValueError as erreur:
+                    resultat = erreur
+                self._ecrire(cle, resultat)
+            self._resultats[cle] = resultat
+            if self.taille < len(self._resultats):
+                self._resultats.popitem(last=False)
+        if isinstance(resultat, ValueError):
+            raise ValueError(*resultat.args)
+        return resultat
+
+    def codes(self, liste_codes, x0_=0, y0_=0):
+        """Reconnaissance des codes (voir fqa.codes).
+        Entrée : Une liste d'entiers (codes).
+               : Les valeurs initiales x0_ et y0_ nulles par défaut.
+        Sortie : La forme quasi affine correspondant aux codes et aux valeurs initiales fournies.
+        Erreur : ValueError si les codes ne sont pas ceux d'un segment de droite discrète.
+        """
+        a, b, r = self.reconnaissance(liste_codes)
+        r += b * int(y0_) - a * int(x0_)
+        return Fqa(a=a, b=b, r=r)
+
+
+def _source_affine(a_, x_, r_):
+    # Source de l'expression a * x + r simplifiée.
+    terme = x_ if 1 == a_ else "-" + x_ if -1 == a_ else "{} * {}".format(a_, x_)
+    if 0 == a_:
+        return str(r_)
+    if 0 == r_:
+        return terme
+    return "{} {} {}".format(terme, "+" if 0 < r_ else "-", abs(r_))
+
+
+def _source_divent(n_, d_):
+    # Source du quotient de outils.divent(n, d) pour l'expression n et l'entier d non nul.
+    if 1 == d_:
+        return "({})".format(n_)
+    if -1 == d_:
+        return "(-({}))".format(n_)
+    if 0 < d_:
+        return "(({}) // {})".format(n_, d_)
+    return "(-(({}) // {}))".format(n_, -d_)
+
+
 class Base:
     """Classe Base définit une base pour représenter un nombre.
     De la même manière que nombre peut être représenté en base 10 ou 2.
@@ -178,6 +849,38 @@ class Base:
         for value in liste_fqa:
             assert isinstance(value, Fqa)
             self.t.append(value)
+        self._compilation = None
+        self._seuil, self._tables = None, None
+        self._emboitement = None
+
+    def __reduce__(self):
+        # Sérialisation (pickle) : le module qui enregistre la base et son nom (voir enregistrer_base), le module
+        # étant importé à la désérialisation, sinon le format binaire (voir serialiser). Les fonctions compilées
+        # (voir compiler) et les tables (voir tabuler) ne sont pas conservées, elles sont reconstruites à la demande.
+        nom = _nom_base(self)
+        if nom is not None:
+            return _restaurer_enregistree, (_MODULES.get(nom), nom)
+        return _restaurer_base, (type(self), serialiser(self, nommee=False))
+
+    def _invalider(self):
+        # La base a été modifiée : les fonctions compilées et les tables seront reconstruites à la demande.
+        self._compilation, self._tables = None, None
+        self._emboitement = None
+
+    def _emboitee(self):
+        # Vrai si toutes les formes quasi affines sont croissantes (a > 0 et b > 0), et pour chaque étage j, vrai si
+        # de plus les étages 1 à j sont emboîtés : 0 et chaque largeur f(x + 1) - f(x) de l'étage précédent sont des
+        # valeurs de la forme de l'étage. L'intervalle [g(y), g(y + 1)[ d'un chiffre canonique y de l'étage est alors
+        # inclus dans celui de l'étage précédent, qui ne peut pas déborder (voir Representation.ajouter).
+        # Le résultat est conservé jusqu'à la modification suivante de la base.
+        if self._emboitement is None:
+            croissante = all(0 < f_.a and 0 < f_.b for f_ in self.t)
+            emboitee = [croissante] * min(1, len(self.t))
+            for precedent, f_ in zip(self.t, self.t[1:]):
+                largeurs = {0, precedent.a // precedent.b, -(-precedent.a // precedent.b)}
+                emboitee.append(emboitee[-1] and all(0 == f_.divfqa(v_)[1] for v_ in largeurs))
+            self._emboitement = croissante, emboitee
+        return self._emboitement
 
     def __call__(self, liste_entiers):
         """Base([n0, n1, ...]) = [t[0](n0)+t[1](n1)+...].
@@ -191,6 +894,13 @@ class Base:
         # REMARQUE : si la taille de la liste d'entiers est inférieure à celle de self.t,
         #            ce sont les formes les plus significatives qui sont ignorées.
         tv = array.array('l', ([0] * (len(self.t) - len(liste_entiers)) + liste_entiers))
+        tables = self._table()
+        if tables:
+            n_ = 0
+            for (f_, x0, tf_), value in zip(tables[3], tv):
+                d_ = value - x0
+                n_ += tf_[d_] if 0 <= d_ < len(tf_) else f_(value)
+            return n_
         i, n_ = 0, 0
         for value in tv:
             n_ += self.t[i](value)
@@ -213,10 +923,12 @@ class Base:
         assert isinstance(valeur, Fqa)
         # assert isinstance(clef, int)
         self.t[clef] = valeur
+        self._invalider()
 
     def __delitem__(self, clef):
         # assert isinstance(clef, int)
         del self.t[clef]
+        self._invalider()
 
     def __iter__(self):
         return iter(self.t)
@@ -224,6 +936,7 @@ class Base:
     def append(self, valeur):
         assert isinstance(valeur, Fqa)
         self.t.append(valeur)
+        self._invalider()
 
     def __repr__(self):
         return "Base({})".format(self.t)
@@ -240,11 +953,176 @@ class Base:
         # assert isinstance(n_, int)
         v = [0] * len(self.t)
         i, r = 0, int(n_)
-        for f_ in self.t:
+        tables = self._table()
+        if tables:
+            i_, largeur, inverse, _ = tables
+            for f_ in self.t[:i_]:
+                v[i], r = f_.divfqa(r)
+                i += 1
+            if 0 <= r < len(inverse) // largeur:
+                v[i_:] = inverse[r * largeur:(r + 1) * largeur]
+                return v
+        for f_ in self.t[i:]:
             v[i], r = f_.divfqa(r)
             i += 1
         return v
 
+    def tabuler(self, seuil=4096):
+        """Remplacement des derniers étages de la base par des tables (dans les deux sens) lorsque leur domaine est petit.
+        Entrée : seuil le nombre maximal d'entiers d'une table (None pour supprimer les tables).
+        Sortie : La taille des tables en octets (voir empreinte_tables).
+        REMARQUE : Le reste de la division par une forme quasi affine Fqa(a, b, r) avec a > 0 et b > 0 (voir divfqa)
+                   est compris entre 0 et le plus grand de ses codes [(a + b - 1) / b] exclu. Les chiffres suivants
+                   ne dépendent que de ce reste : ils sont tous tabulés à partir du premier étage (autre que le
+                   premier) dont le domaine ainsi déduit de l'étage précédent est assez petit.
+                   Les valeurs des formes quasi affines de ces étages sont tabulées sur le domaine de leurs chiffres.
+                   Hors des tables, le calcul est fait par les formes quasi affines, les résultats sont donc identiques.
+                   Les tables sont construites à la première utilisation et après chaque modification de la base.
+                   Elles ne sont pas utilisées par les fonctions engendrées par compiler où les divisions,
+                   écrites en dur, ne sont pas plus coûteuses qu'une lecture de table.
+        """
+        self._seuil = None if seuil is None else int(seuil)
+        self._invalider()
+        return self.empreinte_tables()
+
+    def empreinte_tables(self):
+        """Sortie : La taille des tables (voir tabuler) en octets, 0 s'il n'y en a pas."""
+        tables = self._table()
+        if not tables:
+            return 0
+        _, _, inverse, directes = tables
+        return sum(t_.itemsize * len(t_) for t_ in [inverse] + [tf_ for _, _, tf_ in directes])
+
+    def _table(self):
+        # Tables (voir tabuler) : () s'il n'y en a pas, sinon l'indice i du premier étage tabulé, le nombre de chiffres
+        # tabulés, la table à plat des chiffres pour chaque reste et, pour chaque étage, le triplet
+        # (forme quasi affine, premier chiffre, table des valeurs éventuellement vide).
+        if self._tables is None:
+            self._tables = () if self._seuil is None else self._construire_tables(self._seuil)
+        return self._tables
+
+    def _construire_tables(self, seuil):
+        # Construction des tables (voir tabuler).
+        k_ = len(self.t)
+        for i_ in range(1, k_):
+            f_ = self.t[i_ - 1]
+            if 0 < f_.a and 0 < f_.b and -(-f_.a // f_.b) * (k_ - i_) <= seuil:
+                break
+        else:
+            return ()
+        f_ = self.t[i_ - 1]
+        largeur = k_ - i_
+        inverse = array.array('l')
+        for r_ in range(-(-f_.a // f_.b)):
+            for g_ in self.t[i_:]:
+                q_, r_ = g_.divfqa(r_)
+                inverse.append(q_)
+        directes = [(g_, 0, array.array('l')) for g_ in self.t[:i_]]
+        for j_, g_ in enumerate(self.t[i_:]):
+            chiffres = inverse[j_::largeur]
+            x0, x1 = min(chiffres), max(chiffres)
+            if x1 - x0 < seuil:
+                directes.append((g_, x0, array.array('l', map(g_, range(x0, x1 + 1)))))
+            else:
+                directes.append((g_, 0, array.array('l')))
+        return i_, largeur, inverse, directes
+
+    def compiler(self):
+        """Fonctions spécialisées pour la base : le code source est engendré avec les caractéristiques a, b, r
+        de chaque forme quasi affine écrites en dur, sans boucle ni conversion.
+        Sortie : La fonction directe(x0, x1, ...) équivalente à Base.__call__([x0, x1, ...]) (tous les chiffres
+                 doivent être fournis) et la fonction inverse(n) équivalente à Base.inv(n).
+        REMARQUE : Les fonctions sont conservées jusqu'à la modification suivante de la base.
+        """
+        if self._compilation is None:
+            self._compilation = self._engendrer()
+        return self._compilation
+
+    def _engendrer(self):
+        # Source et compilation des fonctions directe et inverse (voir compiler).
+        k_ = len(self.t)
+        chiffres = ["x{}".format(i) for i in range(k_)]
+        termes = [_source_divent(_source_affine(f_.a, x_, f_.r), f_.b) for f_, x_ in zip(self.t, chiffres)]
+        lignes = ["def directe({}):".format(", ".join(chiffres)),
+                  "    return {}".format(" + ".join(termes) if termes else "0"),
+                  "", "", "def inverse(n):", "    n = int(n)"]
+        for i, (f_, x_) in enumerate(zip(self.t, chiffres)):
+            lignes.append("    {} = {}".format(x_, _source_divent(_source_affine(f_.b, "n", f_.b - f_.r - 1), f_.a)))
+            if i < k_ - 1:
+                lignes.append("    n -= {}".format(_source_divent(_source_affine(f_.a, x_, f_.r), f_.b)))
+        lignes.append("    return [{}]".format(", ".join(chiffres)))
+        espace = {}
+        exec(compile("\n".join(lignes) + "\n", "<{}.compiler>".format(type(self).__name__), "exec"), espace)
+        return espace["directe"], espace["inverse"]
+
+    def evaluer_lot(self, colonnes):
+        """Évaluation colonne par colonne : Base.__call__ appliquée à toutes les lignes d'un tableau de chiffres.
+        Entrée : Une liste de colonnes d'entiers (array.array, memoryview ou tableaux NumPy de même forme),
+                 la colonne i contenant le chiffre i de chaque nombre.
+        Sortie : La colonne des nombres représentés, de même nature et de même forme que la première colonne.
+        Erreur : Si la liste a trop de colonnes.
+        REMARQUE : Comme pour Base.__call__, s'il y a moins de colonnes que de formes quasi affines,
+                   ce sont les chiffres les plus significatifs qui manquent, ils valent alors 0.
+                   Comme pour Fqa.evaluer_lot, NumPy n'est utilisé que si aucun résultat intermédiaire
+                   ne peut dépasser 2**63 - 1, sinon le calcul est fait en entiers Python.
+        """
+        colonnes = list(colonnes)
+        assert 0 < len(colonnes) <= len(self.t)
+        k_ = len(self.t) - len(colonnes)
+        formes = self.t[k_:]
+        n0 = sum(f_(0) for f_ in self.t[:k_])
+        modele, suite = colonnes[0], functools.partial(array.array, 'l')
+        if outils.numpy is not None:
+            xs = [outils.entiers(c_) for c_ in colonnes]
+            bornes = [_borne_lot(x_, f_.a, f_.r, f_.b) for f_, x_ in zip(formes, xs)]
+            if max(bornes) <= _BORNE_LOT \
+                    and abs(n0) + sum(m_ // abs(f_.b) + 1 for f_, m_ in zip(formes, bornes)) <= _BORNE_LOT:
+                n_ = sum(_divent_lot(f_.a * x_ + f_.r, f_.b) for f_, x_ in zip(formes, xs))
+                return outils.colonne(modele, n_ + n0)
+            xs, suite = [x_.ravel().tolist() for x_ in xs], list
+        else:
+            xs = [outils.entiers(c_) for c_ in colonnes]
+        n_ = None
+        for f_, x_ in zip(formes, xs):
+            a_, r_, b_ = f_.a, f_.r, abs(f_.b)
+            if 0 < f_.b:
+                y_ = ((a_ * x + r_) // b_ for x in x_)
+            else:
+                y_ = (-((a_ * x + r_) // b_) for x in x_)
+            if n_ is None:
+                n_ = suite(map(n0.__add__, y_))
+            else:
+                n_ = suite(map(operator.add, n_, y_))
+        return outils.colonne(modele, n_)
+
+    def inv_lot(self, ns):
+        """Base.inv appliquée à toute une colonne d'entiers.
+        Entrée : Une colonne ns (array.array, memoryview ou tableau NumPy).
+        Sortie : La liste des colonnes des chiffres (une par forme quasi affine, de la plus significative à la moins
+                 significative), de même nature et de même forme que ns.
+        Référence : [1] pour les détails.
+        REMARQUE : Comme pour Fqa.divfqa_lot, chaque étage n'est calculé par NumPy que si ses résultats
+                   intermédiaires ne peuvent pas dépasser 2**63 - 1, sinon il l'est (ainsi que les suivants)
+                   en entiers Python.
+        """
+        r_ = outils.entiers(ns)
+        lot, suite = outils.numpy is not None, functools.partial(array.array, 'l')
+        if not lot:
+            r_ = suite(r_)
+        colonnes = []
+        for f_ in self.t:
+            a_, b_, c_ = f_.a, f_.b, f_.b - f_.r - 1
+            if lot and _borne_lot(r_, abs(b_) + 1, abs(c_) + abs(a_) + abs(f_.r), a_) > _BORNE_LOT:
+                lot, suite, r_ = False, list, r_.ravel().tolist()
+            if lot:
+                q_ = _divent_lot(b_ * r_ + c_, a_)
+                r_ = r_ - _divent_lot(a_ * q_ + f_.r, b_)
+            else:
+                q_ = suite(_divent_lot(b_ * n + c_, a_) for n in r_)
+                r_ = suite(n - _divent_lot(a_ * q + f_.r, b_) for n, q in zip(r_, q_))
+            colonnes.append(outils.colonne(ns, q_))
+        return colonnes
+
 
 class Representation:
     """Representation d'une Quantite dans une Base.
@@ -279,6 +1157,87 @@ class Representation:
         """Representation() retourne le nom entier représenté."""
         return self.base(self.liste_entiers.tolist())
 
+    def ajouter(self, chiffre, k_):
+        """Ajout de k_ au chiffre d'indice chiffre (indice dans la liste complétée à la taille de la base)
+        puis propagation des retenues.
+        Entrée : L'indice du chiffre (éventuellement négatif comme pour une liste) et l'entier k_ à lui ajouter.
+        Sortie : La représentation est modifiée : ses chiffres (autant que de formes quasi affines de la base)
+                 sont ceux de base.inv(base(chiffres modifiés)).
+        REMARQUE : Lorsque toutes les formes quasi affines Fqa(a, b, r) de la base vérifient a > 0 et b > 0,
+                   divfqa donne le plus grand "quotient" q tel que f(q) <= n. Les chiffres sont donc ceux de base.inv
+                   si et seulement si, à chaque étage j, la somme R des valeurs des étages suivants vérifie
+                   0 <= R < f(x + 1) - f(x) où x est le chiffre de l'étage j et f sa forme quasi affine.
+                   Les étages suivant le chiffre modifié sont inchangés, la retenue est propagée depuis ce chiffre
+                   vers les étages plus significatifs, puis les chiffres sont recalculés à partir du plus significatif
+                   des étages qui ne vérifient plus cette condition.
+                   La propagation s'arrête au premier étage (autre que celui du chiffre modifié) qui la vérifie
+                   lorsque cet étage et ceux qui le précèdent sont emboîtés (c'est le cas de BASE_TEMPS) : les chiffres
+                   étant supposés canoniques, aucun étage plus significatif ne peut alors déborder.
+                   Sinon tous les étages plus significatifs doivent être vérifiés : par exemple, ajouter un an
+                   au 29 février d'une année bissextile ne change pas le jour ni le mois mais les rend incompatibles
+                   avec l'année, de même un jour de plus au 28 février d'une année commune n'excède pas la largeur
+                   du mois (calculée par une forme quasi affine commune à toutes les années) mais celle de l'année.
+        """
+        t_ = self.base.t
+        v_ = ([0] * (len(t_) - len(self.liste_entiers))) + self.liste_entiers.tolist()
+        v_[chiffre] += int(k_)
+        croissante, emboitee = self.base._emboitee()
+        if not croissante:
+            self.liste_entiers = array.array('l', self.base.inv(self.base(v_)))
+            return
+        # premier chiffre modifié
+        i_ = chiffre % len(t_)
+        # valeur des étages suivants (inchangés) puis propagation de la retenue : premier étage incompatible (h)
+        # et valeur des étages à partir de celui-ci (n)
+        reste = sum(f_(x_) for f_, x_ in zip(t_[i_ + 1:], v_[i_ + 1:]))
+        h_, n_ = None, 0
+        for j_ in range(i_, -1, -1):
+            f_, x_ = t_[j_], v_[j_]
+            y_ = f_(x_)
+            if not 0 <= reste < f_(x_ + 1) - y_:
+                h_, n_ = j_, reste + y_
+            elif j_ < i_ and emboitee[j_]:
+                break
+            reste += y_
+        if h_ is not None:
+            for j_ in range(h_, len(t_)):
+                v_[j_], n_ = t_[j_].divfqa(n_)
+            i_ = min(i_, h_)
+        if len(v_) != len(self.liste_entiers):
+            self.liste_entiers = array.array('l', v_)
+        else:
+            self.liste_entiers[i_:] = array.array('l', v_[i_:])
+
+    def __iadd__(self, n_):
+        """Ajout de l'entier n_ au nombre représenté (modification de la représentation).
+        REMARQUE : Si la dernière forme quasi affine de la base est Fqa(1, 1, r), l'ajout porte sur le dernier chiffre
+                   avec propagation des retenues (voir ajouter).
+        """
+        f_ = self.base.t[-1]
+        if 1 == f_.a and 1 == f_.b:
+            self.ajouter(-1, n_)
+        else:
+            self.liste_entiers = array.array('l', self.base.inv(self() + int(n_)))
+        return self
+
+    def __isub__(self, n_):
+        """Retrait de l'entier n_ au nombre représenté (voir __iadd__)."""
+        return self.__iadd__(-int(n_))
+
+    def __add__(self, n_):
+        """Sortie : La représentation du nombre représenté augmenté de l'entier n_ (voir __iadd__)."""
+        resultat = Representation(self.base, self.liste_entiers.tolist())
+        resultat += n_
+        return resultat
+
+    def __sub__(self, autre):
+        """Sortie : La différence des nombres représentés si autre est une Representation,
+                    sinon la représentation du nombre représenté diminué de l'entier autre.
+        """
+        if isinstance(autre, Representation):
+            return self() - autre()
+        return self + (-int(autre))
+
     def __repr__(self):
         # Le format d'une date peut (doit ?) dépendre de la base.
         return "Representation({}, {})".format(self.base, self.liste_entiers)
@@ -287,12 +1246,263 @@ class Representation:
         return "{}".format(self.liste_entiers)
 
 
+class RepresentationArray:
+    """Tableau de représentations dans une même Base, rangées par colonnes (une colonne par chiffre).
+    Les chiffres sont conservés dans un seul array.array('l') contigu, colonne après colonne.
+    REMARQUE : Le tableau expose ses chiffres sans copie : memoryview de chaque colonne (colonne),
+               memoryview à deux dimensions (chiffres, représentations) (vue) et protocole buffer
+               (__buffer__, à partir de Python 3.12), par exemple pour NumPy ou une écriture dans un fichier.
+    """
+
+    def __init__(self, base, colonnes):
+        """Entrée : La Base des représentations.
+                    La liste des colonnes de chiffres (itérables d'entiers de même longueur). S'il y a moins de colonnes
+                    que de formes quasi affines dans la base, les chiffres les plus significatifs valent 0.
+        Sortie : Le tableau de représentations.
+        Erreur : Si le paramètre base n'est pas une Base.
+                 Si le nombre de colonnes est supérieur à la taille de la base ou si leurs longueurs diffèrent.
+        """
+        assert isinstance(base, Base)
+        colonnes = [outils.colonne(array.array('l'), outils.entiers(c_)) for c_ in colonnes]
+        if len(colonnes) > len(base.t):
+            raise ValueError("Le nombre de colonnes est supérieur à la taille de la base")
+        n_ = len(colonnes[0]) if colonnes else 0
+        if any(len(c_) != n_ for c_ in colonnes):
+            raise ValueError("Les colonnes n'ont pas la même longueur")
+        self.base = base
+        self._n = n_
+        self._chiffres = array.array('l', bytes(array.array('l').itemsize * n_ * (len(base.t) - len(colonnes))))
+        for c_ in colonnes:
+            self._chiffres.extend(c_)
+
+    @classmethod
+    def depuis_nombres(cls, base, ns):
+        """Entrée : La Base des représentations et une colonne d'entiers (voir Base.inv_lot).
+        Sortie : Le tableau des représentations des entiers dans la base.
+        """
+        return cls(base, base.inv_lot(outils.colonne(array.array('l'), outils.entiers(ns))))
+
+    def __len__(self):
+        """Nombre de représentations."""
+        return self._n
+
+    def colonne(self, j_):
+        """Sortie : La colonne des chiffres d'indice j_ (memoryview, sans copie)."""
+        k_ = len(self.base.t)
+        j_ = range(k_)[j_]
+        return memoryview(self._chiffres)[j_ * self._n:(j_ + 1) * self._n]
+
+    def vue(self):
+        """Sortie : Les chiffres sous la forme d'un memoryview à deux dimensions (chiffres, représentations),
+                    sans copie. Si le tableau ou la base est vide, le memoryview (vide) n'a qu'une dimension :
+                    memoryview.cast n'accepte pas de dimension nulle.
+        REMARQUE : La même vue est exposée par le protocole buffer (__buffer__), qui n'est utilisé qu'à partir
+                   de Python 3.12 : avant, memoryview(tableau) ou numpy.asarray(tableau) échouent et il faut
+                   passer par vue().
+        """
+        if 0 == self._n or not self.base.t:
+            return memoryview(self._chiffres)
+        return memoryview(self._chiffres).cast('B').cast('l', (len(self.base.t), self._n))
+
+    def __buffer__(self, flags):
+        # Protocole buffer, utilisé seulement à partir de Python 3.12 (ignoré avant) : voir vue.
+        return self.vue()
+
+    def nombres(self):
+        """Sortie : La colonne (memoryview) des nombres représentés (voir Base.evaluer_lot)."""
+        return self.base.evaluer_lot([self.colonne(j_) for j_ in range(len(self.base.t))])
+
+    def __getitem__(self, clef):
+        """Sortie : La Representation d'indice clef ou, pour une tranche, un nouveau RepresentationArray (copie)."""
+        k_ = len(self.base.t)
+        if isinstance(clef, slice):
+            return RepresentationArray(self.base, [self.colonne(j_)[clef] for j_ in range(k_)])
+        i_ = range(self._n)[clef]
+        return Representation(self.base, self._chiffres[i_::self._n].tolist())
+
+    def __iter__(self):
+        t_ = self._chiffres.tolist()
+        for i_ in range(self._n):
+            yield Representation(self.base, t_[i_::self._n])
+
+    def __eq__(self, autre):
+        if not isinstance(autre, RepresentationArray):
+            return False
+        return self.base == autre.base and self._n == autre._n and self._chiffres == autre._chiffres
+
+    def __repr__(self):
+        return "RepresentationArray({}, {})".format(
+            self.base, [self.colonne(j_).tolist() for j_ in range(len(self.base.t))])
+
+
+# Format binaire (voir serialiser) : en-tête, version et type puis entiers 64 bits signés petit-boutistes.
+_ENTETE = b"FQA"
+_VERSION = 1
+_ENTIER = struct.Struct("<q")
+_NOMBRE = struct.Struct("<I")
+
+# Bases enregistrées (voir enregistrer_base) : nom -> base, et nom -> module qui enregistre la base.
+_BASES = {}
+_MODULES = {}
+
+
+def enregistrer_base(nom, base, module=None):
+    """Enregistrement d'une base sous un nom.
+    Entrée : Le nom et la Base (par exemple un calendrier).
+             Facultativement le nom du module qui fait l'enregistrement (__name__ en général).
+    REMARQUE : Une base enregistrée est sérialisée (serialiser, pickle) par son seul nom
+               et désérialisée en la base enregistrée elle-même.
+               Avec pickle, le module est aussi conservé : il est importé à la désérialisation, ce qui enregistre
+               la base dans un processus qui ne l'a pas encore importé (processus fils "spawn" par exemple).
+    """
+    assert isinstance(base, Base)
+    _BASES[str(nom)] = base
+    _MODULES[str(nom)] = None if module is None else str(module)
+
+
+def base_enregistree(nom):
+    """Entrée : Le nom d'une base enregistrée (voir enregistrer_base).
+    Sortie : La base enregistrée.
+    Erreur : KeyError si aucune base n'est enregistrée sous ce nom.
+    """
+    return _BASES[nom]
+
+
+def _restaurer_enregistree(module, nom):
+    # Base enregistrée (voir Base.__reduce__) : le module qui l'enregistre est importé au préalable.
+    if module is not None:
+        importlib.import_module(module)
+    return base_enregistree(nom)
+
+
+def _nom_base(base):
+    # Nom de la base si elle est enregistrée, None sinon.
+    for nom, valeur in _BASES.items():
+        if valeur is base:
+            return nom
+    return None
+
+
+def _restaurer_base(classe, octets):
+    # Reconstruction d'une base (voir Base.__reduce__) sans repasser par le __init__ éventuel de sa classe.
+    base = deserialiser(octets)
+    if classe is not Base:
+        objet = classe.__new__(classe)
+        objet.__dict__.update(base.__dict__)
+        base = objet
+    return base
+
+
+def _octets_fqa(liste_fqa):
+    # Caractéristiques a, b, r des formes quasi affines en entiers 64 bits petit-boutistes.
+    t_ = array.array('q', [v for f_ in liste_fqa for v in (f_.a, f_.b, f_.r)])
+    if "big" == sys.byteorder:
+        t_.byteswap()
+    return _NOMBRE.pack(len(liste_fqa)) + t_.tobytes()
+
+
+def _fqa_octets(octets, debut):
+    # Lecture des formes quasi affines (voir _octets_fqa) : liste et position suivante.
+    (n_,) = _NOMBRE.unpack_from(octets, debut)
+    debut += _NOMBRE.size
+    fin = debut + 3 * n_ * _ENTIER.size
+    if len(octets) < fin:
+        raise ValueError("Données tronquées")
+    t_ = array.array('q')
+    t_.frombytes(octets[debut:fin])
+    if "big" == sys.byteorder:
+        t_.byteswap()
+    # REMARQUE : les caractéristiques sont déjà des entiers, les conversions de Fqa.__init__ sont inutiles.
+    liste_fqa = [Fqa.depuis_valeurs(v_) for v_ in zip(t_[0::3], t_[1::3], t_[2::3])]
+    return liste_fqa, fin
+
+
+def _verifier_fin(octets, fin):
+    # Les données doivent être lues exactement jusqu'à la fin.
+    if len(octets) != fin:
+        raise ValueError("Données en excès")
+
+
+def serialiser(objet, nommee=True):
+    """Sérialisation binaire compacte et versionnée.
+    Entrée : Une forme quasi affine, une liste de formes quasi affines ou une Base (calendriers inclus).
+           : nommee, si vrai (par défaut), une base enregistrée (voir enregistrer_base) est sérialisée par son nom.
+    Sortie : Les octets (voir deserialiser).
+    Erreur : ValueError si une caractéristique ne tient pas sur 64 bits ou si l'objet n'est pas sérialisable.
+    REMARQUE : Format : b"FQA", version (1 octet), type (1 octet) puis
+               "F" : a, b, r (entiers 64 bits signés petit-boutistes) ;
+               "L" : nombre de formes (entier 32 bits non signé) puis a, b, r de chaque forme ;
+               "B" : seuil des tables (voir Base.tabuler, -1 si aucun) puis les formes comme pour "L" ;
+               "N" : nom de la base enregistrée (UTF-8).
+    """
+    entete = _ENTETE + bytes((_VERSION,))
+    try:
+        if isinstance(objet, Fqa):
+            return entete + b"F" + b"".join(_ENTIER.pack(v) for v in (objet.a, objet.b, objet.r))
+        if isinstance(objet, Base):
+            nom = _nom_base(objet) if nommee else None
+            if nom is not None:
+                return entete + b"N" + nom.encode("utf-8")
+            seuil = -1 if objet._seuil is None else objet._seuil
+            return entete + b"B" + _ENTIER.pack(seuil) + _octets_fqa(objet.t)
+        try:
+            liste_fqa = list(objet)
+        except TypeError:
+            raise ValueError("Objet non sérialisable") from None
+        if not all(isinstance(f_, Fqa) for f_ in liste_fqa):
+            raise ValueError("Objet non sérialisable")
+        return entete + b"L" + _octets_fqa(liste_fqa)
+    except (struct.error, OverflowError) as erreur:
+        raise ValueError("Caractéristique hors des entiers 64 bits") from erreur
+
+
+def deserialiser(octets):
+    """Désérialisation (voir serialiser).
+    Entrée : Les octets (bytes, bytearray ou memoryview).
+    Sortie : La forme quasi affine, la liste de formes quasi affines ou la Base.
+    Erreur : ValueError si les octets ne sont pas dans un format reconnu, sont tronqués ou sont suivis d'octets
+             en excès.
+             KeyError si la base nommée n'est pas enregistrée.
+    """
+    octets = bytes(octets)
+    if len(octets) < 5 or _ENTETE != octets[:3]:
+        raise ValueError("Format inconnu")
+    if _VERSION != octets[3]:
+        raise ValueError("Version de format inconnue : {}".format(octets[3]))
+    genre = octets[4:5]
+    try:
+        if b"F" == genre:
+            if len(octets) != 5 + 3 * _ENTIER.size:
+                raise ValueError("Données tronquées ou en excès")
+            return Fqa.depuis_valeurs(tuple(v for (v,) in _ENTIER.iter_unpack(octets[5:])))
+        if b"L" == genre:
+            liste_fqa, fin = _fqa_octets(octets, 5)
+            _verifier_fin(octets, fin)
+            return liste_fqa
+        if b"B" == genre:
+            (seuil,) = _ENTIER.unpack_from(octets, 5)
+            liste_fqa, fin = _fqa_octets(octets, 5 + _ENTIER.size)
+            _verifier_fin(octets, fin)
+            base = Base(liste_fqa)
+            # les tables seront construites à la première utilisation (voir Base.tabuler)
+            base._seuil = seuil if 0 <= seuil else None
+            return base
+        if b"N" == genre:
+            nom = octets[5:].decode("utf-8")
+        else:
+            raise ValueError("Type inconnu : {}".format(genre))
+    except (struct.error, UnicodeDecodeError) as erreur:
+        raise ValueError("Données tronquées ou invalides") from erreur
+    return base_enregistree(nom)
+
+
 BASE_TEMPS = Base([
             Fqa(86400, 1, 0),
             Fqa(3600, 1, 0),
             Fqa(60, 1, 0),
             Fqa(1, 1, 0),
         ])
+enregistrer_base("BASE_TEMPS", BASE_TEMPS, __name__)
 
 if "__main__" == __name__:
 
@@ -1,6 +1,13 @@
 # Outils
 """Fonctions utiles."""
 
+import array
+
+try:
+    import numpy
+except ImportError:  # NumPy est facultatif : les traitements par lots se replient sur array.
+    numpy = None
+
 # Précision par défaut des comparaisons entre flottants
 _PRECISION = 1e-15
 
@@ -154,3 +161,183 @@ def ppcm(a, b):
     if 0 > p:
         p = -p
     return p
+
+
+def somme_plancher(n, m, a, b):
+    """Somme des parties entières [(a * i + b) / m] pour 0 <= i < n.
+    Entrée : Des nombres entiers n >= 0, m > 0, a et b.
+    Sortie : La somme calculée en O(log max(a, m)) opérations.
+    Référence : https://atcoder.github.io/ac-library/production/document_en/math.html (floor_sum)
+    REMARQUE : Comme pour l'algorithme d'Euclide, on réduit a et b modulo m puis on échange
+               les rôles de a et m (symétrie par rapport à la diagonale).
+    """
+    n, m, a, b = int(n), int(m), int(a), int(b)
+    assert 0 < m and 0 <= n
+    s = 0
+    while True:
+        if a >= m or 0 > a:
+            q, a = divmod(a, m)
+            s += q * (n * (n - 1) // 2)
+        if b >= m or 0 > b:
+            q, b = divmod(b, m)
+            s += q * n
+        y_max = a * n + b
+        if y_max < m:
+            return s
+        n, b = divmod(y_max, m)
+        m, a = a, m
+
+
+def _restaurer(classe, valeurs):
+    # Reconstruction d'une instance Immuable à partir des valeurs de ses attributs (voir Immuable.__reduce__).
+    objet = classe.__new__(classe)
+    for nom, valeur in zip(classe._attributs(), valeurs):
+        object.__setattr__(objet, nom, valeur)
+    return objet
+
+
+class Immuable:
+    """Classe de base des types valeurs immuables.
+    Les classes dérivées déclarent leurs attributs dans __slots__ et les fixent dans __init__
+    avec object.__setattr__, toute modification ultérieure est ensuite refusée.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _attributs(cls):
+        # Noms des attributs déclarés dans les __slots__ de la classe et de ses ancêtres.
+        return tuple(nom for c_ in reversed(cls.__mro__) for nom in c_.__dict__.get("__slots__", ()))
+
+    def __setattr__(self, nom, valeur):
+        raise AttributeError("{} est immuable".format(type(self).__name__))
+
+    def __delattr__(self, nom):
+        raise AttributeError("{} est immuable".format(type(self).__name__))
+
+    @classmethod
+    def depuis_valeurs(cls, valeurs):
+        """Entrée : Les valeurs des attributs dans l'ordre de leur déclaration dans __slots__.
+        Sortie : L'instance, construite sans repasser par les conversions de __init__.
+        ATTENTION : Les valeurs doivent être celles d'une instance valide (déjà converties et normalisées).
+        """
+        return _restaurer(cls, valeurs)
+
+    def __reduce__(self):
+        # Copie et sérialisation (pickle) à l'identique, sans repasser par les conversions de __init__.
+        return _restaurer, (type(self), tuple(getattr(self, nom) for nom in self._attributs()))
+
+
+def plat(t):
+    """Valeurs d'une colonne, sans conversion (voir entiers).
+    Entrée : Une colonne t (array.array, memoryview, tableau NumPy ou séquence de nombres).
+    Sortie : Un itérable sur les valeurs de t (à plat pour un memoryview à plusieurs dimensions).
+    """
+    if isinstance(t, memoryview) and 1 < t.ndim:
+        return t.cast('B').cast(t.format)
+    return t
+
+
+def entiers(t):
+    """Entiers d'une colonne.
+    Entrée : Une colonne t (array.array, memoryview, tableau NumPy ou séquence d'entiers).
+    Sortie : Un tableau NumPy d'entiers 64 bits de même forme que t si NumPy est installé,
+             sinon un itérable sur les entiers de t (à plat).
+    Erreur : OverflowError si une valeur dépasse les entiers 64 bits.
+    REMARQUE : Comme pour int(), les flottants sont tronqués.
+    """
+    if numpy is not None:
+        t = numpy.asarray(t)
+        if t.dtype.kind in "uf" and t.size and not (-2 ** 63 <= t.min() and t.max() < 2 ** 63):
+            raise OverflowError("Valeur hors des entiers 64 bits")
+        return t.astype(numpy.int64, copy=False)
+    if isinstance(t, memoryview):
+        if 1 < t.ndim:
+            t = t.cast('B').cast(t.format)
+        if t.format in "fd":
+            return map(int, t)
+        return t
+    if isinstance(t, array.array) and t.typecode in "fd":
+        return map(int, t)
+    return t
+
+
+def colonne(modele, valeurs, code='l'):
+    """Colonne de résultats.
+    Entrée : La colonne modele fournie en entrée d'un traitement par lot.
+             Les valeurs (tableau NumPy ou itérable de nombres) résultant du traitement.
+             Le code du type des valeurs ('l' entiers par défaut, 'd' flottants) comme pour array.array.
+    Sortie : Une colonne de même nature et de même forme que modele :
+             un tableau NumPy si modele en est un, un memoryview si modele en est un,
+             un array.array(code) sinon.
+    Erreur : OverflowError si des valeurs entières dépassent les entiers 64 bits (sauf pour un tableau NumPy).
+    REMARQUE : Pour un modele NumPy, des valeurs entières (Python) hors des entiers 64 bits donnent
+               un tableau d'objets.
+    """
+    if numpy is not None and isinstance(modele, numpy.ndarray) and not isinstance(valeurs, numpy.ndarray):
+        valeurs = list(valeurs)
+        try:
+            valeurs = numpy.array(valeurs, dtype=numpy.dtype(code))
+        except OverflowError:
+            valeurs = numpy.array(valeurs, dtype=object)
+        return valeurs.reshape(modele.shape)
+    if numpy is not None and isinstance(valeurs, numpy.ndarray):
+        if isinstance(modele, numpy.ndarray):
+            return valeurs
+        c = array.array(code)
+        c.frombytes(valeurs.astype(numpy.dtype(code), copy=False).tobytes())
+    else:
+        c = array.array(code, valeurs)
+    if isinstance(modele, memoryview):
+        v = memoryview(c)
+        if 1 < modele.ndim:
+            v = v.cast('B').cast(code, modele.shape)
+        return v
+    return c
+
+
+class TableCycle:
+    """Table des dates d'un cycle de calendrier : un calendrier dont les dates se répètent tous les periode jours,
+    à annees années près, est lu dans des tables compactes au lieu d'être calculé.
+    Les tables (années dans le cycle array('H'), mois et jours array('B')) sont construites à la première utilisation.
+    """
+
+    def __init__(self, periode, annees, origine, date):
+        """Entrée : La période du cycle en jours, le nombre d'années du cycle, le numéro origine du premier jour
+                 d'un cycle et la fonction date(n) donnant le triplet d'entiers (année, mois, jour) du jour n.
+        Sortie : La table (vide jusqu'à la première utilisation).
+        """
+        self.periode = periode
+        self.annees = annees
+        self.origine = origine
+        self._date = date
+        self._tables = None
+
+    def _construire(self):
+        # Une seule évaluation de date par jour du premier cycle.
+        annee, mois, jour = array.array('H'), array.array('B'), array.array('B')
+        a0_ = self._date(self.origine)[0]
+        for n_ in range(self.origine, self.origine + self.periode):
+            a_, m_, j_ = self._date(n_)
+            annee.append(a_ - a0_)
+            mois.append(m_)
+            jour.append(j_)
+        self._tables = a0_, annee, mois, jour
+        return self._tables
+
+    def __call__(self, n_):
+        """Entrée : Un numéro de jour entier n.
+        Sortie : Le triplet d'entiers (année, mois, jour) du jour n.
+        """
+        tables = self._tables
+        if tables is None:
+            tables = self._construire()
+        a0_, annee, mois, jour = tables
+        k_, p_ = divmod(n_ - self.origine, self.periode)
+        return a0_ + self.annees * k_ + annee[p_], mois[p_], jour[p_]
+
+    def octets(self):
+        """Sortie : La taille en octets des tables (0 si elles ne sont pas encore construites)."""
+        if self._tables is None:
+            return 0
+        return sum(len(t_) * t_.itemsize for t_ in self._tables[1:])
@@ -1,5 +1,6 @@
 """Module de test de calendar."""
 
+import copy
 import unittest
 
 from . import calendrier
@@ -231,6 +232,56 @@ class CalendarTestCase(unittest.TestCase):
             # print("pentecost({})".format(a_), g_p, pentecotes[i_])
             self.assertEqual(g_p, pentecotes[i_])
 
+    def test_gregorian_leap_year(self):
+        """Référence : [2] (2.16) p.36 : les années séculaires non multiples de 400 ne sont pas bissextiles."""
+        tt = [(1600, True), (1700, False), (1800, False), (1900, False), (2000, True), (2004, True), (2019, False),
+              (2100, False), (0, True), (-100, False), (-4, True)]
+        for g_year, leap in tt:
+            self.assertEqual(leap, calendar.gregorian_leap_year(g_year))
+        self.assertEqual(calendar.fixed_from_gregorian(calendar.GDate(3, 1, 1900)),
+                         calendar.fixed_from_gregorian(calendar.GDate(2, 28, 1900)) + 1)
+        for g_year in (1900, 2000):
+            date = calendar.GDate(12, 31, g_year)
+            self.assertEqual(calendrier.Date(calendrier.CALENDRIER_GRE, g_year, 12, 31)().n,
+                             calendar.fixed_from_gregorian(date))
+
+    def test_gregorian_leap_year_regression(self):
+        """Années séculaires : 365 jours sauf pour les multiples de 400, pas de 29 février en 1900, 2100, ..."""
+        for g_year in range(-800, 2801, 100):
+            jan1 = calendar.fixed_from_gregorian(calendar.GDate(1, 1, g_year))
+            next_jan1 = calendar.fixed_from_gregorian(calendar.GDate(1, 1, g_year + 1))
+            self.assertEqual(366 if 0 == g_year % 400 else 365, next_jan1 - jan1)
+            mar1 = calendar.fixed_from_gregorian(calendar.GDate(3, 1, g_year))
+            self.assertEqual(calendar.GDate(2, 28 if g_year % 400 else 29, g_year),
+                             calendar.gregorian_from_fixed(mar1 - 1))
+            self.assertEqual(calendrier.Date(calendrier.CALENDRIER_GRE, g_year, 3, 1)().n, mar1)
+
+    def test_tabulated_from_fixed(self):
+        """Les tables des cycles donnent les mêmes dates que gregorian_from_fixed et julian_from_fixed."""
+        tt = list(range(-1000000, 1000000, 997)) + list(range(_JULIAN_EPOCH - 800, _JULIAN_EPOCH + 800))
+        for date in tt + [d + 0.75 for d in tt[::10]]:
+            self.assertEqual(calendar.gregorian_from_fixed(date), calendar.tabulated_gregorian_from_fixed(date))
+            self.assertEqual(calendar.julian_from_fixed(date), calendar.tabulated_julian_from_fixed(date))
+
+    def test_direct_from_fixed(self):
+        """Les calculs en une seule passe donnent les mêmes dates que gregorian_from_fixed, julian_from_fixed
+        et iso_from_fixed."""
+        tt = (list(range(-1000000, 1000001, 101)) + list(range(-1500, 1500))
+              + list(range(_JULIAN_EPOCH - 1500, _JULIAN_EPOCH + 1500)))
+        for date in tt + [d + 0.5 for d in tt[::10]]:
+            self.assertEqual(calendar.gregorian_from_fixed(date), calendar.direct_gregorian_from_fixed(date))
+            self.assertEqual(calendar.julian_from_fixed(date), calendar.direct_julian_from_fixed(date))
+            self.assertEqual(calendar.iso_from_fixed(date), calendar.direct_iso_from_fixed(date))
+
+    def test_dates_immuables(self):
+        """Les dates sont immuables et utilisables comme clefs."""
+        for d_ in [calendar.GDate(7, 14.25, 1789), calendar.JDate(7, 3, 1789), calendar.ISODate(28, 2, 1789),
+                   calendar.CDate(11, 7, 1505), calendar.EDate(11, 7, 1781)]:
+            with self.assertRaises(AttributeError):
+                d_.year = 0
+            self.assertEqual(d_, copy.copy(d_))
+            self.assertEqual(1, len({d_, eval("calendar." + repr(d_))}))
+
     def test_coptic_date(self):
         """Référence : [2] pp. 57-58."""
         # https://www.timeanddate.com/holidays/egypt/coptic-christmas-day (consulté en 2019)
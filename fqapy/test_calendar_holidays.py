@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+
+from . import calendar
+from . import outils
+
+
+def _holidays(g_year):
+    # Fêtes de l'année calculées une par une avec les fonctions de calendar.
+    t_ = []
+    for code, nom in enumerate(calendar.HOLIDAY_NAMES):
+        dates = getattr(calendar, nom)(g_year)
+        t_ += [(int(d), code, nom) for d in (dates if isinstance(dates, list) else [dates])]
+    return [(d, nom) for d, _, nom in sorted(t_)]
+
+
+class HolidaysTestCase(unittest.TestCase):
+    """Holidays doit donner les mêmes fêtes que les fonctions de calendar."""
+
+    ty = list(range(-40, 40)) + list(range(1550, 2150))
+
+    def verifier(self):
+        h = calendar.Holidays(1600, 2100)
+        self.assertEqual(sum(len(_holidays(y)) for y in range(1600, 2101)), len(h))
+        for g_year in self.ty:
+            self.assertEqual(_holidays(g_year), h.year(g_year))
+        h = calendar.Holidays()
+        for g_year in (-1, 1, 1999, 2000, 2024):
+            for d, nom in _holidays(g_year):
+                self.assertIn(nom, h.holidays_on(d))
+                self.assertIn(nom, h.holidays_on(d + 0.75))
+                self.assertTrue(h.is_holiday(d))
+        self.assertEqual(0, len(h))
+        # une seule fête pour l'année 0
+        noel = calendar.fixed_from_julian(calendar.JDate(12, 25, -1))
+        self.assertEqual([(noel, "eastern_orthodox_christmas")],
+                         [e_ for e_ in h.year(0) if "eastern_orthodox_christmas" == e_[1]])
+        self.assertEqual([noel], calendar.eastern_orthodox_christmas(0))
+
+    def test_holidays(self):
+        """Calcul avec NumPy s'il est installé."""
+        self.verifier()
+
+    def test_holidays_sans_numpy(self):
+        """Calcul sans NumPy."""
+        with mock.patch.object(outils, "numpy", None):
+            self.verifier()
+
+    def test_jours(self):
+        """Jours fériés et non fériés, fêtes entre deux jours."""
+        h = calendar.Holidays()
+        noel = calendar.fixed_from_gregorian(calendar.GDate(12, 25, 2019))
+        self.assertEqual(["christmas"], h.holidays_on(noel))
+        self.assertEqual([], h.holidays_on(noel + 1))
+        self.assertFalse(h.is_holiday(noel - 1))
+        paques = calendar.easter(2019)
+        self.assertEqual([(paques, "easter")], h.between(paques - 1, paques + 1))
+        self.assertEqual([(paques + 49, "pentecost")], h.between(paques + 40, paques + 50))
+        self.assertEqual([], h.between(paques + 1, paques))
+        # les années demandées étendent la plage calculée
+        self.assertEqual(_holidays(2018) + _holidays(2019) + _holidays(2020),
+                         h.between(calendar.fixed_from_gregorian(calendar.GDate(1, 1, 2018)),
+                                   calendar.fixed_from_gregorian(calendar.GDate(12, 31, 2020))))
+        h.compute(2010, 2030)
+        self.assertEqual(sum(len(_holidays(y)) for y in range(2010, 2031)), len(h))
+        self.assertEqual(_holidays(2010), h.year(2010))
+        # années isolées : seules les dernières utilisées sont conservées
+        isolees = calendar.Holidays(cache_size=2)
+        for g_year in (1900, 1950, 1900, 2500):
+            self.assertTrue(isolees.is_holiday(calendar.christmas(g_year)))
+        self.assertEqual([1900, 2500], list(isolees._years))
+        self.assertEqual(_holidays(1950), isolees.year(1950))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import array
+import unittest
+from unittest import mock
+
+from . import calendar
+from . import outils
+from .test_calendrier_lot import _liste
+
+
+class CalendarLotTestCase(unittest.TestCase):
+    """Les fonctions *_lot doivent donner les mêmes résultats que les fonctions de calendar ligne par ligne."""
+
+    tc = [
+        ("gregorian", calendar.GDate, "month"),
+        ("julian", calendar.JDate, "month"),
+        ("iso", calendar.ISODate, "week"),
+        ("coptic", calendar.CDate, "month"),
+        ("ethiopic", calendar.EDate, "month"),
+    ]
+    tn = list(range(-1000000, 1000001, 997)) + list(range(1721000, 1722000, 3)) + [-1, 0, 1]
+    tf = [0.0, 0.25, 0.5, 0.75]
+
+    def verifier(self, modele):
+        tf = [self.tf[i % 4] for i in range(len(self.tn))]
+        dates = [n + f for n, f in zip(self.tn, tf)]
+        for nom, classe, premier in self.tc:
+            depuis = getattr(calendar, nom + "_from_fixed")
+            vers = getattr(calendar, "fixed_from_" + nom)
+            attendu = [depuis(d) for d in dates]
+            u_, v_, w_, t_ = getattr(calendar, nom + "_from_fixed_lot")(modele(dates, 'd'))
+            self.assertEqual(attendu, [classe(*e_) for e_ in zip(*[_liste(c_) for c_ in (u_, v_, w_, t_)])])
+            u_, v_, w_, t_ = getattr(calendar, nom + "_from_fixed_lot")(modele(self.tn, 'l'))
+            self.assertEqual([getattr(d, premier) for d in attendu], _liste(u_))
+            self.assertEqual([0.0] * len(self.tn), _liste(t_))
+            n_, f_ = getattr(calendar, "fixed_from_" + nom + "_lot")(u_, v_, w_, modele(tf, 'd'))
+            self.assertEqual([vers(d) for d in attendu], [n + f for n, f in zip(_liste(n_), _liste(f_))])
+            n_, f_ = getattr(calendar, "fixed_from_" + nom + "_lot")(u_, v_, w_)
+            self.assertEqual(self.tn, _liste(n_))
+
+    def test_lot(self):
+        """Colonnes array.array et memoryview (avec NumPy s'il est installé)."""
+        self.verifier(lambda t, code: array.array(code, t))
+        self.verifier(lambda t, code: memoryview(array.array(code, t)))
+
+    def test_lot_sans_numpy(self):
+        """Colonnes array.array et memoryview sans NumPy."""
+        with mock.patch.object(outils, "numpy", None):
+            self.verifier(lambda t, code: array.array(code, t))
+            self.verifier(lambda t, code: memoryview(array.array(code, t)))
+
+    @unittest.skipIf(outils.numpy is None, "NumPy n'est pas installé")
+    def test_lot_numpy(self):
+        """Tableaux NumPy."""
+        self.verifier(lambda t, code: outils.numpy.array(t, dtype=code))
+
+
+if __name__ == '__main__':
+    unittest.main()
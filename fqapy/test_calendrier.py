@@ -17,6 +17,7 @@
     https://mathinfo.unistra.fr/websites/math-info/irem/Publications/L_Ouvert/n071/o_71_27-42.pdf
 """
 
+import pickle
 import unittest
 
 from . import calendrier
@@ -187,6 +188,28 @@ class CalendrierTestCase(unittest.TestCase):
             self.assertEqual(calendrier.CALENDRIER_GRE, v_["date"].calendrier)
             self.assertEqual(v_["date"], date_)
 
+    def test_immuable(self):
+        """Les dates et les jours julien sont immuables et utilisables comme clefs."""
+        dt_ = calendrier.Date(calendrier.CALENDRIER_GRE, 2019, 6, 27.25)
+        jj_ = dt_()
+        for v_ in [dt_, jj_]:
+            with self.assertRaises(AttributeError):
+                v_.u = 1
+            with self.assertRaises(AttributeError):
+                v_.n = 1
+            self.assertEqual(v_, pickle.loads(pickle.dumps(v_)))
+        self.assertIn(calendrier.CALENDRIER_GRE.date(jj_), {dt_})
+        self.assertIn(calendrier.EPOQUE_JJ + 2458662.25, {jj_})
+        # += produit un nouveau jour julien
+        jj0 = jj_
+        jj_ += 1
+        self.assertEqual(jj0 + 1, jj_)
+        self.assertIsInstance(jj_, calendrier.JourJulien)
+        self.assertEqual(2458662, jj0.n)
+        # instances partagées
+        self.assertIs(calendrier.EPOQUE_RD, calendrier.interner(calendrier.EPOQUE_JD + 1721424.5))
+        self.assertIs(jj_, calendrier.interner(jj_))
+
 
 if "__main__" == __name__:
     # print("EPOQUE_JUL - EPOQUE_JJ", calendrier.EPOQUE_JUL - calendrier.EPOQUE_JJ)
@@ -0,0 +1,80 @@
+import array
+import itertools
+import unittest
+from unittest import mock
+
+from . import calendrier
+from . import outils
+from .test_calendrier_lot import _CalendrierJours, _liste
+
+
+class CalendrierConvertirTestCase(unittest.TestCase):
+    """convertir et convertir_lot doivent donner les mêmes résultats que date_vers_jj suivie de date."""
+
+    tc = [calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_JUL, calendrier.CALENDRIER_ISL, _CalendrierJours()]
+    tn = list(range(2451500, 2451900, 7)) + [-1721424, -1, 0, 1, 1721424, 2299160, 2299161]
+
+    def attendu(self, source, cible, u_, v_, w_):
+        date = cible.date(source.date_vers_jj(calendrier.Date(source, u_, v_, w_)))
+        return date.u, int(date.v), date.w
+
+    def dates(self, source):
+        # Dates de source, dont des mois et des jours hors des bornes habituelles
+        dates = []
+        for i, n in enumerate(self.tn):
+            date = source.date(calendrier.JourJulien(n))
+            dates.append((date.u, int(date.v) + 12 * (i % 3 - 1), date.w - 40 * (i % 2)))
+        return dates
+
+    def test_convertir(self):
+        """Conversion date par date."""
+        for source, cible in itertools.product(self.tc, repeat=2):
+            for u, v, w in self.dates(source):
+                self.assertEqual(self.attendu(source, cible, u, v, w), calendrier.convertir(source, cible, u, v, w))
+
+    def verifier_lot(self, modele):
+        for source, cible in itertools.product(self.tc, repeat=2):
+            dates = self.dates(source)
+            colonnes = [modele(list(c_)) for c_ in zip(*dates)]
+            resultat = calendrier.convertir_lot(source, cible, *colonnes)
+            self.assertEqual([self.attendu(source, cible, *d) for d in dates],
+                             list(zip(*[_liste(c_) for c_ in resultat])))
+
+    def test_convertir_lot(self):
+        """Conversion de colonnes array.array et memoryview (avec NumPy s'il est installé)."""
+        self.verifier_lot(lambda t: array.array('l', t))
+        self.verifier_lot(lambda t: memoryview(array.array('l', t)))
+
+    def test_convertir_lot_sans_numpy(self):
+        """Conversion de colonnes array.array et memoryview sans NumPy."""
+        with mock.patch.object(outils, "numpy", None):
+            self.verifier_lot(lambda t: array.array('l', t))
+            self.verifier_lot(lambda t: memoryview(array.array('l', t)))
+
+    @unittest.skipIf(outils.numpy is None, "NumPy n'est pas installé")
+    def test_convertir_lot_numpy(self):
+        """Conversion de tableaux NumPy."""
+        self.verifier_lot(outils.numpy.array)
+
+    def test_cache(self):
+        """La fonction de conversion est construite une fois, puis reconstruite après modification d'un calendrier."""
+        source, cible = calendrier._CalendrierJul(), calendrier.CALENDRIER_GRE
+        conversion = calendrier._conversion(source, cible)
+        self.assertIs(conversion, calendrier._conversion(source, cible))
+        source.tabuler()
+        self.assertIsNot(conversion, calendrier._conversion(source, cible))
+        self.assertEqual((1582, 10, 15), calendrier.convertir(source, cible, 1582, 10, 5))
+
+    def test_cache_borne(self):
+        """Les conversions de calendriers éphémères ne s'accumulent pas."""
+        cible = calendrier.CALENDRIER_GRE
+        for _ in range(3 * calendrier._TAILLE_CONVERSIONS):
+            self.assertEqual((1582, 10, 15), calendrier.convertir(calendrier._CalendrierJul(), cible, 1582, 10, 5))
+        self.assertGreaterEqual(calendrier._TAILLE_CONVERSIONS, len(calendrier._CONVERSIONS))
+        for source, cible_, *_ in calendrier._CONVERSIONS.values():
+            self.assertIsInstance(source, calendrier.Calendrier)
+            self.assertIsInstance(cible_, calendrier.Calendrier)
+
+
+if __name__ == '__main__':
+    unittest.main()
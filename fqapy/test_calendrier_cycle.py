@@ -0,0 +1,46 @@
+import pickle
+import unittest
+
+from . import calendrier
+
+
+class CalendrierCycleTestCase(unittest.TestCase):
+    """date_cycle doit donner les mêmes dates que date."""
+
+    tc = [calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_JUL]
+    tn = list(range(-2000000, 3000000, 1009)) + list(range(2299000, 2300000))
+
+    def verifier(self, cal):
+        for n in self.tn:
+            jj_ = calendrier.JourJulien(n, 0.5)
+            self.assertEqual(cal.date(jj_), cal.date_cycle(jj_))
+
+    def test_date_cycle(self):
+        """Calendriers grégorien et julien."""
+        for cal in self.tc:
+            self.verifier(cal)
+
+    def test_taille(self):
+        """Taille des tables : deux octets pour l'année et un octet pour le mois et le jour de chaque jour du cycle."""
+        for cal in self.tc:
+            cal.date_cycle(calendrier.EPOQUE_RD)
+            self.assertEqual(4 * cal._CYCLE[0], cal._table_cycle().octets())
+
+    def test_invalider(self):
+        """La table du cycle suit les modifications et les copies du calendrier."""
+        cal = calendrier._CalendrierJul()
+        table = cal._table_cycle()
+        self.assertIs(table, cal._table_cycle())
+        cal.tabuler()
+        self.assertIsNot(table, cal._table_cycle())
+        copie = pickle.loads(pickle.dumps(cal))
+        self.verifier(copie)
+
+    def test_sans_cycle(self):
+        """Un calendrier sans cycle n'a pas de table."""
+        with self.assertRaises(AssertionError):
+            calendrier.CALENDRIER_ISL.date_cycle(calendrier.EPOQUE_RD)
+
+
+if __name__ == '__main__':
+    unittest.main()
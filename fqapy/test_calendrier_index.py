@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from . import calendrier
+from . import outils
+
+
+class IndexJoursTestCase(unittest.TestCase):
+    """L'index des jours doit donner les mêmes dates que les calendriers."""
+
+    debut, fin = 2299000, 2299000 + 3000
+
+    def setUp(self):
+        descripteur, self.fichier = tempfile.mkstemp()
+        os.close(descripteur)
+
+    def tearDown(self):
+        os.remove(self.fichier)
+
+    def verifier(self):
+        taille = calendrier.ecrire_index(self.fichier, self.debut, self.fin, taille_morceau=1000)
+        self.assertEqual(os.path.getsize(self.fichier), taille)
+        with calendrier.IndexJours(self.fichier) as index:
+            self.assertEqual(self.fin - self.debut, len(index))
+            self.assertIn(self.debut, index)
+            self.assertNotIn(self.fin, index)
+            for n in range(self.debut, self.fin, 7):
+                jj_ = calendrier.JourJulien(n, 0.25)
+                for cal in (calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_JUL, calendrier.CALENDRIER_ISL):
+                    self.assertEqual(cal.date(jj_), index.date(cal, jj_))
+                self.assertEqual(jj_.jour_semaine(), index.jour_semaine(n))
+            with self.assertRaises(IndexError):
+                index.enregistrement(self.debut - 1)
+            with self.assertRaises(ValueError):
+                index.date(calendrier._CalendrierJul(), calendrier.JourJulien(self.debut))
+
+    def test_index(self):
+        """Index écrit avec NumPy s'il est installé."""
+        self.verifier()
+
+    def test_index_sans_numpy(self):
+        """Index écrit sans NumPy."""
+        with mock.patch.object(outils, "numpy", None):
+            self.verifier()
+
+    def test_an_2000(self):
+        """Enregistrement du 1er janvier 2000."""
+        calendrier.ecrire_index(self.fichier, 2451545, 2451546)
+        with calendrier.IndexJours(self.fichier) as index:
+            self.assertEqual((2000, 1, 1, 1999, 12, 19, 1420, 9, 24, calendrier.Jours.SAMEDI),
+                             index.enregistrement(2451545))
+
+    def ecrire(self, contenu):
+        with open(self.fichier, "wb") as sortie:
+            sortie.write(contenu)
+
+    def test_format(self):
+        """Fichiers qui ne sont pas des index."""
+        with self.assertRaises(ValueError):
+            calendrier.ecrire_index(self.fichier, 10, 10)
+        self.ecrire(b"")
+        with self.assertRaises(ValueError):
+            calendrier.IndexJours(self.fichier)
+        self.ecrire(b"FQJ\x01")
+        with self.assertRaises(ValueError):
+            calendrier.IndexJours(self.fichier)
+        self.ecrire(b"FQA\x01" + bytes(16))
+        with self.assertRaises(ValueError):
+            calendrier.IndexJours(self.fichier)
+        self.ecrire(b"FQJ\x02" + bytes(16))
+        with self.assertRaises(ValueError):
+            calendrier.IndexJours(self.fichier)
+        # un jour annoncé, aucun enregistrement
+        self.ecrire(b"FQJ\x01" + bytes(8) + b"\x01" + bytes(7))
+        with self.assertRaises(ValueError):
+            calendrier.IndexJours(self.fichier)
+        # en-tête sans jour : index vide valide
+        self.ecrire(b"FQJ\x01" + bytes(16))
+        with calendrier.IndexJours(self.fichier) as index:
+            self.assertEqual(0, len(index))
+        calendrier.ecrire_index(self.fichier, 0, 10)
+        with open(self.fichier, "ab") as sortie:
+            sortie.write(b"\x00")
+        with self.assertRaises(ValueError):
+            calendrier.IndexJours(self.fichier)
+
+if __name__ == '__main__':
+    unittest.main()
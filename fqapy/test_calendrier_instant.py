@@ -0,0 +1,71 @@
+import pickle
+import unittest
+from fractions import Fraction
+
+from . import calendrier
+
+
+class InstantTestCase(unittest.TestCase):
+    """Instant : jour et nanosecondes entiers."""
+
+    ns_heure = calendrier.NS_JOUR // 24
+
+    def test_normalisation(self):
+        """Les nanosecondes vérifient 0 <= ns < NS_JOUR."""
+        t = [
+            ((0, 0), (0, 0)),
+            ((1, calendrier.NS_JOUR), (2, 0)),
+            ((1, -1), (0, calendrier.NS_JOUR - 1)),
+            ((-3, -5 * calendrier.NS_JOUR // 2), (-6, calendrier.NS_JOUR // 2)),
+        ]
+        for (n, ns), (n_, ns_) in t:
+            i = calendrier.Instant(n, ns)
+            self.assertEqual((n_, ns_), (i.n, i.ns))
+
+    def test_arithmetique(self):
+        """Les calculs sont exacts quel que soit l'ordre des opérations."""
+        i = calendrier.Instant.depuis_jj(calendrier.EPOQUE_GRE)
+        self.assertEqual(i + 0.3, i + 0.1 + 0.2)
+        self.assertEqual(i + 0.3, 0.2 + (0.1 + i))
+        self.assertEqual(i, i + Fraction(1, 3) + Fraction(2, 3) - 1)
+        self.assertEqual(i + 1, i + Fraction(1, 24) * 24)
+        self.assertEqual(Fraction(5, 4), (i + 1.25) - i)
+        self.assertEqual(-5 * self.ns_heure, (i - Fraction(5, 24)).ecart(i))
+        self.assertEqual(calendrier.Instant(i.n - 1, 23 * self.ns_heure), i - Fraction(1, 24))
+
+    def test_comparaisons(self):
+        """Comparaisons et hachage."""
+        i = calendrier.Instant(2451545, 1)
+        j = calendrier.Instant(2451545, 2)
+        self.assertTrue(i < j <= j < i + 1)
+        self.assertTrue(i + 1 > j >= j > i)
+        self.assertNotEqual(i, j)
+        self.assertNotEqual(i, calendrier.JourJulien(2451545))
+        self.assertEqual(1, len({i, calendrier.Instant(2451544, calendrier.NS_JOUR + 1)}))
+        self.assertEqual([i, j], sorted([j, i]))
+
+    def test_jj_date(self):
+        """Passage par les Jours julien et les dates."""
+        t = [
+            (calendrier.CALENDRIER_GRE, 2000, 1, 1.5, calendrier.Instant(2451545, calendrier.NS_JOUR // 2)),
+            (calendrier.CALENDRIER_JUL, 1582, 10, 4.75, calendrier.Instant(2299160, 3 * calendrier.NS_JOUR // 4)),
+            (calendrier.CALENDRIER_ISL, 1, 1, 1, calendrier.Instant(1948440)),
+        ]
+        for c_, a_, m_, j_, i in t:
+            date = calendrier.Date(c_, a_, m_, j_)
+            self.assertEqual(i, calendrier.Instant.depuis_date(date))
+            self.assertEqual(i, calendrier.Instant.depuis_jj(i.jj()))
+            self.assertEqual(date, i.date(c_))
+            self.assertEqual(date(), i.jj())
+            self.assertEqual(i.jj()(), i())
+
+    def test_immuable(self):
+        """Un Instant est immuable et se copie à l'identique."""
+        i = calendrier.Instant(2451545, 12345)
+        with self.assertRaises(AttributeError):
+            i.ns = 0
+        self.assertEqual(i, pickle.loads(pickle.dumps(i)))
+
+
+if __name__ == '__main__':
+    unittest.main()
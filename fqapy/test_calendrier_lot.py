@@ -0,0 +1,91 @@
+import array
+import unittest
+from unittest import mock
+
+from . import calendrier
+from . import fqa
+from . import outils
+from .test_fqa_lot import a_plat
+
+
+def _liste(t):
+    # Liste à plat d'une colonne d'entiers ou de flottants
+    if outils.numpy is not None and isinstance(t, outils.numpy.ndarray):
+        return t.ravel().tolist()
+    return a_plat(t)
+
+
+class _CalendrierJours(calendrier.Calendrier):
+    # Calendrier sans chiffres définis (voir Calendrier._vers_chiffres) : numéro de jour seul.
+
+    def __init__(self):
+        super().__init__([fqa.Fqa(1, 1, 0)])
+
+    def date_vers_jj(self, date):
+        return calendrier.JourJulien(date.w, date.t)
+
+    def date(self, jj_):
+        return calendrier.Date(self, 0, 1, jj_.n, jj_.f)
+
+    def __str__(self):
+        return "CALENDRIER_JOURS"
+
+
+class CalendrierLotTestCase(unittest.TestCase):
+    """Les traitements par lot doivent donner les mêmes résultats que date_vers_jj et date."""
+
+    tc = [calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_JUL, calendrier.CALENDRIER_ISL, _CalendrierJours()]
+    tn = list(range(2451500, 2451900, 3)) + [-1721424, -1, 0, 1, 1721424, 2299160, 2299161]
+    tf = [0.0, 0.25, 0.5, 0.75]
+
+    def verifier(self, modele):
+        for cal in self.tc:
+            tf = [self.tf[i % 4] for i in range(len(self.tn))]
+            dates = [cal.date(calendrier.JourJulien(n, f)) for n, f in zip(self.tn, tf)]
+            u_, v_, w_, t_ = cal.date_lot(modele(self.tn, 'l'), modele(tf, 'd'))
+            self.assertEqual([d.u for d in dates], _liste(u_))
+            self.assertEqual([int(d.v) for d in dates], _liste(v_))
+            self.assertEqual([d.w for d in dates], _liste(w_))
+            self.assertEqual([d.t for d in dates], _liste(t_))
+            n_, f_ = cal.date_vers_jj_lot(u_, v_, w_, t_)
+            self.assertEqual(self.tn, _liste(n_))
+            self.assertEqual(tf, _liste(f_))
+            # jours avec fractions, mois et jours hors des bornes habituelles
+            uu = [d.u for d in dates]
+            vv = [int(d.v) + 12 * (i % 3 - 1) for i, d in enumerate(dates)]
+            ww = [d.w + 0.5 * (i % 5) - 40 * (i % 2) for i, d in enumerate(dates)]
+            attendu = [calendrier.Date(cal, u, v, w)() for u, v, w in zip(uu, vv, ww)]
+            n_, f_ = cal.date_vers_jj_lot(modele(uu, 'l'), modele(vv, 'l'), modele(ww, 'd'))
+            self.assertEqual([jj_.n for jj_ in attendu], _liste(n_))
+            self.assertEqual([jj_.f for jj_ in attendu], _liste(f_))
+            n_, f_ = cal.date_vers_jj_lot(uu, vv, [int(w) for w in ww])
+            self.assertEqual([calendrier.Date(cal, u, v, int(w))().n for u, v, w in zip(uu, vv, ww)], _liste(n_))
+
+    def test_lot(self):
+        """Colonnes array.array et memoryview (avec NumPy s'il est installé)."""
+        self.verifier(lambda t, code: array.array(code, t))
+        self.verifier(lambda t, code: memoryview(array.array(code, t)))
+
+    def test_lot_sans_numpy(self):
+        """Colonnes array.array et memoryview sans NumPy."""
+        with mock.patch.object(outils, "numpy", None):
+            self.verifier(lambda t, code: array.array(code, t))
+            self.verifier(lambda t, code: memoryview(array.array(code, t)))
+
+    @unittest.skipIf(outils.numpy is None, "NumPy n'est pas installé")
+    def test_lot_numpy(self):
+        """Tableaux NumPy."""
+        self.verifier(lambda t, code: outils.numpy.array(t, dtype=code))
+
+    def test_lot_sans_chiffres(self):
+        """Un calendrier sans chiffres définis ne fait aucun calcul par lot inutile."""
+        cal = _CalendrierJours()
+        with mock.patch.object(cal, "inv_lot") as inv_lot:
+            u_, v_, w_, t_ = cal.date_lot(array.array('l', self.tn), [0.25] * len(self.tn))
+        inv_lot.assert_not_called()
+        self.assertEqual(self.tn, _liste(w_))
+        self.assertEqual([0.25] * len(self.tn), _liste(t_))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import array
+import unittest
+from unittest import mock
+
+from . import calendrier
+from . import fqa
+from . import outils
+from .test_fqa_lot import a_plat
+
+
+class FqaBaseLotTestCase(unittest.TestCase):
+    """Base.evaluer_lot et Base.inv_lot doivent donner les mêmes résultats que Base.__call__ et Base.inv."""
+
+    tb = [
+        fqa.BASE_TEMPS,
+        calendrier.CALENDRIER_GRE,
+        calendrier.CALENDRIER_JUL,
+        calendrier.CALENDRIER_ISL,
+        fqa.Base([fqa.Fqa(12, -7, 5), fqa.Fqa(-30, 11, 26), fqa.Fqa(1, 1, 0)]),
+    ]
+    tn = list(range(-400, 400, 7)) + [0, 1721424, -1721424, 2451545, 618493]
+
+    def verifier(self, base, ns, tn):
+        colonnes = base.inv_lot(ns)
+        self.assertEqual(len(base), len(colonnes))
+        chiffres = [base.inv(n) for n in tn]
+        for i, c_ in enumerate(colonnes):
+            self.assertEqual([v[i] for v in chiffres], a_plat(c_))
+        self.assertEqual(tn, a_plat(base.evaluer_lot(colonnes)))
+        # colonnes les plus significatives ignorées
+        self.assertEqual([base(v[1:]) for v in chiffres], a_plat(base.evaluer_lot(colonnes[1:])))
+        return colonnes
+
+    def verifier_buffers(self):
+        for base in self.tb:
+            for t_ in self.verifier(base, array.array('l', self.tn), self.tn):
+                self.assertIsInstance(t_, array.array)
+            for t_ in self.verifier(base, memoryview(array.array('l', self.tn)), self.tn):
+                self.assertIsInstance(t_, memoryview)
+
+    def test_lot(self):
+        """Traitement par lot (avec NumPy s'il est installé)."""
+        self.verifier_buffers()
+
+    def test_lot_sans_numpy(self):
+        """Traitement par lot sans NumPy."""
+        with mock.patch.object(outils, "numpy", None):
+            self.verifier_buffers()
+
+    @unittest.skipIf(outils.numpy is None, "NumPy n'est pas installé")
+    def test_lot_numpy(self):
+        """Traitement par lot de tableaux NumPy."""
+        for base in self.tb:
+            ns = outils.numpy.array(self.tn[:100]).reshape(4, 25)
+            for t_ in self.verifier(base, ns, self.tn[:100]):
+                self.assertIsInstance(t_, outils.numpy.ndarray)
+                self.assertEqual(ns.shape, t_.shape)
+
+    def test_depassement(self):
+        """Résultats intermédiaires hors des entiers 64 bits : calcul exact en entiers Python."""
+        base = fqa.Base([fqa.Fqa(2 ** 40, 1, 0), fqa.Fqa(1, 1, 0)])
+        tn = [-2 ** 62, -1, 0, 2 ** 40 + 3, 2 ** 62]
+        self.verifier(base, array.array('l', tn), tn)
+        if outils.numpy is not None:
+            ns = outils.numpy.array(tn)
+            self.verifier(base, ns, tn)
+            # 2**40 * 2**30 dépasse les entiers 64 bits
+            colonnes = [outils.numpy.array([2 ** 30, -2 ** 30]), outils.numpy.array([1, 0])]
+            self.assertEqual([2 ** 70 + 1, -2 ** 70], base.evaluer_lot(colonnes).tolist())
+            self.assertEqual([2 ** 30, 2 ** 30 + 2 ** 20], fqa.BASE_TEMPS.inv_lot(
+                outils.numpy.array([2 ** 30 * 86400, (2 ** 30 + 2 ** 20) * 86400]))[0].tolist())
+        with self.assertRaises(OverflowError):
+            base.evaluer_lot([array.array('l', [2 ** 30]), array.array('l', [0])])
+
+
+if __name__ == '__main__':
+    unittest.main()
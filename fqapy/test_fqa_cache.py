@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+from . import fqa
+
+
+class FqaCacheTestCase(unittest.TestCase):
+    """Le cache doit rendre les mêmes résultats que fqa.codes."""
+
+    mois = [31, 30, 31, 30, 31, 31, 30, 31, 30, 31, 31, 28]
+    annees = [365, 365, 365, 366, 365, 365, 365, 366]
+
+    def test_cache(self):
+        """Cache en mémoire (LRU)."""
+        cache = fqa.CacheReconnaissance(taille=2)
+        self.assertEqual(fqa.codes(self.mois, 3), cache.codes(self.mois, 3))
+        self.assertEqual(fqa.codes(self.mois, 3), cache.codes(tuple(self.mois), 3))
+        self.assertEqual((1, 0, 1), (cache.succes, cache.succes_disque, cache.calculs))
+        self.assertEqual(fqa.codes(self.annees, 0, 1721118), cache.codes(self.annees, 0, 1721118))
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.codes([1, 2, 3])
+        self.assertEqual((2, 0, 3), (cache.succes, cache.succes_disque, cache.calculs))
+        self.assertEqual(2, len(cache))
+        # les mois, moins récemment utilisés, ont été évincés
+        cache.codes(self.mois)
+        self.assertEqual((2, 0, 4), (cache.succes, cache.succes_disque, cache.calculs))
+        # un itérateur n'est parcouru qu'une fois
+        self.assertEqual(fqa.codes(self.annees), cache.codes(iter(self.annees)))
+        self.assertEqual(fqa.codes(self.mois, 3), cache.codes((m for m in self.mois), 3))
+        self.assertEqual((3, 0, 5), (cache.succes, cache.succes_disque, cache.calculs))
+        cache.vider()
+        self.assertEqual((0, (0, 0, 0)), (len(cache), (cache.succes, cache.succes_disque, cache.calculs)))
+
+    def test_cache_fichier(self):
+        """Cache persistant (fichier sqlite)."""
+        with tempfile.TemporaryDirectory() as repertoire:
+            fichier = os.path.join(repertoire, "cache.sqlite")
+            with fqa.CacheReconnaissance(fichier=fichier) as cache:
+                cache.codes(self.mois)
+                self.assertRaises(ValueError, cache.codes, [1, 2, 3])
+                self.assertEqual(0, cache.succes_disque)
+            with fqa.CacheReconnaissance(fichier=fichier) as cache:
+                self.assertEqual(fqa.codes(self.mois, 3), cache.codes(self.mois, 3))
+                self.assertRaises(ValueError, cache.codes, [1, 2, 3])
+                self.assertEqual((0, 2, 0), (cache.succes, cache.succes_disque, cache.calculs))
+                self.assertEqual(fqa.codes(self.mois, 3), cache.codes(self.mois, 3))
+                self.assertEqual((1, 2, 0), (cache.succes, cache.succes_disque, cache.calculs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -98,6 +98,14 @@ class FqaCodesTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             fqa.codes([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
 
+    def test_codes_longs(self):
+        """Test de longues suites de codes."""
+        for f0 in [fqa.Fqa(10631, 30, 26), fqa.Fqa(1461, 4, 6884472), fqa.Fqa(2 ** 40 + 1, 2 ** 39 + 3, 5)]:
+            y_ = f0.tabuler(0, 100000)
+            c_ = [y_[i_ + 1] - y_[i_] for i_ in range(len(y_) - 1)]
+            f_ = fqa.codes(c_, 0, y_[0])
+            self.assertEqual(f0.tabuler(0, 100000), f_.tabuler(0, 100000))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+from . import fqa
+
+
+class FqaCodesLotTestCase(unittest.TestCase):
+    """fqa.codes_lot doit donner, dans l'ordre, les mêmes résultats que fqa.codes."""
+
+    tf = [fqa.Fqa(12, 7, 5), fqa.Fqa(30, 11, 26), fqa.Fqa(153, 5, -457), fqa.Fqa(1461, 4, 6884472),
+          fqa.Fqa(-30, 11, 26), fqa.Fqa(1, 1, -1)]
+
+    def lot(self):
+        sequences, x0s, y0s = [], [], []
+        for i in range(300):
+            f_ = self.tf[i % len(self.tf)]
+            x0 = i - 150
+            c_ = [f_(x0 + x + 1) - f_(x0 + x) for x in range(1 + i % 17)]
+            if 0 == i % 7:
+                c_ += [c_[0] + 5, c_[0]]
+            sequences.append(c_)
+            x0s.append(x0)
+            y0s.append(f_(x0))
+        sequences[10] = []
+        return sequences, x0s, y0s
+
+    def verifier(self, resultats, sequences, x0s, y0s):
+        self.assertEqual(len(sequences), len(resultats))
+        for c_, x0, y0, f_ in zip(sequences, x0s, y0s, resultats):
+            try:
+                attendu = fqa.codes(c_, x0, y0) if c_ else None
+            except ValueError:
+                attendu = None
+            if attendu is None:
+                self.assertIsInstance(f_, ValueError)
+            else:
+                self.assertEqual(attendu, f_)
+
+    def test_codes_lot(self):
+        """Traitement dans le processus courant."""
+        sequences, x0s, y0s = self.lot()
+        for taille in [None, 1, 7, 1000]:
+            self.verifier(fqa.codes_lot(sequences, x0s, y0s, taille_morceau=taille), sequences, x0s, y0s)
+        self.assertEqual([fqa.codes(c_) for c_ in sequences[1:7]], fqa.codes_lot(sequences[1:7]))
+
+    def test_codes_lot_processus(self):
+        """Traitement réparti entre plusieurs processus."""
+        sequences, x0s, y0s = self.lot()
+        self.verifier(fqa.codes_lot(sequences, x0s, y0s, workers=2), sequences, x0s, y0s)
+        self.verifier(fqa.codes_lot(sequences, x0s, y0s, workers=3, taille_morceau=16), sequences, x0s, y0s)
+        self.assertEqual([], fqa.codes_lot([], workers=2))
+
+    def test_codes_lot_erreurs(self):
+        """Valeurs initiales manquantes."""
+        with self.assertRaises(ValueError):
+            fqa.codes_lot([[1, 2], [2, 2]], [0])
+
+    def test_codes_lot_plages_vides(self):
+        """Une suite de plages toutes vides est signalée sans interrompre le lot."""
+        f_ = fqa.codes_lot([[(365, 3), (366, 1)], [(365, 0)], [], [(2, 2)]], plages=True)
+        self.assertEqual(fqa.codes([365, 365, 365, 366]), f_[0])
+        self.assertIsInstance(f_[1], ValueError)
+        self.assertIsInstance(f_[2], ValueError)
+        self.assertEqual(fqa.Fqa(2, 1, 0), f_[3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import pickle
+import unittest
+
+from . import calendrier
+from . import fqa
+
+
+class FqaCompilerTestCase(unittest.TestCase):
+    """Les fonctions engendrées par Base.compiler doivent donner les mêmes résultats que Base.__call__ et Base.inv."""
+
+    tb = [
+        fqa.BASE_TEMPS,
+        calendrier.CALENDRIER_GRE,
+        calendrier.CALENDRIER_JUL,
+        calendrier.CALENDRIER_ISL,
+        fqa.Base([fqa.Fqa(12, -7, 5), fqa.Fqa(-30, 11, 26), fqa.Fqa(-1, -1, 0), fqa.Fqa(3, 1, -2)]),
+        fqa.Base([fqa.Fqa(1, 1, 0)]),
+    ]
+    tn = list(range(-400, 400, 7)) + [0, 1721424, -1721424, 2451545, 618493]
+
+    def test_compiler(self):
+        """Fonctions directe et inverse."""
+        for base in self.tb:
+            directe, inverse = base.compiler()
+            for n in self.tn:
+                v_ = base.inv(n)
+                self.assertEqual(v_, inverse(n))
+                self.assertEqual(base(v_), directe(*v_))
+                v_ = [x - 3 for x in v_]
+                self.assertEqual(base(v_), directe(*v_))
+
+    def test_modification(self):
+        """Les fonctions sont engendrées à nouveau après modification de la base."""
+        base = fqa.Base([fqa.Fqa(60, 1, 0), fqa.Fqa(1, 1, 0)])
+        self.assertIs(base.compiler(), base.compiler())
+        self.assertEqual(130, base.compiler()[0](2, 10))
+        base[0] = fqa.Fqa(100, 1, 0)
+        self.assertEqual(210, base.compiler()[0](2, 10))
+        base.append(fqa.Fqa(1, 2, 0))
+        self.assertEqual(2 * 100 + 10 + 2, base.compiler()[0](2, 10, 5))
+        del base[2]
+        self.assertEqual([2, 10], base.compiler()[1](210))
+        copie = pickle.loads(pickle.dumps(base))
+        self.assertEqual(base, copie)
+        self.assertEqual([2, 10], copie.compiler()[1](210))
+
+
+if __name__ == '__main__':
+    unittest.main()
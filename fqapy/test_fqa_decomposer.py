@@ -0,0 +1,42 @@
+import unittest
+
+from . import fqa
+
+
+class FqaDecomposerTestCase(unittest.TestCase):
+    """Décomposition en segments de droite discrète maximaux."""
+
+    mois = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+    def verifier(self, c_, x0, y0, segments):
+        y_ = [y0]
+        for c in c_:
+            y_.append(y_[-1] + c)
+        for debut, fin, f_ in segments:
+            self.assertEqual(y_[debut:fin + 1], [f_(x0 + i) for i in range(debut, fin + 1)])
+
+    def test_glouton(self):
+        """Recouvrement glouton : segments consécutifs et disjoints."""
+        segments = fqa.decomposer(self.mois, 1, 0)
+        self.assertEqual([(0, 1), (1, 2), (2, 12)], [(debut, fin) for debut, fin, _ in segments])
+        self.assertEqual(fqa.codes(self.mois[2:], 3, 59), segments[2][2])
+        self.verifier(self.mois, 1, 0, segments)
+        self.assertEqual([(0, 3, fqa.Fqa(1, 1, -1)), (3, 5, fqa.codes([5, 6], 3, 2))],
+                         fqa.decomposer([1, 1, 1, 5, 6], 0, -1))
+        self.assertEqual([], fqa.decomposer([]))
+
+    def test_tangentielle(self):
+        """Couverture tangentielle : tous les segments maximaux."""
+        c_ = [2, 2, 1, 2, 2, 1, 2, 1, 1, 2, 1, 1, 1, 3, 3]
+        segments = fqa.decomposer(c_, 5, 7, tangentielle=True)
+        self.assertEqual([(0, 8), (4, 12), (5, 13), (13, 15)], [(debut, fin) for debut, fin, _ in segments])
+        self.verifier(c_, 5, 7, segments)
+        for debut, fin, _ in segments:
+            for d_, f_ in [(debut - 1, fin), (debut, fin + 1)]:
+                if 0 <= d_ and f_ <= len(c_):
+                    self.assertIsNotNone(fqa.prefixe_valide(c_[d_:f_])[2])
+        self.verifier(self.mois, 1, 0, fqa.decomposer(self.mois, 1, 0, tangentielle=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+from . import fqa
+
+
+class FqaIncrementaleTestCase(unittest.TestCase):
+    """La reconnaissance incrémentale doit suivre fqa.codes sur chaque préfixe."""
+
+    tf = [
+        (fqa.Fqa(12, 7, 5), 0, 0, 21),
+        (fqa.Fqa(30, 11, 26), 0, 2, 22),
+        (fqa.Fqa(153, 5, -457), 3, 0, 11),
+        (fqa.Fqa(1461, 4, 6884472), 0, 1721118, 8),
+        (fqa.Fqa(146097, 4, 6884480), 0, 0, 8),
+        (fqa.Fqa(-30, 11, 26), 0, 0, 22),
+        (fqa.Fqa(1, 1, -1), 1, 0, 8),
+    ]
+
+    def test_prefixes(self):
+        """Chaque préfixe valide donne la même forme quasi affine que fqa.codes."""
+        for f_, x0, y0, n in self.tf:
+            c_ = [f_(x0 + x + 1) - f_(x0 + x) for x in range(n)]
+            r_ = fqa.ReconnaissanceIncrementale()
+            for i in range(n):
+                self.assertTrue(r_.ajouter(c_[i]), "{} {}".format(f_, c_[:i + 1]))
+                self.assertEqual(fqa.codes(c_[:i + 1], x0, f_(x0)), r_.fqa(x0, f_(x0)))
+            self.assertEqual(n, len(r_))
+            self.assertIsNone(r_.rupture)
+            g_ = r_.fqa(x0, y0)
+            self.assertEqual([f_(x) - f_(x0) for x in range(x0, x0 + n + 1)],
+                             [g_(x) - g_(x0) for x in range(x0, x0 + n + 1)])
+
+    def test_rupture(self):
+        """Indice du premier code incompatible."""
+        tt = [
+            ([2, 2, 1, 2, 2, 1, 2, 1, 1], 8),
+            ([3, 3, 2, 3, 3, 3, 2, 3, 3, 3, 3, 3], 11),
+            ([1, 2, 3], 2),
+            ([5, 5, 4, 5, 5, 5, 4, 5, 4], 8),
+            ([7, 7, 5], 2),
+            ([0, 1, 0, 0, 1, 1], 5),
+        ]
+        for c_, rupture in tt:
+            r_ = fqa.ReconnaissanceIncrementale()
+            resultats = [r_.ajouter(c) for c in c_]
+            self.assertEqual([True] * rupture + [False] * (len(c_) - rupture), resultats, str(c_))
+            self.assertEqual(rupture, r_.rupture)
+            self.assertEqual(rupture, len(r_))
+            self.assertEqual(fqa.codes(c_[:rupture]), r_.fqa())
+
+    def test_retirer(self):
+        """Fenêtre glissante : mêmes caractéristiques qu'une reconnaissance des seuls codes restants."""
+        tc = [
+            [2, 2, 1, 2, 2, 1, 2, 1, 1, 2, 1, 1, 1, 3, 3],
+            [3, 3, 2, 3, 3, 3, 2, 3, 3, 3, 3, 3, 2, 2, 3, 2, 2, 2, 2],
+            [0, 1, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 0, 0],
+            [5, 5, 4, 5, 5, 5, 4, 5, 4, 4, 4, 5, 6, 6, 6, 5],
+        ]
+        for c_ in tc:
+            r_ = fqa.ReconnaissanceIncrementale()
+            debut, fin = 0, 0
+            while fin < len(c_):
+                if r_.ajouter(c_[fin]):
+                    fin += 1
+                else:
+                    self.assertEqual(fin, r_.rupture)
+                    self.assertEqual(c_[debut], r_.retirer())
+                    self.assertIsNone(r_.rupture)
+                    debut += 1
+                self.assertEqual(fin - debut, len(r_))
+                if debut < fin:
+                    self.assertEqual(fqa.codes(c_[debut:fin], debut, 7), r_.fqa(debut, 7), str(c_[debut:fin]))
+            while len(r_):
+                r_.retirer()
+            self.assertEqual(fqa.Fqa(0, 1, 0), r_.fqa())
+        with self.assertRaises(IndexError):
+            r_.retirer()
+
+    def test_prefixe_valide(self):
+        """Plus long préfixe valide."""
+        mois = [31, 30, 31, 30, 31, 31, 30, 31, 30, 31, 31, 28]
+        self.assertEqual((11, fqa.Fqa(153, 5, -457), 11), fqa.prefixe_valide(mois, 3))
+        self.assertEqual((11, fqa.Fqa(153, 5, -457), None), fqa.prefixe_valide(mois[:11], 3))
+        self.assertEqual((4, fqa.codes(mois[:4], 3), 4), fqa.prefixe_valide(mois[:4] + [29] + mois[5:], 3))
+        self.assertEqual((0, fqa.Fqa(0, 1, 5), None), fqa.prefixe_valide([], 2, 5))
+        c_ = [3, 3, 2, 3, 3, 3, 2, 3, 3, 3, 3, 3, 2]
+        n, f_, i = fqa.prefixe_valide(c_, 1, 9)
+        self.assertEqual((11, 11), (n, i))
+        self.assertEqual(fqa.codes(c_[:n], 1, 9), f_)
+        with self.assertRaises(ValueError):
+            fqa.codes(c_)
+
+
+if __name__ == '__main__':
+    unittest.main()
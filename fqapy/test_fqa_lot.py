@@ -0,0 +1,100 @@
+import array
+import unittest
+from unittest import mock
+
+from . import fqa
+from . import outils
+
+
+def a_plat(t):
+    # Liste à plat des entiers d'une colonne
+    if outils.numpy is not None and isinstance(t, outils.numpy.ndarray):
+        return [int(v) for v in t.ravel()]
+    if isinstance(t, memoryview) and 1 < t.ndim:
+        t = t.cast('B').cast(t.format)
+    return list(t)
+
+
+class FqaLotTestCase(unittest.TestCase):
+    """Les traitements par lot doivent donner exactement les mêmes résultats que Fqa.__call__ et Fqa.divfqa."""
+
+    tf = [
+        fqa.Fqa(146097, 4, 6884480),
+        fqa.Fqa(1461, 4, 0),
+        fqa.Fqa(153, 5, -457),
+        fqa.Fqa(1, 1, -1),
+        fqa.Fqa(12, -7, 5),
+        fqa.Fqa(-30, 11, 26),
+        fqa.Fqa(-19, -7, -5),
+    ]
+    tx = list(range(-50, 51)) + [1721424, -1721424, 2451545]
+
+    def verifier(self, f_, xs, tx):
+        ys = f_.evaluer_lot(xs)
+        qs, rs = f_.divfqa_lot(xs)
+        self.assertEqual([f_(x) for x in tx], a_plat(ys))
+        self.assertEqual([f_.divfqa(x)[0] for x in tx], a_plat(qs))
+        self.assertEqual([f_.divfqa(x)[1] for x in tx], a_plat(rs))
+        return ys, qs, rs
+
+    def verifier_buffers(self):
+        for f_ in self.tf:
+            xs = array.array('l', self.tx)
+            for t_ in self.verifier(f_, xs, self.tx):
+                self.assertIsInstance(t_, array.array)
+            xs = memoryview(array.array('l', self.tx))
+            for t_ in self.verifier(f_, xs, self.tx):
+                self.assertIsInstance(t_, memoryview)
+                self.assertEqual(xs.shape, t_.shape)
+            xs = memoryview(array.array('l', self.tx[:100])).cast('B').cast('l', (10, 10))
+            for t_ in self.verifier(f_, xs, self.tx[:100]):
+                self.assertEqual((10, 10), t_.shape)
+            xs = array.array('d', [x + 0.5 for x in range(-10, 10)])
+            self.verifier(f_, xs, [int(x) for x in xs])
+
+    def test_lot(self):
+        """Traitement par lot (avec NumPy s'il est installé)."""
+        self.verifier_buffers()
+
+    def test_lot_sans_numpy(self):
+        """Traitement par lot sans NumPy."""
+        with mock.patch.object(outils, "numpy", None):
+            self.verifier_buffers()
+
+    @unittest.skipIf(outils.numpy is None, "NumPy n'est pas installé")
+    def test_lot_numpy(self):
+        """Traitement par lot de tableaux NumPy."""
+        for f_ in self.tf:
+            xs = outils.numpy.array(self.tx[:100]).reshape(4, 25)
+            for t_ in self.verifier(f_, xs, self.tx[:100]):
+                self.assertIsInstance(t_, outils.numpy.ndarray)
+                self.assertEqual(xs.shape, t_.shape)
+
+    def test_depassement(self):
+        """Résultats intermédiaires hors des entiers 64 bits : calcul exact en entiers Python."""
+        tx = [-2 ** 62, -3, 0, 5, 2 ** 62]
+        for f_ in [fqa.Fqa(146097, 4, 6884480), fqa.Fqa(2 ** 40, 3, 1), fqa.Fqa(1, 2 ** 62, -2 ** 62),
+                   fqa.Fqa(3, 7, 2 ** 70)]:
+            for xs in [array.array('l', tx), memoryview(array.array('l', tx))]:
+                if all(-2 ** 63 <= v < 2 ** 63 for x in tx for v in (f_(x),) + f_.divfqa(x)):
+                    self.verifier(f_, xs, tx)
+                else:
+                    with self.assertRaises(OverflowError):
+                        self.verifier(f_, xs, tx)
+        with self.assertRaises(OverflowError):
+            fqa.Fqa(1, 1, 0).evaluer_lot([2 ** 63])
+
+    @unittest.skipIf(outils.numpy is None, "NumPy n'est pas installé")
+    def test_depassement_numpy(self):
+        """Avec NumPy, un résultat hors des entiers 64 bits donne un tableau d'objets."""
+        tx = [-2 ** 62, -3, 0, 5, 2 ** 62]
+        xs = outils.numpy.array(tx).reshape(5, 1)
+        for f_ in [fqa.Fqa(146097, 4, 6884480), fqa.Fqa(2 ** 40, 3, 1), fqa.Fqa(3, 7, 2 ** 70)]:
+            ys, qs, rs = self.verifier(f_, xs, tx)
+            self.assertEqual(xs.shape, ys.shape)
+        self.assertEqual(outils.numpy.int64, fqa.Fqa(1, 2 ** 62, -2 ** 62).evaluer_lot(xs).dtype)
+        self.assertEqual(object, fqa.Fqa(2 ** 40, 3, 1).evaluer_lot(xs).dtype)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from . import fqa
+
+
+class FqaParcourirTestCase(unittest.TestCase):
+    def test_parcourir(self):
+        """Le parcours incrémental doit donner les mêmes valeurs que Fqa.__call__."""
+        tf = [
+            fqa.Fqa(146097, 4, 6884480),
+            fqa.Fqa(1461, 4, 6884472),
+            fqa.Fqa(153, 5, -457),
+            fqa.Fqa(1, 1, -1),
+            fqa.Fqa(8, 25, 7),
+            fqa.Fqa(12, -7, 5),
+            fqa.Fqa(-30, 11, 26),
+            fqa.Fqa(-19, -7, -5),
+            fqa.Fqa(0, 3, 2),
+        ]
+        for f_ in tf:
+            for x0_, x1_ in [(-100, 100), (1721424, 1721500), (5, 5)]:
+                txy = [(x_, f_(x_)) for x_ in range(x0_, x1_ + 1)]
+                self.assertEqual(txy, list(f_.parcourir(x0_, x1_)))
+                self.assertEqual([y_ for _, y_ in txy], f_.tabuler(x0_, x1_).tolist())
+            # intervalle vide
+            self.assertEqual([], list(f_.parcourir(1, 0)))
+            self.assertEqual(0, len(f_.tabuler(1, 0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import itertools
+import unittest
+
+from . import fqa
+
+
+def plages(c_):
+    # Codage par plages d'une liste de codes
+    return [(v, len(list(g))) for v, g in itertools.groupby(c_)]
+
+
+class FqaPlagesTestCase(unittest.TestCase):
+    """La reconnaissance des codes codés par plages doit donner les mêmes résultats que sur les codes développés."""
+
+    def test_plages(self):
+        """Codes de formes quasi affines, éventuellement altérés."""
+        tf = [fqa.Fqa(12, 7, 5), fqa.Fqa(30, 11, 26), fqa.Fqa(153, 5, -457), fqa.Fqa(1461, 4, 6884472),
+              fqa.Fqa(146097, 4, 6884480), fqa.Fqa(-30, 11, 26), fqa.Fqa(10631, 30, 58442583), fqa.Fqa(1, 1, -1),
+              fqa.Fqa(7, 50, 3), fqa.Fqa(49, 50, 3)]
+        for f_ in tf:
+            for n in [1, 2, 5, 12, 40, 200]:
+                c_ = [f_(x + 1) - f_(x) for x in range(n)]
+                for i in range(-1, n):
+                    t_ = c_[:]
+                    if 0 <= i:
+                        t_[i] -= 1
+                    try:
+                        attendu = fqa.codes(t_, 3, 7)
+                    except ValueError:
+                        with self.assertRaises(ValueError):
+                            fqa.codes(plages(t_), 3, 7, plages=True)
+                    else:
+                        self.assertEqual(attendu, fqa.codes(plages(t_), 3, 7, plages=True), str(t_))
+
+    def test_plages_non_normalisees(self):
+        """Plages vides ou consécutives de même valeur."""
+        c_ = [(365, 2), (365, 1), (366, 0), (366, 1), (365, 3), (366, 1), (365, 2), (2, 0)]
+        self.assertEqual(fqa.codes([365, 365, 365, 366, 365, 365, 365, 366, 365, 365]),
+                         fqa.codes(c_, plages=True))
+        with self.assertRaises(ValueError):
+            fqa.codes([(365, -1)], plages=True)
+        for c_ in [[], [(365, 0)], [(365, 0), (366, 0)]]:
+            with self.assertRaises(ValueError):
+                fqa.codes(c_, plages=True)
+
+    def test_plages_longues(self):
+        """Le coût dépend du nombre de plages et non du nombre de codes."""
+        n = 10 ** 15
+        self.assertEqual((1, 1, 0), fqa.reconnaissance([(1, n)], plages=True))
+        self.assertEqual((n + 1, n, 0), fqa.reconnaissance([(1, n - 1), (2, 1)], plages=True))
+        self.assertEqual((n + 1, n, 0), fqa.reconnaissance([(1, n - 1), (2, 1), (1, n - 1), (2, 1)], plages=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
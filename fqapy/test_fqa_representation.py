@@ -0,0 +1,76 @@
+import unittest
+
+from . import calendrier
+from . import fqa
+
+
+class FqaRepresentationTestCase(unittest.TestCase):
+    """L'arithmétique des représentations doit donner les mêmes chiffres que base.inv(base(...))."""
+
+    tb = [
+        fqa.BASE_TEMPS,
+        calendrier.CALENDRIER_GRE,
+        calendrier.CALENDRIER_JUL,
+        calendrier.CALENDRIER_ISL,
+        fqa.Base([fqa.Fqa(12, 7, 5), fqa.Fqa(30, 11, 26), fqa.Fqa(1, 2, 0)]),
+        fqa.Base([fqa.Fqa(12, -7, 5), fqa.Fqa(1, 1, 0)]),
+        fqa.Base([fqa.Fqa(90, 1, 0), fqa.Fqa(9, 2, 0), fqa.Fqa(1, 1, 0)]),
+    ]
+    tn = [-1721424, -400, -1, 0, 1, 59, 365, 1721424, 2451545, 2451603, 618493]
+
+    def test_ajouter(self):
+        """Ajout à chaque chiffre avec propagation des retenues."""
+        for base in self.tb:
+            for n in self.tn:
+                v_ = base.inv(n)
+                for chiffre in range(-len(base), len(base)):
+                    for k_ in [-400, -13, -1, 1, 2, 12, 31, 366, 1000]:
+                        r_ = fqa.Representation(base, v_)
+                        r_.ajouter(chiffre, k_)
+                        w_ = v_[:]
+                        w_[chiffre] += k_
+                        self.assertEqual(base.inv(base(w_)), r_.liste_entiers.tolist())
+
+    def test_emboitee(self):
+        """Étages emboîtés : la propagation des retenues peut s'arrêter au premier étage qui ne déborde pas."""
+        self.assertEqual((True, [True, True, True, True]), fqa.BASE_TEMPS._emboitee())
+        self.assertEqual((True, [True, True, True]), self.tb[-1]._emboitee())
+        self.assertEqual((True, [True, False, False, False]), calendrier.CALENDRIER_GRE._emboitee())
+        self.assertFalse(self.tb[5]._emboitee()[0])
+
+    def test_operations(self):
+        """Addition et soustraction d'entiers, différence de représentations."""
+        for base in self.tb:
+            for n in self.tn:
+                r_ = fqa.Representation(base, base.inv(n))
+                for k_ in [-1000, -1, 0, 1, 29, 1000]:
+                    self.assertEqual(base.inv(r_() + k_), (r_ + k_).liste_entiers.tolist())
+                    self.assertEqual(base.inv(r_() - k_), (r_ - k_).liste_entiers.tolist())
+                    self.assertEqual(-k_, r_ - (r_ + k_))
+                s_ = fqa.Representation(base, base.inv(n))
+                s_ += 1
+                s_ -= 1
+                self.assertEqual(r_, s_)
+
+    def test_dates(self):
+        """Dates (mois de mars à février) et représentations incomplètes."""
+        base = calendrier.CALENDRIER_GRE
+        # 29 février 2000 (année 1999 commencée en mars) plus un an : 1er mars 2001
+        r_ = fqa.Representation(base, [19, 99, 14, 29])
+        r_.ajouter(1, 1)
+        self.assertEqual([20, 1, 3, 1], r_.liste_entiers.tolist())
+        # 31 janvier plus un mois : 3 mars (2001 n'est pas bissextile)
+        r_ = fqa.Representation(base, [20, 0, 13, 31])
+        r_.ajouter(2, 1)
+        self.assertEqual([20, 1, 3, 3], r_.liste_entiers.tolist())
+        # 28 février 2001 plus un jour : 1er mars 2001 (le mois de février de la forme quasi affine a 30 jours)
+        r_ = fqa.Representation(base, [20, 0, 14, 28])
+        r_ += 1
+        self.assertEqual([20, 1, 3, 1], r_.liste_entiers.tolist())
+        r_ = fqa.Representation(fqa.BASE_TEMPS, [48, 13])
+        r_ += 3600 - 13
+        self.assertEqual([0, 1, 48, 0], r_.liste_entiers.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import array
+import pickle
+import unittest
+from unittest import mock
+
+from . import calendrier
+from . import fqa
+from . import outils
+
+
+class FqaRepresentationArrayTestCase(unittest.TestCase):
+    """Un RepresentationArray doit contenir les mêmes chiffres que les Representation correspondantes."""
+
+    tb = [fqa.BASE_TEMPS, calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_ISL]
+    tn = list(range(2451530, 2451560)) + [-1721424, 0, 618493]
+
+    def verifier(self):
+        for base in self.tb:
+            ra = fqa.RepresentationArray.depuis_nombres(base, self.tn)
+            attendu = [fqa.Representation(base, base.inv(n)) for n in self.tn]
+            self.assertEqual(len(self.tn), len(ra))
+            self.assertEqual(attendu, list(ra))
+            self.assertEqual(attendu[5], ra[5])
+            self.assertEqual(attendu[-1], ra[-1])
+            self.assertEqual(attendu[3:20:4], list(ra[3:20:4]))
+            self.assertEqual(self.tn, ra.nombres().tolist())
+            for j_ in range(len(base)):
+                self.assertEqual([r_.liste_entiers[j_] for r_ in attendu], ra.colonne(j_).tolist())
+            self.assertEqual(ra, fqa.RepresentationArray(base, [ra.colonne(j_) for j_ in range(len(base))]))
+
+    def test_representation_array(self):
+        """Construction, accès, tranches et itération (avec NumPy s'il est installé)."""
+        self.verifier()
+
+    def test_representation_array_sans_numpy(self):
+        """Construction, accès, tranches et itération sans NumPy."""
+        with mock.patch.object(outils, "numpy", None):
+            self.verifier()
+
+    def test_vues(self):
+        """Les vues partagent les chiffres du tableau (sans copie)."""
+        ra = fqa.RepresentationArray(fqa.BASE_TEMPS, [[1, 2, 3], [59, 0, 1]])
+        self.assertEqual([[0, 0, 0], [0, 0, 0], [1, 2, 3], [59, 0, 1]], ra.vue().tolist())
+        ra.colonne(-1)[1] = 7
+        self.assertEqual([0, 0, 2, 7], ra[1].liste_entiers.tolist())
+        self.assertEqual(ra.vue().obj, ra.colonne(0).obj)
+        self.assertEqual(ra, pickle.loads(pickle.dumps(ra)))
+        self.assertEqual(0, len(fqa.RepresentationArray(fqa.BASE_TEMPS, [])))
+        for vide in (fqa.RepresentationArray(fqa.BASE_TEMPS, []), fqa.RepresentationArray(fqa.BASE_TEMPS, [[], []]),
+                     fqa.RepresentationArray.depuis_nombres(calendrier.CALENDRIER_GRE, [])):
+            self.assertEqual(0, vide.vue().nbytes)
+            self.assertEqual(0, len(vide.nombres()))
+        with self.assertRaises(ValueError):
+            fqa.RepresentationArray(fqa.BASE_TEMPS, [[1, 2], [1]])
+        with self.assertRaises(IndexError):
+            ra[3]
+
+    @unittest.skipIf(outils.numpy is None, "NumPy n'est pas installé")
+    def test_numpy(self):
+        """Export vers NumPy sans copie."""
+        ra = fqa.RepresentationArray.depuis_nombres(calendrier.CALENDRIER_GRE, array.array('l', self.tn))
+        t_ = outils.numpy.asarray(ra.vue())
+        self.assertEqual((4, len(self.tn)), t_.shape)
+        t_[3, 0] = 5
+        self.assertEqual(5, ra[0].liste_entiers[3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import copy
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+from . import calendrier
+from . import fqa
+
+
+class FqaSerialiserTestCase(unittest.TestCase):
+    """Sérialisation binaire des formes quasi affines, des bases et des calendriers."""
+
+    tf = [fqa.Fqa(146097, 4, 6884480), fqa.Fqa(12, -7, 5), fqa.Fqa(-30, 11, 26), fqa.Fqa(2 ** 62, -(2 ** 63), 0)]
+
+    def test_fqa(self):
+        """Formes quasi affines et listes de formes quasi affines."""
+        for f_ in self.tf:
+            octets = fqa.serialiser(f_)
+            self.assertEqual(b"FQA\x01F", octets[:5])
+            self.assertEqual(5 + 3 * 8, len(octets))
+            self.assertEqual(f_, fqa.deserialiser(octets))
+        self.assertEqual(self.tf, fqa.deserialiser(fqa.serialiser(self.tf)))
+        self.assertEqual([], fqa.deserialiser(fqa.serialiser([])))
+        self.assertEqual(self.tf, fqa.deserialiser(memoryview(bytearray(fqa.serialiser(self.tf)))))
+
+    def test_base(self):
+        """Bases et calendriers (bases enregistrées)."""
+        base = fqa.Base(self.tf[:3])
+        copie = fqa.deserialiser(fqa.serialiser(base))
+        self.assertEqual(base, copie)
+        self.assertEqual(0, copie.empreinte_tables())
+        base = fqa.Base([fqa.Fqa(60, 1, 0), fqa.Fqa(1, 1, 0)])
+        base.tabuler(100)
+        self.assertEqual(base.empreinte_tables(), fqa.deserialiser(fqa.serialiser(base)).empreinte_tables())
+        for nom, base in [("BASE_TEMPS", fqa.BASE_TEMPS), ("CALENDRIER_GRE", calendrier.CALENDRIER_GRE),
+                          ("CALENDRIER_JUL", calendrier.CALENDRIER_JUL), ("CALENDRIER_ISL", calendrier.CALENDRIER_ISL)]:
+            octets = fqa.serialiser(base)
+            self.assertEqual(b"FQA\x01N" + nom.encode(), octets)
+            self.assertIs(base, fqa.deserialiser(octets))
+            copie = fqa.deserialiser(fqa.serialiser(base, nommee=False))
+            self.assertEqual(base, copie)
+            self.assertEqual(base.inv(2451545), copie.inv(2451545))
+
+    def test_pickle(self):
+        """pickle et copy."""
+        for base in [fqa.BASE_TEMPS, calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_ISL]:
+            self.assertIs(base, pickle.loads(pickle.dumps(base)))
+            self.assertIs(base, copy.deepcopy(base))
+        base = fqa.Base(self.tf[:3])
+        self.assertEqual(base, pickle.loads(pickle.dumps(base)))
+        # calendrier non enregistré : la classe est conservée
+        gre = calendrier._CalendrierGre()
+        gre.tabuler()
+        copie = pickle.loads(pickle.dumps(gre))
+        self.assertIsInstance(copie, calendrier._CalendrierGre)
+        self.assertEqual(gre, copie)
+        self.assertEqual(gre.empreinte_tables(), copie.empreinte_tables())
+        date = calendrier.Date(calendrier.CALENDRIER_GRE, 2000, calendrier.Mois.FEVRIER, 29)
+        self.assertIs(calendrier.CALENDRIER_GRE, pickle.loads(pickle.dumps(date)).calendrier)
+
+    def test_pickle_processus(self):
+        """Un calendrier enregistré est désérialisé dans un processus qui n'a importé que fqapy.fqa."""
+        octets = pickle.dumps([calendrier.CALENDRIER_GRE, fqa.BASE_TEMPS])
+        programme = ("import pickle, sys\n"
+                     "from fqapy import fqa\n"
+                     "gre, temps = pickle.loads(sys.stdin.buffer.read())\n"
+                     "print(gre is fqa.base_enregistree('CALENDRIER_GRE'), temps is fqa.BASE_TEMPS, gre.inv(2451545))\n")
+        resultat = subprocess.run([sys.executable, "-c", programme], input=octets, capture_output=True, check=True,
+                                  cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual("True True {}".format(calendrier.CALENDRIER_GRE.inv(2451545)), resultat.stdout.decode().strip())
+
+    def test_erreurs(self):
+        """Données invalides."""
+        octets = fqa.serialiser(self.tf)
+        base = fqa.serialiser(fqa.Base(self.tf[:3]))
+        mauvais_octets = [
+            b"", b"FQB\x01F", b"FQA\x02F" + octets[5:], b"FQA\x01Z", b"FQA\x01F\x00",
+            # données tronquées
+            octets[:-1], b"FQA\x01L\x01", base[:-1], b"FQA\x01B\x00", base[:5 + 8 + 2],
+            # données en excès
+            octets + b"\x00", base + b"\x00", fqa.serialiser(self.tf[0]) + b"\x00", fqa.serialiser([]) + b"\x00",
+            # nom invalide
+            b"FQA\x01N\xff\xfe",
+        ]
+        for mauvais in mauvais_octets:
+            with self.assertRaises(ValueError):
+                fqa.deserialiser(mauvais)
+        with self.assertRaises(KeyError):
+            fqa.deserialiser(b"FQA\x01NINCONNU")
+        with self.assertRaises(ValueError):
+            fqa.serialiser(fqa.Fqa(2 ** 63, 1, 0))
+        with self.assertRaises(ValueError):
+            fqa.serialiser([fqa.Fqa(1, 1, 0), 3])
+        for objet in [5, None, 2.5]:
+            with self.assertRaises(ValueError):
+                fqa.serialiser(objet)
+
+
+if __name__ == '__main__':
+    unittest.main()
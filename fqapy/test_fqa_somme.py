@@ -0,0 +1,52 @@
+import unittest
+
+from . import fqa
+from . import outils
+
+
+class FqaSommeTestCase(unittest.TestCase):
+    tf = [
+        fqa.Fqa(146097, 4, 6884480),
+        fqa.Fqa(1461, 4, 6884472),
+        fqa.Fqa(153, 5, -457),
+        fqa.Fqa(1, 1, -1),
+        fqa.Fqa(8, 25, 7),
+        fqa.Fqa(12, -7, 5),
+        fqa.Fqa(-30, 11, 26),
+        fqa.Fqa(-19, -7, -5),
+        fqa.Fqa(0, 3, 2),
+        fqa.Fqa(0, -3, 7),
+    ]
+
+    def test_somme_plancher(self):
+        """Test de la somme des parties entières."""
+        for n_ in range(0, 12):
+            for m_ in range(1, 9):
+                for a_ in range(-20, 21, 3):
+                    for b_ in range(-20, 21, 7):
+                        s_ = sum(outils.divent(a_ * i_ + b_, m_)[0] for i_ in range(n_))
+                        self.assertEqual(s_, outils.somme_plancher(n_, m_, a_, b_))
+
+    def test_somme(self):
+        """La somme doit être égale à celle des valeurs de Fqa.__call__."""
+        for f_ in self.tf:
+            for x0_, x1_ in [(-60, 60), (0, 0), (1721424, 1721500), (3, -3)]:
+                self.assertEqual(sum(f_(x_) for x_ in range(x0_, x1_ + 1)), f_.somme(x0_, x1_))
+        # très grands intervalles : somme des entiers de 0 à n
+        n_ = 10 ** 30
+        self.assertEqual(n_ * (n_ + 1) // 2, fqa.Fqa(1, 1, 0).somme(0, n_))
+        # nombre de jours écoulés depuis le début du cycle des années juliennes
+        f_ = fqa.Fqa(1461, 4, 0)
+        self.assertEqual(sum(f_(x_) for x_ in range(4000)), f_.somme(0, 3999))
+
+    def test_points(self):
+        """Le nombre de points sous le segment doit être égal à celui obtenu par énumération."""
+        for f_ in self.tf:
+            for y0_ in [-500, -3, 0, 2, 40]:
+                for x0_, x1_ in [(-60, 60), (0, 0), (3, -3), (-7, 25)]:
+                    n_ = sum(max(0, f_(x_) - y0_ + 1) for x_ in range(x0_, x1_ + 1))
+                    self.assertEqual(n_, f_.points(x0_, x1_, y0_))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import pickle
+import unittest
+
+from . import calendrier
+from . import fqa
+
+
+class FqaTablesTestCase(unittest.TestCase):
+    """Une base tabulée doit donner exactement les mêmes résultats que les formes quasi affines."""
+
+    tb = [
+        fqa.BASE_TEMPS,
+        calendrier.CALENDRIER_GRE,
+        calendrier.CALENDRIER_JUL,
+        calendrier.CALENDRIER_ISL,
+        fqa.Base([fqa.Fqa(12, 7, 5), fqa.Fqa(-30, 11, 26), fqa.Fqa(3, 1, -2)]),
+        fqa.Base([fqa.Fqa(7, 1, 0), fqa.Fqa(1, 1, 0)]),
+    ]
+    tn = list(range(-3000, 3000, 7)) + [0, 1721424, -1721424, 2451545, 618493]
+
+    @staticmethod
+    def evaluer(base, v_):
+        # Évaluation par les seules formes quasi affines (chiffres les plus significatifs omis remplacés par 0).
+        return sum(f_(x) for f_, x in zip(base.t, [0] * (len(base.t) - len(v_)) + v_))
+
+    @staticmethod
+    def decomposer(base, n):
+        # Décomposition par les seules formes quasi affines (divisions successives).
+        v_ = []
+        for f_ in base.t:
+            x, n = f_.divfqa(n)
+            v_.append(x)
+        return v_
+
+    def test_tables(self):
+        """Base.__call__ et Base.inv avec tables comparées aux seules formes quasi affines."""
+        for base in self.tb:
+            tabulee = fqa.Base(list(base))
+            self.assertEqual(0, tabulee.empreinte_tables())
+            self.assertLess(0, tabulee.tabuler(100000))
+            for n in self.tn:
+                v_ = self.decomposer(base, n)
+                self.assertEqual(v_, tabulee.inv(n))
+                self.assertEqual(self.evaluer(base, v_), tabulee(v_))
+                for d_ in [-40, -1, 1, 40]:
+                    w_ = [x + d_ for x in v_]
+                    self.assertEqual(self.evaluer(base, w_), tabulee(w_))
+                    self.assertEqual(self.evaluer(base, w_[1:]), tabulee(w_[1:]))
+
+    def test_calendriers(self):
+        """Les calendriers ne sont tabulés qu'à la demande."""
+        for base in [calendrier.CALENDRIER_GRE, calendrier.CALENDRIER_JUL, calendrier.CALENDRIER_ISL]:
+            self.assertEqual(0, base.empreinte_tables())
+            tabule = type(base)()
+            self.assertLess(0, tabule.tabuler())
+            self.assertGreaterEqual(4096 * 8, tabule.empreinte_tables())
+            for n in self.tn:
+                self.assertEqual(self.decomposer(base, n), tabule.inv(n))
+                self.assertEqual(tabule.date(calendrier.JourJulien(n)), base.date(calendrier.JourJulien(n)))
+
+    def test_seuil(self):
+        """Tables absentes ou supprimées."""
+        base = fqa.Base([fqa.Fqa(-7, 1, 0), fqa.Fqa(1, 1, 0)])
+        self.assertEqual(0, base.tabuler())
+        self.assertEqual(0, fqa.Base([fqa.Fqa(146097, 4, 0), fqa.Fqa(1, 1, 0)]).tabuler(1000))
+        base = fqa.Base([fqa.Fqa(7, 1, 0), fqa.Fqa(1, 1, 0)])
+        self.assertEqual(7 * 8 + 7 * 8, base.tabuler())
+        self.assertEqual(0, base.tabuler(None))
+
+    def test_modification(self):
+        """Les tables sont reconstruites après modification de la base."""
+        base = fqa.Base([fqa.Fqa(60, 1, 0), fqa.Fqa(1, 1, 0)])
+        base.tabuler()
+        self.assertEqual([2, 10], base.inv(130))
+        base[0] = fqa.Fqa(100, 1, 0)
+        self.assertEqual([1, 30], base.inv(130))
+        self.assertEqual(100 * 8 + 100 * 8, base.empreinte_tables())
+        base.append(fqa.Fqa(1, 2, 0))
+        self.assertEqual([1, 30, 1], base.inv(130))
+        copie = pickle.loads(pickle.dumps(base))
+        self.assertEqual(base.empreinte_tables(), copie.empreinte_tables())
+        self.assertEqual([1, 30, 1], copie.inv(130))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from . import fqa
@@ -39,6 +40,17 @@ class FqaValeurTestCase(unittest.TestCase):
             self.assertEqual(v_.i, i_)
             self.assertEqual(0, r_)
 
+    def test_fqa_immuable(self):
+        """Les formes quasi affines sont immuables et utilisables comme clefs."""
+        f_ = fqa.Fqa(153, 5, -457)
+        with self.assertRaises(AttributeError):
+            f_.a = 1
+        with self.assertRaises(AttributeError):
+            f_.c = 1
+        self.assertEqual({f_: 1}[fqa.Fqa(153, 5, -457)], 1)
+        self.assertEqual(1, len({f_, fqa.Fqa(153, 5, -457)}))
+        self.assertEqual(f_, pickle.loads(pickle.dumps(f_)))
+
 
 if __name__ == '__main__':
     unittest.main()
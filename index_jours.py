@@ -0,0 +1,22 @@
+# Index des jours
+"""Écriture du fichier d'index des jours lu par fqapy.calendrier.IndexJours.
+Usage : python3 index_jours.py fichier [--annees 20000] [--centre 2000]
+"""
+
+import argparse
+
+import fqapy.calendrier as calendrier
+
+
+if "__main__" == __name__:
+    parseur = argparse.ArgumentParser(description="Écriture de l'index des jours (grégorien, julien, musulman).")
+    parseur.add_argument("fichier", help="chemin du fichier d'index")
+    parseur.add_argument("--annees", type=int, default=20000,
+                         help="nombre d'années grégoriennes avant et après l'année centrale (20000 par défaut)")
+    parseur.add_argument("--centre", type=int, default=2000, help="année grégorienne centrale (2000 par défaut)")
+    arguments = parseur.parse_args()
+    gre = calendrier.CALENDRIER_GRE
+    debut = calendrier.Date(gre, arguments.centre - arguments.annees, 1, 1)().n
+    fin = calendrier.Date(gre, arguments.centre + arguments.annees + 1, 1, 1)().n
+    taille = calendrier.ecrire_index(arguments.fichier, debut, fin)
+    print("{} : jours {} à {} ({} octets)".format(arguments.fichier, debut, fin - 1, taille))